@@ -38,14 +38,33 @@
 #define FRAME_TYPE_MEM_WRITE_WORD  0x37
 #define FRAME_TYPE_MEM_WRITE_BYTE  0x38
 #define FRAME_TYPE_MEM_WRITE_EXT   0x39
+#define FRAME_TYPE_MEM_WRITE_FEC   0x3A
+#define FRAME_TYPE_MEM_PARITY      0x3B
+#define FRAME_TYPE_REG_BATCH       0x3C
 #define FRAME_TYPE_MEM_READ_WORD   0x40
 #define FRAME_TYPE_MEM_READ_EXT    0x41
+#define FRAME_TYPE_MEM_READ_GROUP  0x42
+#define FRAME_TYPE_REG_ACCESS      0x44
+#define FRAME_TYPE_MEM_CRC         0x46
+#define FRAME_TYPE_MEM_FILL        0x58
 #define FRAME_TYPE_CMD_PLAY        0x50
 #define FRAME_TYPE_CMD_RECORD      0x52
 #define FRAME_TYPE_CMD_VOLUME      0x54
+#define FRAME_TYPE_CMD_CODEC       0x56
+#define FRAME_TYPE_CMD_PLAY_CLIP   0x5A
+#define FRAME_TYPE_CMD_GET_LENGTH  0x5C
 
 #define FRAME_TYPE_ACK             0x34
 #define FRAME_TYPE_ACK_EXT         0x35
+#define FRAME_TYPE_ACK_PARITY      0x36
+
+// frames that carry 128 bytes of data
+#define IS_EXT_FRAME(t) (((t) == FRAME_TYPE_MEM_WRITE_EXT) || ((t) == FRAME_TYPE_MEM_WRITE_FEC) || \
+                         ((t) == FRAME_TYPE_MEM_PARITY) || ((t) == FRAME_TYPE_REG_BATCH))
+
+// Si3000 register access: bit 7 of the register number means write
+#define REG_WRITE        0x80
+#define REG_BATCH_MAX    42
 
 
 
@@ -83,6 +102,15 @@ void clear_input_data ()
 #define READ_WRITE_BUFFER_SIZE (128 + 16)
 uint8_t read_write_buffer[READ_WRITE_BUFFER_SIZE];
 
+//----------------------------------------------------------------------------
+// output volume, set by the volume frame and by the +/- keys
+//----------------------------------------------------------------------------
+
+#define VOLUME_MAX 32
+
+// default output volume
+uint8_t volume = 28;
+
 //----------------------------------------------------------------------------
 // send_reply_back()
 //
@@ -127,11 +155,121 @@ void send_reply_back (uint16_t m, uint32_t n)
 
 } // End of send_reply_back()
 
+//----------------------------------------------------------------------------
+// send_ext_reply()
+//
+// Parameters:
+//    frame_type : FRAME_TYPE_ACK_EXT or FRAME_TYPE_ACK_PARITY
+//
+// Remarks:
+//    function to send the 128 bytes at read_write_buffer [4] as the payload
+//    to reply
+//----------------------------------------------------------------------------
+
+void send_ext_reply (uint8_t frame_type)
+{
+  uint8_t t;
+  uint16_t crc16;
+
+  read_write_buffer [0] = FRAME_SYNC_2;
+  read_write_buffer [1] = FRAME_SYNC_1;
+  read_write_buffer [2] = FRAME_SYNC_0;
+
+  read_write_buffer [3] = frame_type;
+
+  crc16 = MISC.CRC16 (read_write_buffer, 4 + 128);
+
+  Serial.write(read_write_buffer, 4 + 128);
+
+  t = (uint8_t)((crc16 & 0xFF00) >> 8);
+  Serial.write(&t, 1);
+
+  t = (uint8_t)(crc16 & 0xFF);
+  Serial.write(&t, 1);
+
+} // End of send_ext_reply()
+
+//----------------------------------------------------------------------------
+// crc16_update()
+//
+// Parameters:
+//    crc : CRC so far, 0xFFFF to start
+//    c   : next byte
+//
+// Remarks:
+//    the CRC16 CCITT of MISC.CRC16(), one byte at a time, for data that is
+//    not in a buffer (the SRAM)
+//----------------------------------------------------------------------------
+
+uint16_t crc16_update (uint16_t crc, uint8_t c)
+{
+  uint8_t i;
+
+  crc ^= (uint16_t)c << 8;
+
+  for (i = 0; i < 8; ++i) {
+    if (crc & 0x8000) {
+      crc = (crc << 1) ^ 0x1021;
+    } else {
+      crc = crc << 1;
+    }
+  } // End of for loop
+
+  return crc;
+
+} // End of crc16_update()
+
 
 uint32_t mem_addr = 0;
 uint32_t play_addr = 0;
 uint32_t record_addr = 0;
 
+//----------------------------------------------------------------------------
+// sample format in SRAM, set by FRAME_TYPE_CMD_CODEC
+//----------------------------------------------------------------------------
+
+#define CODEC_LINEAR     0
+#define CODEC_MULAW      1
+#define CODEC_IMA_ADPCM  2
+
+// flag to use Mu Law compression (or IMA ADPCM, see above)
+uint8_t compressedFlag = 0;
+
+// sample format of what is being played
+uint8_t play_codec = 0;
+
+//----------------------------------------------------------------------------
+// clip library, a TOC at the start of the SRAM (see extras/M10Library.py)
+//----------------------------------------------------------------------------
+
+#define TOC_VERSION          1
+#define TOC_CLIP_TABLE       8
+#define TOC_CLIP_ENTRY_SIZE  12
+#define TOC_EXTENT_TABLE     200
+#define TOC_EXTENT_REPEAT    0x8000
+
+uint8_t  clip_playing = 0;
+uint8_t  clip_index;
+uint16_t clip_extent;
+uint32_t clip_left;
+uint32_t extent_end;
+uint16_t extent_repeat;
+
+//----------------------------------------------------------------------------
+// forward error correction (see extras/M10Client.py): a group of up to 32
+// blocks is followed by a parity frame, the XOR of all the blocks. The top
+// byte of the address is the index of the block in the group, or the
+// number of blocks for the parity frame. fec_received has a bit for each
+// block of the group at fec_base that is in the SRAM
+//----------------------------------------------------------------------------
+
+#define FEC_NO_GROUP 0xFFFFFFFF
+
+uint32_t fec_base = FEC_NO_GROUP;
+uint32_t fec_received = 0;
+uint8_t  fec_parity[128];
+
+
 enum Input_FSM_State {
   INPUT_STATE_IDLE,
   INPUT_STATE_SYNC_1,
@@ -160,10 +298,14 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
     uint8_t loop_continue;
     uint16_t crc_received;
     uint32_t start_addr;
+    uint32_t fill_addr, fill_length;
+    uint32_t fec_missing;
+    uint8_t fec_group, fec_repair, j;
+    uint16_t reg_value;
+    uint16_t mem_crc;
     uint8_t data_high;
     uint8_t data_low;
     uint8_t i, t;
-    uint8_t* buf;
     uint16_t crc16;
     uint8_t ret = 0;
     
@@ -217,7 +359,7 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
             if (input_counter == FRAME_LENGTH) {
 
               
-              if (frame_type  == FRAME_TYPE_MEM_WRITE_EXT) {
+              if (IS_EXT_FRAME(frame_type)) {
                 state = INPUT_STATE_INPUT_WAIT_EXT;
               } else {
                 
@@ -231,7 +373,7 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
           case INPUT_STATE_INPUT_WAIT_EXT:
             input_data [input_counter++] = input;
   
-            if   ((input_counter == (EXT_FRAME_LENGTH - 2)) && (frame_type == FRAME_TYPE_MEM_WRITE_EXT)) {
+            if   ((input_counter == (EXT_FRAME_LENGTH - 2)) && IS_EXT_FRAME(frame_type)) {
                 state = INPUT_STATE_FRAME_TYPE;
                 loop_continue = 1;
             }
@@ -240,7 +382,7 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
   
           case INPUT_STATE_FRAME_TYPE:
   
-            if (frame_type == FRAME_TYPE_MEM_WRITE_EXT) {
+            if (IS_EXT_FRAME(frame_type)) {
               crc16 = MISC.CRC16(input_data, EXT_FRAME_LENGTH - 4);
               crc_received = (input_data [EXT_FRAME_LENGTH - 4] << 8) + input_data [EXT_FRAME_LENGTH - 3];
             } else {
@@ -257,8 +399,15 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
             data_low   = input_data [SYNC_LENGTH + 6];
 
             if ((frame_type  == FRAME_TYPE_CMD_VOLUME) && (crc_received == crc16)) {
-                CODEC.outputVolume (data_low);
+                volume = (data_low > VOLUME_MAX) ? VOLUME_MAX : data_low;
+                CODEC.outputVolume (volume);
+                send_reply_back (0xbeef, start_addr);
+            } else if ((frame_type  == FRAME_TYPE_CMD_CODEC) && (crc_received == crc16)) {
+                compressedFlag = data_low;
                 send_reply_back (0xbeef, start_addr);
+            } else if ((frame_type  == FRAME_TYPE_CMD_GET_LENGTH) && (crc_received == crc16)) {
+                // bytes recorded, or the start of the last EXT write
+                send_reply_back (0xbeef, mem_addr);
             } else if ((frame_type  == FRAME_TYPE_MEM_WRITE_BYTE) && (crc_received == crc16))  {
                 SRAM.write(start_addr, data_low);
                 
@@ -284,29 +433,158 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
                 send_reply_back (0xabcd, start_addr);
                 mem_addr = start_addr;
                 
+            } else if ((frame_type  == FRAME_TYPE_MEM_FILL) && (crc_received == crc16))  {
+                // data_high blocks of 128 bytes, all set to data_low
+                fill_length = (uint32_t)data_high * (EXT_FRAME_LENGTH - FRAME_LENGTH);
+                for (fill_addr = start_addr; fill_addr < (start_addr + fill_length); ++fill_addr) {
+                    SRAM.write(fill_addr, data_low);
+                } // End of for loop
+
+                send_reply_back (0xabcd, start_addr);
+
+                if (data_high) {
+                    mem_addr = start_addr + (uint32_t)(data_high - 1) * (EXT_FRAME_LENGTH - FRAME_LENGTH);
+                }
+                
+            } else if ((frame_type  == FRAME_TYPE_MEM_WRITE_FEC) && (crc_received == crc16))  {
+                // block j of a group, not acknowledged until the parity frame
+                j = input_data [SYNC_LENGTH + 1];
+                start_addr = start_addr & 0x00FFFFFF;
+
+                if (fec_base != start_addr - (uint32_t)j * 128) {
+                    fec_base = start_addr - (uint32_t)j * 128;
+                    fec_received = 0;
+                }
+
+                for (i = 0; i < (EXT_FRAME_LENGTH - FRAME_LENGTH); ++i) {
+                    SRAM.write(start_addr + i, input_data [SYNC_LENGTH + 5 + i]);
+                } // End of for loop
+
+                fec_received |= (uint32_t)1 << j;
+                
+            } else if ((frame_type  == FRAME_TYPE_MEM_PARITY) && (crc_received == crc16))  {
+                fec_group = input_data [SYNC_LENGTH + 1];
+                start_addr = start_addr & 0x00FFFFFF;
+
+                if (fec_base != start_addr) {
+                    fec_base = start_addr;
+                    fec_received = 0;
+                }
+
+                fec_missing = 0;
+                fec_repair = 0xFF;
+                for (j = 0; j < fec_group; ++j) {
+                    if (!(fec_received & ((uint32_t)1 << j))) {
+                        fec_missing |= (uint32_t)1 << j;
+                        fec_repair = (fec_repair == 0xFF) ? j : 0xFE;
+                    }
+                } // End of for loop
+
+                if (fec_repair == 0xFE) {
+                    // more than one block lost, the host sends them again
+                    send_reply_back (0x0bad, fec_missing);
+                } else {
+                    if (fec_repair != 0xFF) {
+                        // the lost block is the parity XOR all the others
+                        for (j = 0; j < fec_group; ++j) {
+                            if (j != fec_repair) {
+                                for (i = 0; i < 128; ++i) {
+                                    input_data [SYNC_LENGTH + 5 + i] ^= SRAM.read(start_addr + (uint32_t)j * 128 + i);
+                                } // End of for loop
+                            }
+                        } // End of for loop
+
+                        for (i = 0; i < 128; ++i) {
+                            SRAM.write(start_addr + (uint32_t)fec_repair * 128 + i, input_data [SYNC_LENGTH + 5 + i]);
+                        } // End of for loop
+                    }
+
+                    send_reply_back (0xabcd, fec_missing);
+
+                    mem_addr = start_addr + (uint32_t)(fec_group - 1) * 128;
+                    fec_base = FEC_NO_GROUP;
+                    fec_received = 0;
+                }
+                
+            } else if ((frame_type  == FRAME_TYPE_MEM_CRC) && (crc_received == crc16))  {
+                // CRC16 CCITT of (data_high, data_low) blocks of 128 bytes
+                // from start_addr, so the host can check a transfer
+                fill_length = ((uint32_t)data_high * 256 + data_low) * (EXT_FRAME_LENGTH - FRAME_LENGTH);
+                mem_crc = 0xFFFF;
+                for (fill_addr = start_addr; fill_addr < (start_addr + fill_length); ++fill_addr) {
+                    mem_crc = crc16_update (mem_crc, SRAM.read(fill_addr));
+                } // End of for loop
+
+                send_reply_back (mem_crc, start_addr);
+                
+            } else if ((frame_type  == FRAME_TYPE_REG_ACCESS) && (crc_received == crc16))  {
+                // one Si3000 register, start_addr is the register number
+                if (start_addr & REG_WRITE) {
+                    CODEC.regWrite (start_addr & 0x1F, data_low);
+                    send_reply_back (data_low, start_addr);
+                } else {
+                    send_reply_back (CODEC.regRead (start_addr & 0x1F), start_addr);
+                }
+                
+            } else if ((frame_type  == FRAME_TYPE_REG_BATCH) && (crc_received == crc16))  {
+                // start_addr register operations of 3 bytes each (register
+                // number, value high, value low), done in order. The reply
+                // has the value read or written by each, 2 bytes each
+                for (i = 0; i < 128; ++i) {
+                  read_write_buffer [4 + i] = 0;
+                } // End of for loop
+
+                for (j = 0; (j < start_addr) && (j < REG_BATCH_MAX); ++j) {
+                    t = input_data [SYNC_LENGTH + 5 + j * 3];
+                    data_high = input_data [SYNC_LENGTH + 6 + j * 3];
+                    data_low = input_data [SYNC_LENGTH + 7 + j * 3];
+
+                    if (t & REG_WRITE) {
+                        CODEC.regWrite (t & 0x1F, data_low);
+                    } else {
+                        reg_value = CODEC.regRead (t & 0x1F);
+                        data_high = (reg_value >> 8) & 0xFF;
+                        data_low = reg_value & 0xFF;
+                    }
+
+                    read_write_buffer [4 + j * 2] = data_high;
+                    read_write_buffer [5 + j * 2] = data_low;
+                } // End of for loop
+
+                send_ext_reply (FRAME_TYPE_ACK_EXT);
+                
             } else if ((frame_type  == FRAME_TYPE_MEM_READ_EXT) && (crc_received == crc16))  {
                                    
-                buf = read_write_buffer;
-
-                *buf++ = FRAME_SYNC_2;
-                *buf++ = FRAME_SYNC_1;
-                *buf++ = FRAME_SYNC_0;
+                for (i = 0; i < 128; ++i) {
+                  read_write_buffer [4 + i] = SRAM.read(start_addr++);
+                } // End of for loop
 
-                *buf++ = FRAME_TYPE_ACK_EXT;
+                send_ext_reply (FRAME_TYPE_ACK_EXT);
+                    
+            } else if ((frame_type  == FRAME_TYPE_MEM_READ_GROUP) && (crc_received == crc16))  {
+                // the blocks of a group, then their XOR as a parity frame
+                fec_group = input_data [SYNC_LENGTH + 1];
+                start_addr = start_addr & 0x00FFFFFF;
 
                 for (i = 0; i < 128; ++i) {
-                  *buf++ = SRAM.read(start_addr++);
+                  fec_parity [i] = 0;
                 } // End of for loop
 
-                crc16 = MISC.CRC16 (read_write_buffer, 4 + 128);
-  
-                Serial.write(read_write_buffer, 4 + 128);
-    
-                t = (uint8_t)((crc16 & 0xFF00) >> 8);
-                Serial.write(&t, 1);
+                for (j = 0; j < fec_group; ++j) {
+                    for (i = 0; i < 128; ++i) {
+                      t = SRAM.read(start_addr++);
+                      read_write_buffer [4 + i] = t;
+                      fec_parity [i] ^= t;
+                    } // End of for loop
 
-                t = (uint8_t)(crc16 & 0xFF);
-                Serial.write(&t, 1);
+                    send_ext_reply (FRAME_TYPE_ACK_EXT);
+                } // End of for loop
+
+                for (i = 0; i < 128; ++i) {
+                  read_write_buffer [4 + i] = fec_parity [i];
+                } // End of for loop
+
+                send_ext_reply (FRAME_TYPE_ACK_PARITY);
                     
             } else if ((frame_type  == FRAME_TYPE_CMD_PLAY) && (crc_received == crc16))  {
                 send_reply_back (0xabcd, start_addr);
@@ -316,6 +594,15 @@ uint8_t input_FSM(uint8_t input, uint8_t reset)
                 send_reply_back (0xabcd, start_addr);
 
                 ret = FRAME_TYPE_CMD_RECORD;
+            } else if ((frame_type  == FRAME_TYPE_CMD_PLAY_CLIP) && (crc_received == crc16))  {
+                if (clip_valid (data_low)) {
+                    clip_index = data_low;
+                    send_reply_back (0xabcd, start_addr);
+
+                    ret = FRAME_TYPE_CMD_PLAY_CLIP;
+                } else {
+                    send_reply_back (0xdead, start_addr);
+                }
             }
             
             state = INPUT_STATE_IDLE;
@@ -350,6 +637,216 @@ uint8_t ascii_to_digital (uint8_t ascii)
 } // End of ascii_to_digital()
 
 
+//----------------------------------------------------------------------------
+// IMA ADPCM decoder, 4 bit per sample, low nibble first
+//----------------------------------------------------------------------------
+
+const int8_t ima_index_table[16] = {
+  -1, -1, -1, -1, 2, 4, 6, 8,
+  -1, -1, -1, -1, 2, 4, 6, 8
+};
+
+const uint16_t ima_step_table[89] = {
+  7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37,
+  41, 45, 50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173,
+  190, 209, 230, 253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658,
+  724, 796, 876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+  2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358, 5894,
+  6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899, 15289,
+  16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767
+};
+
+int32_t adpcm_predictor;
+int8_t  adpcm_index;
+uint8_t adpcm_byte;
+uint8_t adpcm_phase;
+
+//----------------------------------------------------------------------------
+// ima_adpcm_reset()
+//
+// Parameters:
+//    None
+//
+// Remarks:
+//    function to reset the decoder state, at the start of the SRAM
+//----------------------------------------------------------------------------
+
+void ima_adpcm_reset ()
+{
+  adpcm_predictor = 0;
+  adpcm_index = 0;
+  adpcm_phase = 0;
+} // End of ima_adpcm_reset()
+
+//----------------------------------------------------------------------------
+// ima_adpcm_decode()
+//
+// Parameters:
+//    nibble : 4 bit code
+//
+// Remarks:
+//    function to decode one IMA ADPCM code into a 16 bit sample
+//----------------------------------------------------------------------------
+
+int16_t ima_adpcm_decode (uint8_t nibble)
+{
+  uint16_t step = ima_step_table[adpcm_index];
+  int32_t diff = step >> 3;
+
+  if (nibble & 4) {
+    diff += step;
+  }
+
+  if (nibble & 2) {
+    diff += step >> 1;
+  }
+
+  if (nibble & 1) {
+    diff += step >> 2;
+  }
+
+  if (nibble & 8) {
+    adpcm_predictor -= diff;
+  } else {
+    adpcm_predictor += diff;
+  }
+
+  if (adpcm_predictor > 32767) {
+    adpcm_predictor = 32767;
+  } else if (adpcm_predictor < -32768) {
+    adpcm_predictor = -32768;
+  }
+
+  adpcm_index += ima_index_table[nibble];
+
+  if (adpcm_index < 0) {
+    adpcm_index = 0;
+  } else if (adpcm_index > 88) {
+    adpcm_index = 88;
+  }
+
+  return (int16_t)adpcm_predictor;
+
+} // End of ima_adpcm_decode()
+
+//----------------------------------------------------------------------------
+// sram_read16() / sram_read32()
+//
+// Parameters:
+//    addr : SRAM address
+//
+// Remarks:
+//    functions to read little endian words from the SRAM
+//----------------------------------------------------------------------------
+
+uint16_t sram_read16 (uint32_t addr)
+{
+  return (uint16_t)SRAM.read (addr) + ((uint16_t)SRAM.read (addr + 1) << 8);
+} // End of sram_read16()
+
+uint32_t sram_read32 (uint32_t addr)
+{
+  return (uint32_t)sram_read16 (addr) + ((uint32_t)sram_read16 (addr + 2) << 16);
+} // End of sram_read32()
+
+//----------------------------------------------------------------------------
+// clip_valid()
+//
+// Parameters:
+//    index : clip index
+//
+// Remarks:
+//    function to check that the SRAM holds a clip library with that clip
+//----------------------------------------------------------------------------
+
+uint8_t clip_valid (uint8_t index)
+{
+  if ((SRAM.read (0) != 'M') || (SRAM.read (1) != '1') ||
+      (SRAM.read (2) != '0') || (SRAM.read (3) != 'L')) {
+    return 0;
+  }
+
+  return ((SRAM.read (4) == TOC_VERSION) && (index < SRAM.read (5)));
+} // End of clip_valid()
+
+//----------------------------------------------------------------------------
+// clip_load_extent()
+//
+// Parameters:
+//    extent : index into the extent table
+//
+// Remarks:
+//    function to point play_addr at the first block of an extent
+//----------------------------------------------------------------------------
+
+void clip_load_extent (uint16_t extent)
+{
+  uint16_t block = sram_read16 (TOC_EXTENT_TABLE + (uint32_t)extent * 4);
+  uint16_t count = sram_read16 (TOC_EXTENT_TABLE + (uint32_t)extent * 4 + 2);
+
+  play_addr = (uint32_t)block * 128;
+
+  if (count & TOC_EXTENT_REPEAT) {
+    extent_repeat = count & ~TOC_EXTENT_REPEAT;
+    extent_end = play_addr + 128;
+  } else {
+    extent_repeat = 1;
+    extent_end = play_addr + (uint32_t)count * 128;
+  }
+} // End of clip_load_extent()
+
+//----------------------------------------------------------------------------
+// clip_start()
+//
+// Parameters:
+//    index : clip index
+//
+// Remarks:
+//    function to start playing a clip from its TOC entry
+//----------------------------------------------------------------------------
+
+void clip_start (uint8_t index)
+{
+  uint32_t entry = TOC_CLIP_TABLE + (uint32_t)index * TOC_CLIP_ENTRY_SIZE;
+
+  clip_extent = sram_read16 (entry);
+  clip_left = sram_read32 (entry + 4);
+  play_codec = SRAM.read (entry + 8);
+
+  ima_adpcm_reset();
+  clip_load_extent (clip_extent);
+} // End of clip_start()
+
+//----------------------------------------------------------------------------
+// clip_advance()
+//
+// Parameters:
+//    num_of_bytes : bytes of the clip used up by the last sample
+//
+// Remarks:
+//    function to move on to the next block / extent, and to loop back to
+//    the start of the clip at its end
+//----------------------------------------------------------------------------
+
+void clip_advance (uint8_t num_of_bytes)
+{
+  if (clip_left <= num_of_bytes) {
+    clip_start (clip_index);
+  } else {
+    clip_left -= num_of_bytes;
+
+    if (play_addr >= extent_end) {
+      if (extent_repeat > 1) {
+        --extent_repeat;
+        play_addr -= 128;
+      } else {
+        clip_load_extent (++clip_extent);
+      }
+    }
+  }
+} // End of clip_advance()
+
+
 enum FSM_State {
     STATE_IDLE,
 
@@ -360,13 +857,6 @@ enum FSM_State {
     STATE_RECORD
 };
 
-// flag to use Mu Law compression
-uint8_t compressedFlag = 0;
-
-// default output volume
-uint8_t volume = 28;
-
-
 //----------------------------------------------------------------------------
 // FSM()
 //
@@ -403,9 +893,20 @@ void FSM()
 
                 if (ret == FRAME_TYPE_CMD_PLAY) {
                   play_addr = 0;
+                  play_codec = compressedFlag;
+                  clip_playing = 0;
+                  ima_adpcm_reset();
+                  state = STATE_PLAY;
+                } else if (ret == FRAME_TYPE_CMD_PLAY_CLIP) {
+                  clip_start (clip_index);
+                  clip_playing = 1;
                   state = STATE_PLAY;
                 } else if (ret == FRAME_TYPE_CMD_RECORD) {
                   record_addr = 0;
+                  if (compressedFlag == CODEC_IMA_ADPCM) {
+                    // recording is done in Mu Law
+                    compressedFlag = CODEC_MULAW;
+                  }
                   state = STATE_RECORD;
                 }
             } 
@@ -414,17 +915,36 @@ void FSM()
 
         case STATE_PLAY:
 
-            if (!compressedFlag) {
+            if (play_codec == CODEC_IMA_ADPCM) {
+                if (!adpcm_phase) {
+                    adpcm_byte = SRAM.read (play_addr++);
+                    data = ima_adpcm_decode (adpcm_byte & 0xF);
+                    adpcm_phase = 1;
+                } else {
+                    data = ima_adpcm_decode (adpcm_byte >> 4);
+                    adpcm_phase = 0;
+                    if (clip_playing) {
+                      clip_advance (1);
+                    }
+                }
+            } else if (!play_codec) {
                 low =  SRAM.read (play_addr++);
                 high = SRAM.read (play_addr++);
                 data = (high << 8) + low;
+                if (clip_playing) {
+                  clip_advance (2);
+                }
             } else {
                 t = SRAM.read (play_addr++);
                 data = CODEC.sampleExpand(t);
+                if (clip_playing) {
+                  clip_advance (1);
+                }
             }
             
-            if (play_addr >= mem_addr) {
+            if ((!clip_playing) && (play_addr >= mem_addr) && (!adpcm_phase)) {
               play_addr = 0;
+              ima_adpcm_reset();
             }
             
             
@@ -438,7 +958,7 @@ void FSM()
                 }
 
                 if (t == '+') {
-                  if (volume < 32) {
+                  if (volume < VOLUME_MAX) {
                     ++volume;  
                   }
                   
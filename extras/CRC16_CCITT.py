@@ -21,8 +21,17 @@
 ###############################################################################
 # References:
 # http://stackoverflow.com/questions/25239423/crc-ccitt-16-bit-python-manual-calculation
+#
+# Remarks:
+#   The table comes from M10Tables.py (see make_tables.py), and is only
+#   built here when that has not been generated.
 ###############################################################################
 
+try:
+    from M10Tables import CRC16_CCITT_TABLE
+except ImportError:
+    CRC16_CCITT_TABLE = None
+
 class CRC16_CCITT:
     
     _POLYNOMIAL = 0x1021
@@ -50,12 +59,16 @@ class CRC16_CCITT:
         return crc
     
     def __init__ (self):
-        self._tab = [ self._initial(i) for i in range(256) ]
+        if (CRC16_CCITT_TABLE is None):
+            self._tab = [ self._initial(i) for i in range(256) ]
+        else:
+            self._tab = CRC16_CCITT_TABLE
     
     def get_crc (self, data_list):
         crc = self._PRESET
+        tab = self._tab
         for c in data_list:
-            crc = self._update_crc(crc, c)
+            crc = ((crc << 8) ^ tab[((crc >> 8) ^ c) & 0xff]) & 0xffff
         return [(crc >> 8) & 0xFF, crc & 0xFF]     
     
     
@@ -0,0 +1,153 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+
+#############################################################################
+# Console_Events : event loop for a console that talks to a serial port
+#
+# Remarks:
+#   Waits on the keyboard and the serial port at the same time, and
+#   dispatches:
+#     - keys to Console_Input.feed(), and complete lines to on_line(line)
+#       (in uart raw mode, every key is a "line")
+#     - bytes from the serial port to on_serial(data)
+#
+#   On Unix, both are waited on with selectors, so the loop sleeps until
+#   there is something to do. The terminal stays in cbreak mode for the
+#   whole session (see Terminal_Session).
+#   On Windows, console and serial handles can not be selected on, so the
+#   loop checks msvcrt.kbhit() and serial.in_waiting and sleeps for
+#   _POLL_INTERVAL between checks.
+#
+#   The callbacks run on the loop, so a long command simply delays the
+#   next event.
+#############################################################################
+
+import os
+import sys
+
+from time import sleep
+
+from Console_Input import Terminal_Session
+
+class Console_Event_Loop:
+
+    _POLL_INTERVAL = 0.01
+    _READ_SIZE = 4096
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    console_input : Console_Input object
+    #    on_line       : called with each line that is entered
+    #    serial_port   : pyserial object (or None), watched for input
+    #    on_serial     : called with the bytes received from serial_port
+    #========================================================================
+
+    def __init__ (self, console_input, on_line, serial_port = None, on_serial = None):
+        self._console_input = console_input
+        self._on_line = on_line
+        self._serial = serial_port
+        self._on_serial = on_serial
+        self._running = 0
+
+    def stop (self):
+        self._running = 0
+
+    #========================================================================
+    # _keys : feed keys to the console input, dispatch complete lines
+    #========================================================================
+
+    def _keys (self, data):
+        for i in range (len(data)):
+            line = self._console_input.feed (data[i : i + 1])
+
+            if (line is not None):
+                self._on_line (line)
+
+                if (not self._running):
+                    return
+
+                self._console_input.prompt()
+
+    def _serial_data (self):
+        waiting = self._serial.in_waiting
+
+        if (waiting):
+            data = self._serial.read (waiting)
+            if (self._on_serial):
+                self._on_serial (data)
+
+    #========================================================================
+    # run : until stop() is called, or stdin is closed
+    #========================================================================
+
+    def run (self):
+        self._running = 1
+        self._console_input.prompt()
+
+        with Terminal_Session():
+            try:
+                import msvcrt
+            except ImportError:
+                self._run_selectors()
+            else:
+                self._run_polling (msvcrt)
+
+    def _run_selectors (self):
+        import selectors
+
+        stdin_fd = sys.stdin.fileno()
+
+        with selectors.DefaultSelector() as selector:
+            selector.register (stdin_fd, selectors.EVENT_READ, "stdin")
+
+            if (self._serial is not None):
+                selector.register (self._serial.fileno(), selectors.EVENT_READ, "serial")
+
+            while (self._running):
+                for key, mask in selector.select():
+                    if (key.data == "stdin"):
+                        data = os.read (stdin_fd, Console_Event_Loop._READ_SIZE)
+                        if (len(data) == 0):
+                            self._running = 0
+                        else:
+                            self._keys (data)
+                    else:
+                        self._serial_data()
+
+                    if (not self._running):
+                        break
+
+    def _run_polling (self, msvcrt):
+        while (self._running):
+            idle = 1
+
+            if (msvcrt.kbhit()):
+                self._keys (msvcrt.getch())
+                idle = 0
+
+            if (self._running and (self._serial is not None) and self._serial.in_waiting):
+                self._serial_data()
+                idle = 0
+
+            if (idle):
+                sleep (Console_Event_Loop._POLL_INTERVAL)
@@ -40,12 +40,15 @@ class _GetchUnix:
         import tty, sys
 
     def __call__(self):
-        import sys, tty, termios
+        import os, sys, tty, termios
         fd = sys.stdin.fileno()
+        if (Terminal_Session.active):
+            return os.read(fd, 1)
+            
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
+            tty.setraw(fd)
+            ch = os.read(fd, 1)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         return ch
@@ -78,9 +81,11 @@ class _Getch:
     
 class _KeyboardHitUnix:
     def __init__(self):
-        pass
-        
+        import select
+
     def __call__(self):
+        import sys
+        from select import select
         rlist, wlist, xlist = select([sys.stdin], [], [], 0)
         
         if rlist:
@@ -107,6 +112,42 @@ class _KBHit:
     def __call__(self): return self.impl()        
     
     
+#############################################################################
+# Terminal_Session : keep the terminal in cbreak mode (keys are delivered
+# one at a time, without echo) for as long as the "with" block lasts,
+# instead of switching modes for every key. Does nothing on Windows, where
+# msvcrt reads keys directly.
+#############################################################################
+
+class Terminal_Session:
+    
+    active = 0
+    
+    def __init__ (self):
+        self._old_settings = None
+        
+    def __enter__ (self):
+        try:
+            import sys, tty, termios
+        except ImportError:
+            return self
+            
+        try:
+            fd = sys.stdin.fileno()
+            self._old_settings = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            Terminal_Session.active = 1
+        except (termios.error, OSError, ValueError):
+            self._old_settings = None
+            
+        return self
+        
+    def __exit__ (self, exc_type, exc_value, traceback):
+        if (self._old_settings is not None):
+            import sys, termios
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._old_settings)
+            Terminal_Session.active = 0
+    
     
 #############################################################################
 # Console_Input : input for Config Console
@@ -143,6 +184,8 @@ class Console_Input:
         self._line = ""
         self._history = []
         self._prompt = prompt
+        self._history_index = 0
+        self._escape = b""
         self.uart_raw_mode_enable = 0
     
     #========================================================================
@@ -215,63 +258,101 @@ class Console_Input:
             print (self._line, end="", flush=True)
             
             
-    def input (self):
+    #========================================================================
+    # prompt : start a new input line
+    #========================================================================
+    
+    def prompt (self):
         self._line = ""
-        history_index = len (self._history)
+        self._history_index = len (self._history)
+        self._escape = b""
         
         if (self.uart_raw_mode_enable == 0):
             print (self._prompt, end="", flush=True)
+    
+    #========================================================================
+    # feed
+    #------------------------------------------------------------------------
+    # Remarks: process one key, as a single byte. Returns the line once
+    #   Enter is pressed, None otherwise. In uart raw mode every key is 
+    #   returned as it is.
+    #   Arrow keys arrive as 0xE0 + 'H'/'P' from msvcrt, and as
+    #   ESC '[' 'A'/'B' from a Unix terminal
+    #========================================================================
+    
+    def feed (self, c):
+        if (isinstance(c, str)):
+            c = c.encode()
+            
+        if (self.uart_raw_mode_enable):
+            self._line = c.decode(errors="replace")
+            return self._line
         
-        while(1):
-            if (self.uart_raw_mode_enable):
-                if self._kbhit():
-                    c = self._getch()
-                else:
-                    c = chr(0)
-            else:
-                c = self._getch()
+        if (self._escape):
+            self._escape = self._escape + c
             
-            if (self.uart_raw_mode_enable):
-                if (ord(c) == 0):
-                    self._line = ""
-                else:
-                    self._line = c.decode()
-                break
-                
-            if (ord(c) > 127):
-                c = self._getch()
-                if (ord(c) == ord('H')): # up arrow
-                    if (history_index >= 0):
-                        history_index = history_index - 1
-                    self._get_history(history_index)
-                elif (ord(c) == ord('P')): # down arrow    
-                    if (history_index < (len(self._history) - 1)):
-                        history_index = history_index + 1
-                    self._get_history(history_index)
-                    
-            elif (self._input_valid(ord(c))):
-                print (c.decode(), end="", flush=True)
-                self._line = self._line + c.decode()
-            elif (ord(c) == ord('\r')):
-                print ("");
-                break
-            elif (ord(c) == ord('\t')):
-                self._line = self._line + self._tab_completion()
-            elif (ord(c) == 8): # backspace
-                if (len (self._line)):
-                    print ("\b \b", end="", flush=True)
-                    self._line = self._line[:-1]
+            if (self._escape in (b"\xe0", b"\x00", b"\x1b", b"\x1b[", b"\x1bO")):
+                return None
             
+            if (self._escape[-1:] in (b"H", b"A")): # up arrow
+                if (self._history_index >= 0):
+                    self._history_index = self._history_index - 1
+                self._get_history(self._history_index)
+            elif (self._escape[-1:] in (b"P", b"B")): # down arrow    
+                if (self._history_index < (len(self._history) - 1)):
+                    self._history_index = self._history_index + 1
+                self._get_history(self._history_index)
+            
+            self._escape = b""
+            return None
+            
+        if ((ord(c) > 127) or (ord(c) == 0) or (ord(c) == 27)):
+            self._escape = c
+        elif (self._input_valid(ord(c))):
+            print (c.decode(), end="", flush=True)
+            self._line = self._line + c.decode()
+        elif ((ord(c) == ord('\r')) or (ord(c) == ord('\n'))):
+            print ("");
+            self._add_history()
+            return self._line
+        elif (ord(c) == ord('\t')):
+            self._line = self._line + self._tab_completion()
+        elif ((ord(c) == 8) or (ord(c) == 127)): # backspace
+            if (len (self._line)):
+                print ("\b \b", end="", flush=True)
+                self._line = self._line[:-1]
+                
+        return None
+    
+    def _add_history (self):
         if (len(self._line)):
             if (len(self._history)):
                 if (self._history[len(self._history) - 1] == self._line):
                     pass
-                elif (self.uart_raw_mode_enable == 0):
+                else:
                     self._history.append (self._line)
-            elif (self.uart_raw_mode_enable == 0):        
+            else:        
                 self._history.append (self._line)
+    
+    #========================================================================
+    # input : blocking read of one line (or, in uart raw mode, of the key
+    #   that has been hit, "" if there is none)
+    #========================================================================
+            
+    def input (self):
+        self.prompt()
         
-        return self._line
+        while(1):
+            if (self.uart_raw_mode_enable):
+                if self._kbhit():
+                    return self.feed (self._getch())
+                else:
+                    self._line = ""
+                    return self._line
+            
+            line = self.feed (self._getch())
+            if (line is not None):
+                return line
 
         
 #############################################################################
@@ -0,0 +1,442 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Broker : serial port broker
+#
+# Remarks:
+#   A long running process that owns the serial ports, so that many jobs
+#   (and many programs) can share a set of boards without opening the port
+#   and draining it each time.
+#
+#   - each port is opened on its first job and then kept open
+#   - each port has its own worker thread and a priority queue of jobs,
+#     lower priority numbers go first, equal priorities in arrival order.
+#     A priority that is not an integer is turned down
+#   - jobs and results travel over a Unix socket, as JSON lines. A message
+#     with a "length" field is followed by that many bytes of payload
+#     (16 bit little endian samples for load / save)
+#   - progress is streamed back at most 10 times per second
+#
+#   M10BrokerClient has the same load / save / play / stop / record calls
+#   as M10Client, and raises the same exceptions.
+#
+# Usage:
+#   Python M10Broker.py --socket /tmp/m10broker.sock
+#
+#   m10 = M10BrokerClient("/tmp/m10broker.sock", "/dev/ttyUSB0")
+#   m10.load(samples)
+#   m10.play()
+###############################################################################
+
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+
+from array import array
+from itertools import count
+
+import M10Errors
+
+from M10Client import M10Client
+from M10Errors import M10Error, M10LinkError, M10PortError
+from M10Progress import Progress
+
+DEFAULT_SOCKET = "/tmp/m10broker.sock"
+DEFAULT_PRIORITY = 10
+
+#============================================================================
+# message framing, shared by the broker and the client
+#============================================================================
+
+def _send_message (stream, message, payload = None):
+    if (payload is not None):
+        message = dict(message, length = len(payload))
+
+    stream.write (json.dumps(message).encode() + b"\n")
+
+    if (payload is not None):
+        stream.write (payload)
+
+    stream.flush()
+
+def _recv_message (stream):
+    line = stream.readline()
+    if (not line):
+        raise EOFError
+
+    message = json.loads (line)
+    if (not isinstance (message, dict)):
+        raise ValueError ("a message is a JSON object")
+
+    payload = None
+
+    if ("length" in message):
+        payload = stream.read (message["length"])
+        if (len(payload) != message["length"]):
+            raise EOFError
+
+    return message, payload
+
+def _samples_to_bytes (samples):
+    samples = array('h', samples)
+    if (sys.byteorder != "little"):
+        samples.byteswap()
+
+    return samples.tobytes()
+
+def _samples_from_bytes (data):
+    samples = array('h')
+    samples.frombytes (data)
+    if (sys.byteorder != "little"):
+        samples.byteswap()
+
+    return samples
+
+
+#############################################################################
+# broker side
+#############################################################################
+
+class _Job_Cancelled (Exception):
+    pass
+
+#============================================================================
+# _Job : one request, results go to self.results as (message, payload)
+#============================================================================
+
+class _Job:
+
+    def __init__ (self, message, payload):
+        self.message = message
+        self.payload = payload
+        self.results = queue.Queue()
+        self.cancelled = 0
+
+    def post (self, message, payload = None):
+        self.results.put ((message, payload))
+
+class _Job_Sink:
+
+    def __init__ (self, job):
+        self._job = job
+
+    def update (self, state):
+        self._job.post ({"event" : "progress", "done" : state.done, "total" : state.total})
+
+    def finish (self, state):
+        pass
+
+#============================================================================
+# _Port_Worker : owns one M10Client, runs its jobs one after another
+#============================================================================
+
+class _Port_Worker:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    serial_factory : function(port) that returns the serial port to
+    #                     use, such as an M10Emulator, or None for pyserial.
+    #                     Called again to reopen the port after an error
+    #========================================================================
+
+    def __init__ (self, port, baud_rate, timeout, serial_factory = None):
+        self._port = port
+        self._baud_rate = baud_rate
+        self._timeout = timeout
+        self._serial_factory = serial_factory
+
+        self._client = M10Client (port, baud_rate, timeout)
+        self._jobs = queue.PriorityQueue()
+        self._sequence = count()
+
+        self._thread = threading.Thread (target = self._run, name = "M10Broker " + port, daemon = True)
+        self._thread.start()
+
+    def submit (self, priority, job):
+        self._jobs.put ((priority, next(self._sequence), job))
+
+    def close (self):
+        self._jobs.put ((-1, -1, None))
+        self._thread.join()
+
+    def _progress (self, job):
+        throttle = Progress (_Job_Sink (job))
+
+        def progress (done, total):
+            if (job.cancelled):
+                raise _Job_Cancelled
+            throttle (done, total)
+
+        return progress
+
+    def _open (self):
+        if ((self._serial_factory is not None) and (not self._client.is_open)):
+            self._client = M10Client (self._port, self._baud_rate, self._timeout,
+                                      serial_port = self._serial_factory (self._port))
+
+        return self._client.open()
+
+    def _execute (self, job):
+        m10 = self._open()
+        message = job.message
+        op = message["op"]
+
+        m10.reset_input()
+
+        if (op == "load"):
+            m10.load (_samples_from_bytes (job.payload), self._progress (job))
+        elif (op == "save"):
+            samples = m10.save (message.get("samples"), self._progress (job))
+            return _samples_to_bytes (samples)
+        elif (op == "record"):
+            m10.record (message.get("seconds", 16), self._progress (job))
+        elif (op in ("play", "stop", "volume_up", "volume_down")):
+            getattr (m10, op)()
+        elif (op == "ping"):
+            pass
+        else:
+            raise M10Error ("unknown op {0}".format(op))
+
+        return None
+
+    def _run (self):
+        while (1):
+            priority, sequence, job = self._jobs.get()
+            if (job is None):
+                break
+
+            if (job.cancelled):
+                continue
+
+            try:
+                payload = self._execute (job)
+                job.post ({"event" : "done"}, payload)
+            except _Job_Cancelled:
+                pass
+            except M10Error as e:
+                if (isinstance (e, M10LinkError) or not self._client.is_open):
+                    self._client.close()
+                job.post ({"event" : "error", "type" : type(e).__name__, "message" : str(e)})
+            except Exception as e:
+                self._client.close()
+                job.post ({"event" : "error", "type" : "M10Error", "message" : repr(e)})
+
+        self._client.close()
+
+#============================================================================
+# M10Broker : the socket server
+#============================================================================
+
+class _Request_Handler (socketserver.StreamRequestHandler):
+
+    def handle (self):
+        broker = self.server
+
+        while (1):
+            try:
+                message, payload = _recv_message (self.rfile)
+            except (EOFError, ValueError):
+                return
+
+            port = message.get("port")
+            priority = message.get("priority", DEFAULT_PRIORITY)
+
+            if ((not isinstance (port, str)) or (not port)):
+                _send_message (self.wfile, {"event" : "error", "type" : "M10PortError", "message" : "no port given"})
+                continue
+
+            # compared with the priorities of the other jobs in the queue
+            if ((not isinstance (priority, int)) or isinstance (priority, bool)):
+                _send_message (self.wfile, {"event" : "error", "type" : "M10Error", "message" : "priority is not an integer"})
+                continue
+
+            job = _Job (message, payload)
+            broker.worker (port).submit (priority, job)
+
+            while (1):
+                result, result_payload = job.results.get()
+
+                try:
+                    _send_message (self.wfile, result, result_payload)
+                except OSError:
+                    job.cancelled = 1
+                    return
+
+                if (result["event"] != "progress"):
+                    break
+
+class M10Broker (socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__ (self, socket_path = DEFAULT_SOCKET, baud_rate = 115200, timeout = 6, serial_factory = None):
+        if (os.path.exists (socket_path)):
+            os.unlink (socket_path)
+
+        self.socket_path = socket_path
+        self._baud_rate = baud_rate
+        self._timeout = timeout
+        self._serial_factory = serial_factory
+        self._workers = {}
+        self._lock = threading.Lock()
+
+        socketserver.UnixStreamServer.__init__ (self, socket_path, _Request_Handler)
+
+    def worker (self, port):
+        with self._lock:
+            if (port not in self._workers):
+                self._workers[port] = _Port_Worker (port, self._baud_rate, self._timeout, self._serial_factory)
+
+            return self._workers[port]
+
+    def server_close (self):
+        socketserver.UnixStreamServer.server_close (self)
+
+        with self._lock:
+            for worker in self._workers.values():
+                worker.close()
+            self._workers = {}
+
+        if (os.path.exists (self.socket_path)):
+            os.unlink (self.socket_path)
+
+
+#############################################################################
+# M10BrokerClient : M10Client look-alike that goes through the broker
+#############################################################################
+
+class M10BrokerClient:
+
+    def __init__ (self, socket_path = DEFAULT_SOCKET, port = None, priority = DEFAULT_PRIORITY):
+        self.socket_path = socket_path
+        self.port = port
+        self.priority = priority
+
+        self._socket = None
+        self._stream = None
+
+    def open (self):
+        if (self._socket is None):
+            try:
+                self._socket = socket.socket (socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.connect (self.socket_path)
+            except OSError as e:
+                self._socket = None
+                raise M10PortError ("no broker at {0}: {1}".format(self.socket_path, e)) from e
+
+            self._stream = self._socket.makefile ("rwb")
+
+        return self
+
+    def close (self):
+        if (self._socket is not None):
+            self._stream.close()
+            self._socket.close()
+            self._socket = None
+            self._stream = None
+
+    def __enter__ (self):
+        return self.open()
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        self.close()
+
+    #========================================================================
+    # _job : send one job, wait for its result
+    #========================================================================
+
+    def _job (self, op, payload = None, progress = None, **kwargs):
+        self.open()
+
+        message = dict(kwargs, op = op, port = self.port, priority = self.priority)
+
+        try:
+            _send_message (self._stream, message, payload)
+
+            while (1):
+                result, result_payload = _recv_message (self._stream)
+
+                if (result["event"] == "progress"):
+                    if (progress):
+                        progress (result["done"], result["total"])
+                elif (result["event"] == "error"):
+                    error_type = getattr (M10Errors, result["type"], M10Error)
+                    raise error_type (result["message"])
+                else:
+                    return result_payload
+        except (OSError, EOFError) as e:
+            self.close()
+            raise M10PortError ("lost connection to the broker: {0}".format(e)) from e
+
+    def ping (self):
+        self._job ("ping")
+
+    def load (self, samples, progress = None):
+        self._job ("load", _samples_to_bytes (samples), progress)
+
+    def save (self, num_of_samples = None, progress = None):
+        return _samples_from_bytes (self._job ("save", None, progress, samples = num_of_samples))
+
+    def record (self, seconds = 16, progress = None):
+        self._job ("record", None, progress, seconds = seconds)
+
+    def play (self):
+        self._job ("play")
+
+    def stop (self):
+        self._job ("stop")
+
+    def volume_up (self):
+        self._job ("volume_up")
+
+    def volume_down (self):
+        self._job ("volume_down")
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="serial port broker for M10 boards")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket to listen on")
+    parser.add_argument("--baud_rate", type=int, default=115200)
+    args = parser.parse_args()
+
+    broker = M10Broker (args.socket, args.baud_rate)
+    print ("M10Broker listening on", args.socket)
+
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1290 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Client : host side API for the wav_record_playback sketch
+#
+# Remarks:
+#   This is the frame protocol that used to live inside Wav_Console, made
+#   usable from other programs:
+#     - no console output. Long operations take an optional progress
+#       callback, which is called as progress(done, total)
+#     - failures raise the exceptions in M10Errors.py
+#     - pyserial is imported when the port is opened, not at import time
+#
+# Usage:
+#   with M10Client("COM6") as m10:
+#       m10.load(samples)
+#       m10.play()
+#       ...
+#       m10.stop()
+#       m10.record(5)
+#       samples = m10.save()
+###############################################################################
+
+import binascii
+
+from array import array
+from time import monotonic, sleep
+
+from CRC16_CCITT import CRC16_CCITT
+from M10Errors import M10Error, M10PortError, M10LinkError
+from M10Pipeline import Producer, Consumer
+from M10Timeout import RTT_Estimator
+from wave_file import _wave_file
+
+class M10Client:
+
+#############################################################################
+# frame definition, see the sketch
+#############################################################################
+
+    _CMD_SYNC = bytes([0xBA, 0xAB, 0x11])
+    _CMD_TYPE_MEM_WRITE_WORD = 0x37
+    _CMD_TYPE_MEM_WRITE_BYTE = 0x38
+    _CMD_TYPE_MEM_WRITE_EXT  = 0x39
+    _CMD_TYPE_MEM_WRITE_FEC  = 0x3A
+    _CMD_TYPE_MEM_PARITY     = 0x3B
+    _CMD_TYPE_REG_BATCH      = 0x3C
+    _CMD_TYPE_MEM_READ_WORD  = 0x40
+    _CMD_TYPE_MEM_READ_EXT   = 0x41
+    _CMD_TYPE_MEM_READ_GROUP = 0x42
+    _CMD_TYPE_REG_ACCESS     = 0x44
+    _CMD_TYPE_MEM_CRC        = 0x46
+    _CMD_TYPE_MEM_FILL       = 0x58
+
+    _CMD_TYPE_CMD_PLAY       = 0x50
+    _CMD_TYPE_CMD_RECORD     = 0x52
+    _CMD_TYPE_CMD_SET_VOLUME = 0x54
+    _CMD_TYPE_CMD_SET_CODEC  = 0x56
+    _CMD_TYPE_CMD_PLAY_CLIP  = 0x5A
+    _CMD_TYPE_CMD_GET_LENGTH = 0x5C
+
+    # reply of the sketch to a CMD_PLAY_CLIP it can not play
+    _REPLY_NO_CLIP = 0xdead
+
+    # replies to MEM_READ_GROUP, and the reply to a parity frame when more
+    # than one block of the group is missing
+    _REPLY_TYPE_ACK_EXT = 0x35
+    _REPLY_TYPE_ACK_PARITY = 0x36
+    _REPLY_FEC_MISSING = 0x0bad
+
+    # a FEC group is up to 32 blocks (a bit each in the sketch)
+    FEC_MAX_GROUP = 32
+
+    # Si3000 register operations: bit 7 of the register number means
+    # write. A REG_BATCH frame takes up to 42, and is used from
+    # _REG_BATCH_MIN operations on, as it is 10 times the size of a
+    # REG_ACCESS frame
+    _REG_WRITE = 0x80
+    _REG_BATCH_MAX = 42
+    _REG_BATCH_MIN = 4
+
+    # parity frames that go unanswered before the sketch is taken to have
+    # no FEC. More than one, as the reply could be lost on a noisy line
+    _FEC_PROBES = 3
+
+    # 12 byte replies echo the address of the frame, except for these
+    _REPLY_TYPE_ACK = 0x34
+    _NO_ECHO = (_CMD_TYPE_MEM_PARITY, _CMD_TYPE_CMD_GET_LENGTH)
+
+    # frames after which the sketch stops reading frames, until a ' '
+    _LEAVES_UART = (_CMD_TYPE_CMD_PLAY, _CMD_TYPE_CMD_PLAY_CLIP, _CMD_TYPE_CMD_RECORD)
+
+    _FRAME_REPLY_LEN = 12
+    _EXT_DATA_LEN = 128
+    _EXT_REPLY_LEN = _EXT_DATA_LEN + 6
+    _EXT_FRAME_LEN = _EXT_DATA_LEN + 10
+
+    _ZERO_FRAME = bytes(_FRAME_REPLY_LEN)
+
+    # a MEM_FILL frame covers up to 255 blocks of 128 bytes
+    _FILL_MAX_BLOCKS = 255
+    _CONSTANT_BLOCKS = [bytes([i]) * 128 for i in range (256)]
+
+    # EXT frames are built by a producer thread, this many blocks to a
+    # buffer, while the frames of the buffers before are sent
+    _PIPELINE_BLOCKS = 32
+    _PIPELINE_BUFFERS = 4
+
+    SRAM_SIZE = 128 * 1024
+    SAMPLE_RATE = 8000
+
+    # sample format in the SRAM, the compressedFlag of the sketch
+    CODEC_LINEAR    = 0
+    CODEC_MULAW     = 1
+    CODEC_IMA_ADPCM = 2
+
+    CODECS = {
+        'mulaw' : CODEC_MULAW,
+        'adpcm' : CODEC_IMA_ADPCM
+    }
+
+    # the sketch writes a '\n' every 8192 recorded samples
+    _RECORD_TICK_SAMPLES = 8192
+
+    # time for the sketch to see the end of a recording, after which no
+    # more '\n' can arrive
+    _RECORD_STOP_SETTLE = 0.01
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    port      : serial port name, such as "COM6" or "/dev/ttyUSB0"
+    #    baud_rate : baud rate of the sketch
+    #    timeout   : longest read timeout (in seconds) for a reply. The
+    #                actual timeout of each frame follows the measured
+    #                round trip time, see M10Timeout.py
+    #    retries   : number of times a frame is resent before giving up
+    #    serial_port : an already open pyserial (or look-alike) object to
+    #                  use instead of opening port, such as M10Emulator
+    #    trace_file  : record the serial traffic to this file, see
+    #                  M10Trace.py
+    #    fec_group   : blocks per FEC group (2 to FEC_MAX_GROUP), or 0 to
+    #                  send and read every block on its own, see
+    #                  _write_group / _read_group
+    #========================================================================
+
+    def __init__ (self, port, baud_rate=115200, timeout=6, retries=16, serial_port=None, trace_file=None, fec_group=0):
+        self.port = port
+        self.baud_rate = baud_rate
+        self.timeout = timeout
+        self.retries = retries
+
+        self.crc_errors = 0
+        self.timeouts = 0
+
+        # blocks rebuilt from parity, by the sketch or here
+        self.fec_repaired = 0
+
+        # one RTT_Estimator per frame type
+        self._rtt = {}
+        self._read_timeout = None
+
+        # a reply may still be on its way after a failed frame, see _resync
+        self._unsynced = False
+        self._sync_addr = 0
+
+        # codec selected on the board, None if not known, and whether the
+        # sketch takes CMD_CODEC frames, None until the first one
+        self.codec = None
+        self.codec_supported = None
+
+        # whether the sketch takes MEM_FILL frames, None until the first one
+        self.fill_supported = None
+
+        # bytes in the SRAM from the last record(), None if not known.
+        # Same for CMD_GET_LENGTH as for MEM_FILL above
+        self.recorded_length = None
+        self.length_supported = None
+
+        # same for the FEC frames
+        self.fec_group = min(max(fec_group, 0), M10Client.FEC_MAX_GROUP)
+        self.fec_supported = None
+        self._fec_probes = 0
+
+        # same for the Si3000 register frames
+        self.registers_supported = None
+
+        # same for MEM_CRC
+        self.mem_crc_supported = None
+
+        # same for CMD_PLAY_CLIP
+        self.clips_supported = None
+
+        # the mu-law image of the last save, as read from the SRAM
+        self.saved_image = None
+
+        self._serial = serial_port
+        self._trace_file = trace_file
+        self._tap = None
+        self._crc16_ccitt = CRC16_CCITT()
+        self._wave = _wave_file()
+
+    #========================================================================
+    # open / close, also available through "with"
+    #========================================================================
+
+    def open (self):
+        if (self._serial is None):
+            try:
+                import serial
+            except ImportError as e:
+                raise M10PortError ("pyserial is not installed") from e
+
+            try:
+                self._serial = serial.Serial(self.port, self.baud_rate, timeout=self.timeout)
+                self._read_timeout = self.timeout
+            except (serial.SerialException, ValueError) as e:
+                raise M10PortError ("Failed to open {0}: {1}".format(self.port, e)) from e
+
+            if (self._serial.in_waiting):
+                self._serial.read (self._serial.in_waiting) # clear the uart receive buffer
+
+        if ((self._trace_file is not None) and (self._tap is None)):
+            from M10Trace import Serial_Tap
+            self._serial = self._tap = Serial_Tap (self._serial, self._trace_file)
+
+        return self
+
+    #========================================================================
+    # trace_note : add a note to the trace, if there is one
+    #========================================================================
+
+    def trace_note (self, text):
+        if (self._tap is not None):
+            self._tap.note (text)
+
+    def close (self):
+        if (self._serial is not None):
+            self._serial.close()
+            self._serial = None
+            self._tap = None
+            self._read_timeout = None
+
+    def __enter__ (self):
+        return self.open()
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def is_open (self):
+        return self._serial is not None
+
+    @property
+    def serial_port (self):
+        return self._serial
+
+    def _port (self):
+        if (self._serial is None):
+            raise M10PortError ("{0} is not open".format(self.port))
+
+        return self._serial
+
+    #========================================================================
+    # reset_input : drop whatever the sketch has sent so far
+    #========================================================================
+
+    def reset_input (self):
+        self._port().reset_input_buffer()
+
+    #========================================================================
+    # _set_read_timeout : pyserial reconfigures the port on each change,
+    #   so the timeout is only set when it moves by more than a millisecond
+    #========================================================================
+
+    def _set_read_timeout (self, timeout):
+        if ((self._read_timeout is None) or (abs(timeout - self._read_timeout) > 0.001)):
+            self._port().timeout = timeout
+            self._read_timeout = timeout
+
+    def _rtt_estimator (self, frame_type):
+        rtt = self._rtt.get (frame_type)
+
+        if (rtt is None):
+            rtt = RTT_Estimator (min(1.0, self.timeout), ceiling = self.timeout)
+            self._rtt[frame_type] = rtt
+
+        return rtt
+
+    #========================================================================
+    # link_stats : counters, and the RTT estimate of each frame type
+    #========================================================================
+
+    def link_stats (self):
+        return {
+            'crc_errors' : self.crc_errors,
+            'timeouts'   : self.timeouts,
+            'fec_repaired' : self.fec_repaired,
+            'rtt'        : {"0x{0:02x}".format(frame_type) : rtt.as_dict()
+                            for frame_type, rtt in sorted (self._rtt.items())}
+        }
+
+    #========================================================================
+    # _frame : build a 12 byte command frame (plus the EXT payload, if any)
+    #========================================================================
+
+    def _frame (self, frame_type, addr, payload):
+        frame = bytearray(M10Client._CMD_SYNC)
+        frame.append (frame_type)
+        frame += (addr & 0xFFFFFFFF).to_bytes(4, "big")
+        frame += payload
+        frame += bytes(self._crc16_ccitt.get_crc (frame))
+
+        return frame
+
+    #========================================================================
+    # _good_reply : whether ret is a whole reply of reply_len bytes with a
+    #   good CRC, of the right type, and for 12 byte replies, with the
+    #   address of frame echoed
+    #========================================================================
+
+    def _good_reply (self, frame, ret, reply_len):
+        if ((len(ret) != reply_len) or
+            (bytes(self._crc16_ccitt.get_crc (ret[0 : reply_len - 2])) != ret[reply_len - 2 : reply_len])):
+            return False
+
+        if (reply_len != M10Client._FRAME_REPLY_LEN):
+            return ret[len(M10Client._CMD_SYNC)] == M10Client._REPLY_TYPE_ACK_EXT
+
+        return ((ret[len(M10Client._CMD_SYNC)] == M10Client._REPLY_TYPE_ACK) and
+                ((frame[3] in M10Client._NO_ECHO) or (ret[6 : 10] == bytes(frame[4 : 8]))))
+
+    #========================================================================
+    # _transact
+    #------------------------------------------------------------------------
+    #  Remarks: send a frame and read back a reply of reply_len bytes,
+    #  whose last two bytes are the CRC16_CCITT of the rest. On a bad reply
+    #  a zero frame is sent to flush the input FSM of the sketch, the input
+    #  is drained (see _drain), and the frame is sent again.
+    #
+    #  A reply that only comes after a retry may be the late reply to an
+    #  earlier try, with the reply to the last try still on its way, where
+    #  it would be taken for the reply to the next frame (EXT replies carry
+    #  no address to tell). So the link is synced again (see _resync)
+    #  before such a reply is returned.
+    #
+    #  After a play or record frame the sketch no longer reads frames, so
+    #  a try whose reply was lost is stopped before the next one, and the
+    #  link is synced only before the frame after it (once stopped).
+    #
+    #  The read timeout is the rto of the frame type, unless timeout is
+    #  given.
+    #========================================================================
+
+    def _transact (self, frame, reply_len, addr, timeout = None):
+        port = self._port()
+        rtt = self._rtt_estimator (frame[3])
+
+        if (self._unsynced):
+            self._resync()
+
+        for i in range (self.retries):
+            quiet = rtt.timeout()
+            self._set_read_timeout (timeout or quiet)
+
+            start_time = monotonic()
+            port.write (frame)
+            ret = port.read (reply_len)
+
+            if (self._good_reply (frame, ret, reply_len)):
+                if (i == 0):
+                    rtt.update (monotonic() - start_time)
+                elif (frame[3] in M10Client._LEAVES_UART):
+                    self._unsynced = True
+                else:
+                    self._resync()
+                return ret
+
+            if (frame[3] in M10Client._LEAVES_UART):
+                port.write (b" \n")
+
+            if (len(ret) < reply_len):
+                self.timeouts = self.timeouts + 1
+                rtt.backoff()
+                self._drain (quiet)
+            else:
+                self.crc_errors = self.crc_errors + 1
+                self._drain (0)
+
+        self._unsynced = True
+
+        raise M10LinkError ("frame 0x{0:02x} to addr 0x{1:x} failed after {2} retries".format(frame[3], addr, self.retries))
+
+    #========================================================================
+    # _drain
+    #------------------------------------------------------------------------
+    #  Remarks: after a bad reply, flush the input FSM of the sketch with a
+    #  zero frame, and drop what comes in until the line has been quiet for
+    #  quiet seconds (about one rto after a timeout), so the rest of a late
+    #  reply is not read as the reply to the frame sent next. At most
+    #  self.timeout. A reply that came in whole but corrupted leaves
+    #  nothing on its way, quiet is 0 then
+    #========================================================================
+
+    def _drain (self, quiet):
+        port = self._port()
+
+        port.write (M10Client._ZERO_FRAME)
+        port.reset_input_buffer()
+
+        if (not quiet):
+            return
+
+        self._set_read_timeout (quiet)
+        end_time = monotonic() + self.timeout
+
+        while (port.read (max(port.in_waiting, 1)) and (monotonic() < end_time)):
+            pass
+
+    #========================================================================
+    # _resync
+    #------------------------------------------------------------------------
+    #  Remarks: make sure no reply is on its way. A READ_WORD frame goes
+    #  out with an address not used before, until its reply comes back.
+    #  The sketch answers frames in order, so once the reply that echoes
+    #  that address is in, every earlier reply is in too, and was dropped
+    #========================================================================
+
+    def _resync (self):
+        port = self._port()
+        rtt = self._rtt_estimator (M10Client._CMD_TYPE_MEM_READ_WORD)
+
+        self._unsynced = True
+
+        for i in range (self.retries):
+            self._sync_addr = (self._sync_addr + 1) % M10Client.SRAM_SIZE
+            frame = self._frame (M10Client._CMD_TYPE_MEM_READ_WORD, self._sync_addr, b"\x12\x34")
+
+            quiet = rtt.timeout()
+            self._set_read_timeout (quiet)
+
+            start_time = monotonic()
+            port.write (frame)
+            ret = port.read (M10Client._FRAME_REPLY_LEN)
+
+            if (self._good_reply (frame, ret, M10Client._FRAME_REPLY_LEN)):
+                rtt.update (monotonic() - start_time)
+                self._unsynced = False
+                return
+
+            if (len(ret) < M10Client._FRAME_REPLY_LEN):
+                self.timeouts = self.timeouts + 1
+                rtt.backoff()
+                self._drain (quiet)
+            else:
+                self.crc_errors = self.crc_errors + 1
+                self._drain (0)
+
+        raise M10LinkError ("no reply to sync frames after {0} retries".format(self.retries))
+
+    #========================================================================
+    # _transact_once
+    #------------------------------------------------------------------------
+    #  Remarks: _transact with a single try, for frames that older sketches
+    #  do not know. They never answer those, so retries would only add
+    #  timeouts. The full timeout is used, as a reply that is merely late
+    #  would be taken for "not supported". A reply that comes in garbled
+    #  shows the sketch knows the frame, so it is retried as usual then
+    #========================================================================
+
+    def _transact_once (self, frame, reply_len, addr):
+        if (self._unsynced):
+            self._resync()
+
+        retries = self.retries
+        crc_errors = self.crc_errors
+
+        try:
+            self.retries = 1
+            return self._transact (frame, reply_len, addr, self.timeout)
+        except M10LinkError:
+            if (self.crc_errors == crc_errors):
+                raise
+        finally:
+            self.retries = retries
+
+        return self._transact (frame, reply_len, addr, self.timeout)
+
+    #========================================================================
+    # memory access
+    #========================================================================
+
+    def write_ext (self, addr, data):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_WRITE_EXT, addr, data)
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+    def write16 (self, addr, data):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_WRITE_WORD, addr, bytes([(data >> 8) & 0xFF, data & 0xFF]))
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+    def write8 (self, addr, data):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_WRITE_BYTE, addr, bytes([data & 0xFF, data & 0xFF]))
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+    def read16 (self, addr):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_READ_WORD, addr, b"\x12\x34")
+        ret = self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+        return ret [len(M10Client._CMD_SYNC) + 1] * 256 + ret [len(M10Client._CMD_SYNC) + 2]
+
+    def read_ext (self, addr):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_READ_EXT, addr, b"\x12\x34")
+        ret = self._transact (frame, M10Client._EXT_REPLY_LEN, addr)
+
+        return ret [len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 1 + M10Client._EXT_DATA_LEN]
+
+    def fill (self, addr, num_of_blocks, value):
+        frame = self._frame (M10Client._CMD_TYPE_MEM_FILL, addr, bytes([num_of_blocks & 0xFF, value & 0xFF]))
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+    def set_volume (self, volume):
+        frame = self._frame (M10Client._CMD_TYPE_CMD_SET_VOLUME, 0, bytes([0, volume & 0xFF]))
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, 0)
+
+    #========================================================================
+    # set_codec
+    #------------------------------------------------------------------------
+    #  Remarks: select the sample format the sketch plays from the SRAM.
+    #  Sketches without the CMD_CODEC frame never answer it, so the first
+    #  one is only tried once.
+    #========================================================================
+
+    def set_codec (self, codec):
+        if (self.codec_supported is False):
+            raise M10LinkError ("the sketch does not support codec selection")
+
+        frame = self._frame (M10Client._CMD_TYPE_CMD_SET_CODEC, 0, bytes([0, codec & 0xFF]))
+
+        if (self.codec_supported):
+            self._transact (frame, M10Client._FRAME_REPLY_LEN, 0)
+        else:
+            try:
+                self._transact_once (frame, M10Client._FRAME_REPLY_LEN, 0)
+            except M10LinkError as e:
+                self.codec_supported = False
+                raise M10LinkError ("the sketch does not support codec selection") from e
+
+            self.codec_supported = True
+
+        self.codec = codec
+
+    #========================================================================
+    # codec_registers
+    #------------------------------------------------------------------------
+    #  Remarks: Si3000 register operations, done in order. ops is a list of
+    #  (register, value), with value None for a read. Returns the value
+    #  read or written by each one. A few operations go out as REG_ACCESS
+    #  frames, more as REG_BATCH frames. M10Registers.py keeps a cached
+    #  register map on top of this.
+    #
+    #  Sketches without these frames never answer them, so the first one is
+    #  only tried once.
+    #========================================================================
+
+    def codec_registers (self, ops):
+        values = []
+
+        if (len(ops) < M10Client._REG_BATCH_MIN):
+            for register, value in ops:
+                if (value is None):
+                    frame = self._frame (M10Client._CMD_TYPE_REG_ACCESS, register & 0x1F, b"\x12\x34")
+                else:
+                    frame = self._frame (M10Client._CMD_TYPE_REG_ACCESS, (register & 0x1F) | M10Client._REG_WRITE,
+                                         bytes([0, value & 0xFF]))
+
+                ret = self._register_transact (frame, M10Client._FRAME_REPLY_LEN, register)
+                values.append (int.from_bytes (ret[len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 3], "big"))
+
+            return values
+
+        for i in range (0, len(ops), M10Client._REG_BATCH_MAX):
+            batch = ops[i : i + M10Client._REG_BATCH_MAX]
+            payload = bytearray(M10Client._EXT_DATA_LEN)
+
+            for j, (register, value) in enumerate (batch):
+                payload[j * 3] = (register & 0x1F) | (0 if value is None else M10Client._REG_WRITE)
+                payload[j * 3 + 1 : j * 3 + 3] = ((value or 0) & 0xFFFF).to_bytes (2, "big")
+
+            frame = self._frame (M10Client._CMD_TYPE_REG_BATCH, len(batch), payload)
+            ret = self._register_transact (frame, M10Client._EXT_REPLY_LEN, len(batch))
+
+            offset = len(M10Client._CMD_SYNC) + 1
+            values.extend (int.from_bytes (ret[offset + j * 2 : offset + j * 2 + 2], "big") for j in range (len(batch)))
+
+        return values
+
+    def _register_transact (self, frame, reply_len, addr):
+        if (self.registers_supported):
+            return self._transact (frame, reply_len, addr)
+
+        if (self.registers_supported is False):
+            raise M10LinkError ("the sketch does not support register access")
+
+        try:
+            ret = self._transact_once (frame, reply_len, addr)
+        except M10LinkError as e:
+            self.registers_supported = False
+            raise M10LinkError ("the sketch does not support register access") from e
+
+        self.registers_supported = True
+
+        return ret
+
+    #========================================================================
+    # _constant_run
+    #------------------------------------------------------------------------
+    #  Remarks: number of blocks, starting with the one at offset, that hold
+    #  nothing but view[offset] (at most _FILL_MAX_BLOCKS and max_blocks).
+    #  Each block is checked with a single compare against a constant block
+    #========================================================================
+
+    def _constant_run (self, view, offset, max_blocks):
+        ext_len = M10Client._EXT_DATA_LEN
+        constant = M10Client._CONSTANT_BLOCKS[view[offset]]
+        max_blocks = min(max_blocks, M10Client._FILL_MAX_BLOCKS)
+
+        num_of_blocks = 0
+        while ((num_of_blocks < max_blocks) and
+               (view[offset + num_of_blocks * ext_len : offset + (num_of_blocks + 1) * ext_len] == constant)):
+            num_of_blocks = num_of_blocks + 1
+
+        return num_of_blocks
+
+    #========================================================================
+    # _write_run
+    #------------------------------------------------------------------------
+    #  Remarks: write up to max_blocks blocks of view, starting at offset,
+    #  to addr. A run of constant blocks goes out as one MEM_FILL frame, or
+    #  else one block as an EXT frame. Returns the number of blocks written.
+    #
+    #  Sketches without MEM_FILL never answer it, so the first fill is only
+    #  tried once, and EXT frames are used from then on if it fails.
+    #
+    #  frame is the EXT frame of the first block, if it was built already
+    #========================================================================
+
+    def _write_run (self, view, offset, addr, max_blocks, frame = None):
+        ext_len = M10Client._EXT_DATA_LEN
+
+        if (self.fill_supported is not False):
+            num_of_blocks = self._constant_run (view, offset, max_blocks)
+
+            if (num_of_blocks):
+                if (self.fill_supported):
+                    self.fill (addr, num_of_blocks, view[offset])
+                    return num_of_blocks
+
+                fill_frame = self._frame (M10Client._CMD_TYPE_MEM_FILL, addr, bytes([num_of_blocks, view[offset]]))
+
+                try:
+                    self._transact_once (fill_frame, M10Client._FRAME_REPLY_LEN, addr)
+                    self.fill_supported = True
+                    return num_of_blocks
+                except M10LinkError:
+                    self.fill_supported = False
+
+        if ((self.fec_group > 1) and (self.fec_supported is not False)):
+            num_of_blocks = 1
+            while ((num_of_blocks < min(max_blocks, self.fec_group)) and
+                   ((self.fill_supported is False) or
+                    (self._constant_run (view, offset + num_of_blocks * ext_len, 1) == 0))):
+                num_of_blocks = num_of_blocks + 1
+
+            if ((num_of_blocks > 1) and self._write_group (view, offset, addr, num_of_blocks)):
+                return num_of_blocks
+
+        if (frame is None):
+            self.write_ext (addr, view[offset : offset + ext_len])
+        else:
+            self._transact (frame, M10Client._FRAME_REPLY_LEN, addr)
+
+        return 1
+
+    #========================================================================
+    # _write_group
+    #------------------------------------------------------------------------
+    #  Remarks: write num_of_blocks blocks as MEM_WRITE_FEC frames, which
+    #  the sketch does not answer, followed by a parity frame (the XOR of
+    #  the blocks) that is answered for the whole group. The sketch rebuilds
+    #  a single lost block from the parity and the blocks it has. If more
+    #  are lost, it answers with the missing ones, which are sent again
+    #  along with the parity.
+    #
+    #  The top byte of the address is the index of the block in the group,
+    #  or the number of blocks for the parity frame.
+    #
+    #  Returns 0 if the sketch does not support FEC, or did not answer the
+    #  first parity frames (nothing was taken as written then)
+    #========================================================================
+
+    def _write_group (self, view, offset, addr, num_of_blocks):
+        ext_len = M10Client._EXT_DATA_LEN
+        port = self._port()
+
+        parity = 0
+        for j in range (num_of_blocks):
+            parity = parity ^ int.from_bytes (view[offset + j * ext_len : offset + (j + 1) * ext_len], "big")
+
+        parity_frame = self._frame (M10Client._CMD_TYPE_MEM_PARITY, (num_of_blocks << 24) | addr,
+                                    parity.to_bytes (ext_len, "big"))
+
+        missing = (1 << num_of_blocks) - 1
+
+        for i in range (self.retries):
+            if (self._unsynced):
+                self._resync()
+
+            for j in range (num_of_blocks):
+                if (missing & (1 << j)):
+                    port.write (self._frame (M10Client._CMD_TYPE_MEM_WRITE_FEC, (j << 24) | (addr + j * ext_len),
+                                             view[offset + j * ext_len : offset + (j + 1) * ext_len]))
+
+            if (self.fec_supported):
+                ret = self._transact (parity_frame, M10Client._FRAME_REPLY_LEN, addr)
+            else:
+                try:
+                    ret = self._transact_once (parity_frame, M10Client._FRAME_REPLY_LEN, addr)
+                    self.fec_supported = True
+                except M10LinkError:
+                    self._fec_probes = self._fec_probes + 1
+                    if (self._fec_probes >= M10Client._FEC_PROBES):
+                        self.fec_supported = False
+                    return 0
+
+            m = int.from_bytes (ret[len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 3], "big")
+            missing = int.from_bytes (ret[len(M10Client._CMD_SYNC) + 3 : len(M10Client._CMD_SYNC) + 7], "big")
+
+            if (m != M10Client._REPLY_FEC_MISSING):
+                self.fec_repaired = self.fec_repaired + bin(missing).count("1")
+                return num_of_blocks
+
+        raise M10LinkError ("FEC group at addr 0x{0:x} failed after {1} retries".format(addr, self.retries))
+
+    #========================================================================
+    # _read_group
+    #------------------------------------------------------------------------
+    #  Remarks: read num_of_blocks blocks with a single MEM_READ_GROUP frame.
+    #  The sketch answers with an ACK_EXT frame for each block and then the
+    #  parity of them. A single bad block is rebuilt from the parity, more
+    #  are read again one by one.
+    #
+    #  Returns None if the sketch does not support FEC, or did not answer
+    #  the first MEM_READ_GROUP frames
+    #========================================================================
+
+    def _read_group (self, addr, num_of_blocks):
+        ext_len = M10Client._EXT_DATA_LEN
+        reply_len = M10Client._EXT_REPLY_LEN
+        total = (num_of_blocks + 1) * reply_len
+
+        port = self._port()
+        rtt = self._rtt_estimator (M10Client._CMD_TYPE_MEM_READ_GROUP)
+
+        frame = self._frame (M10Client._CMD_TYPE_MEM_READ_GROUP, (num_of_blocks << 24) | addr, b"\x12\x34")
+
+        if (self._unsynced):
+            self._resync()
+
+        quiet = rtt.timeout()
+        self._set_read_timeout (quiet if self.fec_supported else self.timeout)
+
+        start_time = monotonic()
+        port.write (frame)
+        ret = port.read (total)
+
+        if (len(ret) == total):
+            rtt.update (monotonic() - start_time)
+        elif (self.fec_supported):
+            self.timeouts = self.timeouts + 1
+            rtt.backoff()
+
+        blocks = []
+        for j in range (num_of_blocks + 1):
+            reply = ret[j * reply_len : (j + 1) * reply_len]
+            reply_type = M10Client._REPLY_TYPE_ACK_EXT if (j < num_of_blocks) else M10Client._REPLY_TYPE_ACK_PARITY
+
+            if ((len(reply) == reply_len) and (reply[len(M10Client._CMD_SYNC)] == reply_type) and
+                (bytes(self._crc16_ccitt.get_crc (reply[0 : reply_len - 2])) == reply[reply_len - 2 : reply_len])):
+                blocks.append (reply[len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 1 + ext_len])
+            else:
+                blocks.append (None)
+                if (len(reply) == reply_len):
+                    self.crc_errors = self.crc_errors + 1
+
+        # the rest of a late reply must not be read as the next reply
+        if (len(ret) != total):
+            self._drain (quiet)
+            self._unsynced = True
+
+        if (self.fec_supported is None):
+            if (all(block is None for block in blocks)):
+                self._fec_probes = self._fec_probes + 1
+                if (self._fec_probes >= M10Client._FEC_PROBES):
+                    self.fec_supported = False
+
+                return None
+
+            self.fec_supported = True
+
+        parity = blocks.pop()
+        bad = [j for j in range (num_of_blocks) if (blocks[j] is None)]
+
+        if ((len(bad) == 1) and (parity is not None)):
+            value = int.from_bytes (parity, "big")
+            for j in range (num_of_blocks):
+                if (j != bad[0]):
+                    value = value ^ int.from_bytes (blocks[j], "big")
+
+            blocks[bad[0]] = value.to_bytes (ext_len, "big")
+            self.fec_repaired = self.fec_repaired + 1
+        elif (bad):
+            for j in bad:
+                blocks[j] = self.read_ext (addr + j * ext_len)
+
+        return b"".join (blocks)
+
+    #========================================================================
+    # sram_crc / image_crc
+    #------------------------------------------------------------------------
+    #  Remarks: CRC16_CCITT of num_of_blocks blocks of the SRAM from addr,
+    #  worked out by the sketch (MEM_CRC frame), and of data here, to check
+    #  a transfer without reading the SRAM back. sram_crc returns None if
+    #  the sketch does not support MEM_CRC. The sketch reads the whole range
+    #  before it answers, so the full timeout is used
+    #========================================================================
+
+    def sram_crc (self, addr, num_of_blocks):
+        if (self.mem_crc_supported is False):
+            return None
+
+        frame = self._frame (M10Client._CMD_TYPE_MEM_CRC, addr, num_of_blocks.to_bytes (2, "big"))
+
+        if (self.mem_crc_supported):
+            ret = self._transact (frame, M10Client._FRAME_REPLY_LEN, addr, self.timeout)
+        else:
+            try:
+                ret = self._transact_once (frame, M10Client._FRAME_REPLY_LEN, addr)
+            except M10LinkError:
+                self.mem_crc_supported = False
+                return None
+
+            self.mem_crc_supported = True
+
+        return int.from_bytes (ret[len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 3], "big")
+
+    def image_crc (self, data):
+        return binascii.crc_hqx (data, 0xFFFF)
+
+    #========================================================================
+    # _consecutive : for each index in blocks, the number of blocks from
+    #   there on that follow each other in the SRAM, so a fill or a group
+    #   does not run over a skipped block
+    #========================================================================
+
+    @staticmethod
+    def _consecutive (blocks):
+        consecutive = [1] * len(blocks)
+
+        for i in range (len(blocks) - 2, -1, -1):
+            if (blocks[i + 1] == blocks[i] + 1):
+                consecutive[i] = consecutive[i + 1] + 1
+
+        return consecutive
+
+    #========================================================================
+    # write_image / write_blocks / read_image : raw SRAM content, no codec
+    #   involved. write_blocks only sends the listed 128 byte blocks.
+    #   Blocks of a single repeated byte (silence) are sent as fill frames.
+    #
+    #   With a journal (see M10Journal.py), write_image and read_image skip
+    #   the blocks the journal has from an earlier, interrupted transfer,
+    #   record each block as it is acknowledged / received, and check the
+    #   whole image with sram_crc at the end.
+    #
+    #   read_image calls sink(offset, data), if given, with each part of the
+    #   image as it comes in (from the journal or the board), so it can be
+    #   worked on during the transfer. A part can run past length, and can
+    #   come again if the transfer starts over
+    #========================================================================
+
+    def write_image (self, data, addr = 0, progress = None, journal = None):
+        if (journal is not None):
+            return self._write_image_journal (data, addr, progress, journal)
+
+        self.recorded_length = None
+
+        total = len(data)
+        ext_len = M10Client._EXT_DATA_LEN
+        num_of_ext_frames = total // ext_len
+
+        view = memoryview(data)
+        self._write_blocks (view, range (num_of_ext_frames), addr, progress, None, total)
+
+        offset = num_of_ext_frames * ext_len
+        while (offset < total):
+            self.write8 (addr + offset, view[offset])
+            offset = offset + 1
+
+        if (progress):
+            progress (total, total)
+
+    def write_blocks (self, data, blocks, progress = None, addr = 0, journal = None):
+        self.recorded_length = None
+
+        self._write_blocks (memoryview(data), blocks, addr, progress, journal, len(blocks) * M10Client._EXT_DATA_LEN)
+
+    #========================================================================
+    # _write_blocks
+    #------------------------------------------------------------------------
+    #  Remarks: the loop of write_image / write_blocks. The EXT frames of
+    #  the blocks come from a producer thread (see _ext_frames), so building
+    #  them and their CRC is done while the sketch is being waited for;
+    #  blocks that go out as fill or FEC frames simply leave theirs unused
+    #========================================================================
+
+    def _write_blocks (self, view, blocks, addr, progress, journal, total):
+        ext_len = M10Client._EXT_DATA_LEN
+        frame_len = M10Client._EXT_FRAME_LEN
+        consecutive = M10Client._consecutive (blocks)
+
+        buffers = [bytearray(M10Client._PIPELINE_BLOCKS * frame_len) for i in range (M10Client._PIPELINE_BUFFERS)]
+
+        def produce (take):
+            return self._ext_frames (view, blocks, addr, take)
+
+        with Producer (produce, buffers, "M10Client frames") as producer:
+            start = end = 0
+            buffer = None
+
+            i = 0
+            while (i < len(blocks)):
+                # the buffer that holds the frame of block i
+                while (i >= end):
+                    if (buffer is not None):
+                        producer.release (buffer)
+                    start, end, buffer = next(producer)
+
+                block = blocks[i]
+                frame = memoryview(buffer)[(i - start) * frame_len : (i - start + 1) * frame_len]
+
+                num_of_blocks = self._write_run (view, block * ext_len, addr + block * ext_len, consecutive[i], frame)
+
+                if (journal is not None):
+                    for j in range (num_of_blocks):
+                        journal.mark (block + j)
+
+                i = i + num_of_blocks
+
+                if (progress):
+                    progress (i * ext_len, total)
+
+    #========================================================================
+    # _ext_frames : generator, run by the producer thread. Yields
+    #   (start, end, buffer), the EXT frames of blocks[start:end] in a
+    #   buffer of the pool
+    #========================================================================
+
+    def _ext_frames (self, view, blocks, addr, take):
+        ext_len = M10Client._EXT_DATA_LEN
+        frame_len = M10Client._EXT_FRAME_LEN
+        sync_len = len(M10Client._CMD_SYNC)
+
+        for start in range (0, len(blocks), M10Client._PIPELINE_BLOCKS):
+            end = min(start + M10Client._PIPELINE_BLOCKS, len(blocks))
+            buffer = take()
+
+            for i in range (start, end):
+                block_addr = (addr + blocks[i] * ext_len) & 0xFFFFFFFF
+                pos = (i - start) * frame_len
+
+                buffer[pos : pos + sync_len] = M10Client._CMD_SYNC
+                buffer[pos + sync_len] = M10Client._CMD_TYPE_MEM_WRITE_EXT
+                buffer[pos + sync_len + 1 : pos + sync_len + 5] = block_addr.to_bytes (4, "big")
+                buffer[pos + sync_len + 5 : pos + frame_len - 2] = view[blocks[i] * ext_len : (blocks[i] + 1) * ext_len]
+                buffer[pos + frame_len - 2 : pos + frame_len] = bytes(self._crc16_ccitt.get_crc (buffer[pos : pos + frame_len - 2]))
+
+            yield start, end, buffer
+
+    def _write_image_journal (self, data, addr, progress, journal):
+        ext_len = M10Client._EXT_DATA_LEN
+        num_of_ext_frames = len(data) // ext_len
+
+        while (True):
+            blocks = journal.begin_write (data, addr)
+            tail = [block for block in blocks if (block >= num_of_ext_frames)]
+
+            self.write_blocks (data, blocks[0 : len(blocks) - len(tail)], progress, addr, journal)
+
+            for block in tail:
+                for offset in range (block * ext_len, len(data)):
+                    self.write8 (addr + offset, data[offset])
+                journal.mark (block)
+
+            journal.flush()
+
+            # the tail (less than a block) was checked byte by byte
+            crc = self.sram_crc (addr, num_of_ext_frames)
+            if ((crc is None) or (crc == self.image_crc (data[0 : num_of_ext_frames * ext_len]))):
+                break
+
+            if (not journal.resumed):
+                raise M10LinkError ("the SRAM does not match the image after writing it")
+
+            # the SRAM changed since the interrupted transfer, start over
+            journal.restart()
+
+        journal.finish()
+
+    def read_image (self, length = SRAM_SIZE, addr = 0, progress = None, journal = None, sink = None):
+        if (journal is not None):
+            return self._read_image_journal (length, addr, progress, journal, sink)
+
+        ext_len = M10Client._EXT_DATA_LEN
+        data = bytearray()
+
+        while (len(data) < length):
+            num_of_blocks = min(self.fec_group, (length - len(data) + ext_len - 1) // ext_len)
+            group = None
+
+            if ((num_of_blocks > 1) and (self.fec_supported is not False)):
+                group = self._read_group (addr + len(data), num_of_blocks)
+
+            if (group is None):
+                group = self.read_ext (addr + len(data))
+
+            if (sink):
+                sink (len(data), group)
+
+            data += group
+
+            if (progress):
+                progress (min(len(data), length), length)
+
+        del data[length:]
+
+        return data
+
+    def _read_image_journal (self, length, addr, progress, journal, sink):
+        ext_len = M10Client._EXT_DATA_LEN
+        num_of_ext_frames = length // ext_len
+
+        while (True):
+            blocks = journal.begin_read (length, addr)
+
+            # the missing blocks are zero, until they are read
+            if (journal.resumed and sink):
+                sink (0, bytes(journal.data))
+
+            consecutive = M10Client._consecutive (blocks)
+            total = len(blocks)
+
+            i = 0
+            while (i < total):
+                block = blocks[i]
+                num_of_blocks = min(self.fec_group, consecutive[i])
+                group = None
+
+                if ((num_of_blocks > 1) and (self.fec_supported is not False)):
+                    group = self._read_group (addr + block * ext_len, num_of_blocks)
+
+                if (group is None):
+                    num_of_blocks = 1
+                    group = self.read_ext (addr + block * ext_len)
+
+                for j in range (num_of_blocks):
+                    journal.mark (block + j, group[j * ext_len : (j + 1) * ext_len])
+
+                if (sink):
+                    sink (block * ext_len, group)
+
+                i = i + num_of_blocks
+
+                if (progress):
+                    progress (i * ext_len, total * ext_len)
+
+            journal.flush()
+
+            crc = self.sram_crc (addr, num_of_ext_frames)
+            if ((crc is None) or (crc == self.image_crc (journal.data[0 : num_of_ext_frames * ext_len]))):
+                break
+
+            if (not journal.resumed):
+                raise M10LinkError ("the SRAM changed while it was read")
+
+            # the SRAM changed since the interrupted transfer, start over
+            journal.restart()
+
+        data = bytearray(journal.data[0 : length])
+        journal.finish()
+
+        return data
+
+    #========================================================================
+    # load / save : linear 16 bit samples, mu-law in the SRAM.
+    #   load can also store IMA ADPCM (two samples per byte), in which case
+    #   the sketch is switched over to it once the samples are in.
+    #   save decodes the blocks in a consumer thread as they are read. If
+    #   the length is not known from a record() of this session, a journal
+    #   left by an interrupted save gives it, so that save is resumed
+    #========================================================================
+
+    def load (self, samples, progress = None, codec = CODEC_MULAW, journal = None):
+        if (codec == M10Client.CODEC_IMA_ADPCM):
+            image = self._wave.ima_adpcm_encode (samples)
+        else:
+            image = self._wave.mulaw_encode (samples)
+
+        # what does not fit would wrap over the start of the SRAM
+        self.write_image (image[0 : M10Client.SRAM_SIZE], 0, progress, journal)
+
+        if ((codec != self.codec) and ((codec != M10Client.CODEC_MULAW) or (self.codec is not None))):
+            self.set_codec (codec)
+
+    def save (self, num_of_samples = None, progress = None, journal = None):
+        if ((num_of_samples is None) and (self.recorded_length is None) and (journal is not None)):
+            num_of_samples = journal.read_length (0)
+
+        if (num_of_samples is None):
+            num_of_samples = self.content_length()
+
+        samples = array('h', bytes(2 * num_of_samples))
+
+        def decode (item):
+            offset, data = item
+            data = data[0 : num_of_samples - offset]
+            samples[offset : offset + len(data)] = self._wave.mulaw_decode (data)
+
+        with Consumer (decode, name = "M10Client decoder") as decoder:
+            self.saved_image = self.read_image (num_of_samples, 0, progress, journal,
+                                                lambda offset, data: decoder.put ((offset, data)))
+            decoder.finish()
+
+        return samples
+
+    #========================================================================
+    # play / stop / record
+    #========================================================================
+
+    def play (self):
+        frame = self._frame (M10Client._CMD_TYPE_CMD_PLAY, 0xdeadbeef, b"\x99\x88")
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, 0xdeadbeef)
+
+    #========================================================================
+    # play_clip
+    #------------------------------------------------------------------------
+    #  Remarks: play clip index of the clip library in the SRAM (see
+    #  M10Library.py). Sketches without CMD_PLAY_CLIP never answer it, so
+    #  the first one is only tried once.
+    #========================================================================
+
+    def play_clip (self, index):
+        if (self.clips_supported is False):
+            raise M10LinkError ("the sketch does not support clip libraries")
+
+        frame = self._frame (M10Client._CMD_TYPE_CMD_PLAY_CLIP, 0xdeadbeef, bytes([0, index & 0xFF]))
+
+        if (self.clips_supported):
+            ret = self._transact (frame, M10Client._FRAME_REPLY_LEN, 0xdeadbeef)
+        else:
+            try:
+                ret = self._transact_once (frame, M10Client._FRAME_REPLY_LEN, 0xdeadbeef)
+            except M10LinkError as e:
+                self.clips_supported = False
+                raise M10LinkError ("the sketch does not support clip libraries") from e
+
+            self.clips_supported = True
+
+        if (int.from_bytes (ret[len(M10Client._CMD_SYNC) + 1 : len(M10Client._CMD_SYNC) + 3], "big") == M10Client._REPLY_NO_CLIP):
+            raise M10Error ("there is no clip {0:d} in the SRAM".format(index))
+
+    def stop (self):
+        self._port().write (b" \n")
+
+    def volume_up (self):
+        self._port().write (b"+\n")
+
+    def volume_down (self):
+        self._port().write (b"-\n")
+
+    def record (self, seconds = 16, progress = None):
+        max_seconds = M10Client.SRAM_SIZE // M10Client._RECORD_TICK_SAMPLES
+        seconds = max(0, min(int(seconds), max_seconds))
+
+        frame = self._frame (M10Client._CMD_TYPE_CMD_RECORD, 0xdeadbeef, b"\x99\x88")
+        self._transact (frame, M10Client._FRAME_REPLY_LEN, 0xdeadbeef)
+
+        # the sketch records in mu-law, and switches to it from ADPCM
+        if (self.codec == M10Client.CODEC_IMA_ADPCM):
+            self.codec = M10Client.CODEC_MULAW
+
+        port = self._port()
+        ticks = 0
+
+        # one '\n' a second
+        self._set_read_timeout (self.timeout)
+
+        try:
+            for i in range (seconds):
+                if (progress):
+                    progress (i, seconds)
+
+                if (port.read (1)):
+                    ticks = ticks + 1
+        finally:
+            port.write (b"   \n")
+
+        port.flush()
+        sleep (M10Client._RECORD_STOP_SETTLE)
+        port.reset_input_buffer()
+
+        self.recorded_length = self.stored_length()
+        if (self.recorded_length is None):
+            self.recorded_length = ticks * M10Client._RECORD_TICK_SAMPLES
+
+        if (progress):
+            progress (seconds, seconds)
+
+    #========================================================================
+    # stored_length
+    #------------------------------------------------------------------------
+    #  Remarks: mem_addr of the sketch, which is the number of bytes
+    #  recorded after a recording. None if the sketch can not tell.
+    #  Sketches without CMD_GET_LENGTH never answer it, so the first one is
+    #  only tried once
+    #========================================================================
+
+    def stored_length (self):
+        if (self.length_supported is False):
+            return None
+
+        frame = self._frame (M10Client._CMD_TYPE_CMD_GET_LENGTH, 0, b"\x12\x34")
+
+        if (self.length_supported):
+            ret = self._transact (frame, M10Client._FRAME_REPLY_LEN, 0)
+        else:
+            try:
+                ret = self._transact_once (frame, M10Client._FRAME_REPLY_LEN, 0)
+            except M10LinkError:
+                self.length_supported = False
+                return None
+
+            self.length_supported = True
+
+        return int.from_bytes (ret[len(M10Client._CMD_SYNC) + 3 : len(M10Client._CMD_SYNC) + 7], "big")
+
+    #========================================================================
+    # content_length
+    #------------------------------------------------------------------------
+    #  Remarks: bytes save() reads by default. That is the length of the
+    #  last record() of this session, or else what the sketch says
+    #  (stored_length), so a new session after a recording does not read
+    #  the whole SRAM. After a load that is where the sketch stops playing.
+    #  The whole SRAM if neither is known
+    #========================================================================
+
+    def content_length (self):
+        if (self.recorded_length is None):
+            length = self.stored_length()
+            if (length is not None):
+                self.recorded_length = min(length, M10Client.SRAM_SIZE)
+
+        return M10Client.SRAM_SIZE if (self.recorded_length is None) else self.recorded_length
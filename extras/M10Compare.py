@@ -0,0 +1,483 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Compare : compare a capture with its reference clip
+#
+# Remarks:
+#   For the record / playback production test. The capture is aligned with
+#   the reference by FFT cross correlation, and then measured:
+#     correlation       : normalized peak of the cross correlation
+#     snr               : reference (scaled by the best fit gain) against
+#                         what is left of the capture, in dB
+#     level_diff        : RMS level of the capture minus the reference, dB
+#     spectral_distance : RMS difference of the band spectra of the two,
+#                         after removing the level difference, in dB
+#     thd               : harmonic distortion of the capture, in percent.
+#                         Only meaningful when the reference is a tone
+#   and each is checked against a threshold.
+#
+#   Everything is O(n log n). numpy is used if it is installed, for the
+#   FFTs and the sums over the aligned samples, or else a radix-2 FFT in
+#   Python, which packs the two real signals into a single complex FFT.
+#   Batches of captures are spread over a process pool.
+#
+# Usage:
+#   Python M10Compare.py reference.wav capture1.wav capture2.wav ...
+#   Python M10Compare.py reference.wav captures/ --jobs 8 --json
+###############################################################################
+
+import argparse
+import cmath
+import json
+import math
+import os
+import sys
+
+from M10Errors import M10Error
+from wave_file import _wave_file
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SAMPLE_RATE = 8000
+
+DEFAULT_THRESHOLDS = {
+    'min_correlation'       : 0.5,
+    'min_snr'               : 20.0,
+    'max_level_diff'        : 6.0,
+    'max_spectral_distance' : 3.0,
+    'max_thd'               : None
+}
+
+_NUM_OF_BANDS = 32
+
+# bands this far below the loudest band of the reference are not compared
+_BAND_FLOOR_DB = 50.0
+
+# harmonics 2 to 5, each summed over the peak bin +/- _PEAK_BINS
+_HARMONICS = 5
+_PEAK_BINS = 2
+
+#============================================================================
+# _fft : iterative radix-2 FFT of a list of complex, length a power of 2.
+#   Each stage is done with slices, over the blocks or over the butterflies
+#   of a block, whichever gives the longer slices
+#============================================================================
+
+def _fft (values, inverse = 0):
+    n = len(values)
+    a = list(values)
+
+    j = 0
+    for i in range (1, n):
+        bit = n >> 1
+        while (j & bit):
+            j = j ^ bit
+            bit = bit >> 1
+        j = j | bit
+
+        if (i < j):
+            a[i], a[j] = a[j], a[i]
+
+    sign = 2j * cmath.pi * (1 if inverse else -1)
+    size = 2
+
+    while (size <= n):
+        half = size >> 1
+        twiddles = [cmath.exp(sign * k / size) for k in range (half)]
+
+        if (half < n // size):
+            for k in range (half):
+                t = twiddles[k]
+                u = a[k::size]
+                v = [x * t for x in a[k + half::size]]
+                a[k::size] = [p + q for p, q in zip(u, v)]
+                a[k + half::size] = [p - q for p, q in zip(u, v)]
+        else:
+            for start in range (0, n, size):
+                u = a[start : start + half]
+                v = [x * t for x, t in zip(a[start + half : start + size], twiddles)]
+                a[start : start + half] = [p + q for p, q in zip(u, v)]
+                a[start + half : start + size] = [p - q for p, q in zip(u, v)]
+
+        size = size << 1
+
+    if (inverse):
+        a = [x / n for x in a]
+
+    return a
+
+#============================================================================
+# _fft_pair : spectra of two real sequences, zero padded to n, with one
+#   complex FFT. Only bins 0 to n/2 are returned
+#============================================================================
+
+def _fft_pair (a, b, n):
+    z = [complex(x, y) for x, y in zip(a, b)]
+
+    if (len(a) > len(b)):
+        z.extend (complex(x, 0) for x in a[len(b):])
+    elif (len(b) > len(a)):
+        z.extend (complex(0, y) for y in b[len(a):])
+
+    z.extend ([0j] * (n - len(z)))
+    z = _fft (z)
+
+    spectrum_a = []
+    spectrum_b = []
+
+    for k in range (n // 2 + 1):
+        zk = z[k]
+        zc = z[-k].conjugate()
+        spectrum_a.append ((zk + zc) * 0.5)
+        spectrum_b.append ((zk - zc) * -0.5j)
+
+    return spectrum_a, spectrum_b
+
+def _next_power_of_2 (n):
+    return 1 << max(0, (n - 1).bit_length())
+
+#============================================================================
+# _cross_correlation : c[lag] = sum of capture[t] * reference[t - lag],
+#   for lag from -(len(reference) - 1) to len(capture) - 1.
+#   Returns the lag of the peak and its value
+#============================================================================
+
+def _cross_correlation (reference, capture):
+    n = _next_power_of_2 (len(reference) + len(capture) - 1)
+
+    if (numpy is not None):
+        r = numpy.fft.rfft (numpy.asarray(reference, dtype = numpy.float64), n)
+        c = numpy.fft.rfft (numpy.asarray(capture, dtype = numpy.float64), n)
+        correlation = numpy.fft.irfft (c * numpy.conj(r), n)
+        correlation = numpy.concatenate ((correlation[n - len(reference) + 1:], correlation[0 : len(capture)]))
+
+        peak = int(numpy.argmax (correlation))
+        return peak - (len(reference) - 1), float(correlation[peak])
+
+    r, c = _fft_pair (reference, capture, n)
+    half = [x * y.conjugate() for x, y in zip(c, r)]
+
+    # rebuild the upper half from the symmetry of a real signal
+    spectrum = half + [x.conjugate() for x in reversed(half[1 : n // 2])]
+    correlation = _fft (spectrum, 1)
+
+    best_lag = 0
+    best = None
+
+    for lag in range (-(len(reference) - 1), len(capture)):
+        value = correlation[lag % n].real
+        if ((best is None) or (value > best)):
+            best = value
+            best_lag = lag
+
+    return best_lag, best
+
+#============================================================================
+# _band_powers : Hann windowed power spectra of two aligned segments,
+#   summed into _NUM_OF_BANDS bands, and the power spectrum of the second
+#============================================================================
+
+def _band_powers (reference, capture):
+    m = len(reference)
+    n = _next_power_of_2 (m)
+    window = [0.5 - 0.5 * math.cos(2 * math.pi * i / max(m - 1, 1)) for i in range (m)]
+
+    if (numpy is not None):
+        window = numpy.asarray (window)
+        power_r = numpy.abs (numpy.fft.rfft (numpy.asarray(reference, dtype = numpy.float64) * window, n)) ** 2
+        power_c = numpy.abs (numpy.fft.rfft (numpy.asarray(capture, dtype = numpy.float64) * window, n)) ** 2
+        power_r = power_r.tolist()
+        power_c = power_c.tolist()
+    else:
+        r, c = _fft_pair ([x * w for x, w in zip(reference, window)], [x * w for x, w in zip(capture, window)], n)
+        power_r = [abs(x) ** 2 for x in r]
+        power_c = [abs(x) ** 2 for x in c]
+
+    num_of_bins = len(power_r)
+    bands_r = []
+    bands_c = []
+
+    for band in range (_NUM_OF_BANDS):
+        start = 1 + band * (num_of_bins - 1) // _NUM_OF_BANDS
+        end = 1 + (band + 1) * (num_of_bins - 1) // _NUM_OF_BANDS
+        bands_r.append (sum(power_r[start : end]))
+        bands_c.append (sum(power_c[start : end]))
+
+    return bands_r, bands_c, power_c
+
+#============================================================================
+# _spectral_distance : RMS of the dB difference of the bands, around its
+#   mean, over the bands that are not too far below the loudest one
+#============================================================================
+
+def _spectral_distance (bands_r, bands_c):
+    loudest = max(bands_r)
+    if (loudest <= 0):
+        return 0.0
+
+    diffs = []
+    for r, c in zip(bands_r, bands_c):
+        if ((r > 0) and (10 * math.log10(loudest / r) < _BAND_FLOOR_DB)):
+            diffs.append (10 * math.log10(max(c, 1e-12) / r))
+
+    if (not diffs):
+        return 0.0
+
+    mean = sum(diffs) / len(diffs)
+
+    return math.sqrt (sum((d - mean) ** 2 for d in diffs) / len(diffs))
+
+#============================================================================
+# _thd : harmonics 2 to _HARMONICS against the strongest peak, in percent
+#============================================================================
+
+def _thd (power):
+    start = _PEAK_BINS + 1
+    if (len(power) <= start):
+        return 0.0
+
+    fundamental = max(range (start, len(power)), key = power.__getitem__)
+
+    def peak_power (k):
+        return sum(power[max(0, k - _PEAK_BINS) : k + _PEAK_BINS + 1])
+
+    p1 = peak_power (fundamental)
+    if (p1 <= 0):
+        return 0.0
+
+    harmonics = 0.0
+    for h in range (2, _HARMONICS + 1):
+        if (h * fundamental + _PEAK_BINS < len(power)):
+            harmonics = harmonics + peak_power (h * fundamental)
+
+    return 100.0 * math.sqrt (harmonics / p1)
+
+def _db (ratio):
+    return 10 * math.log10 (ratio) if (ratio > 0) else -math.inf
+
+#============================================================================
+# compare
+#------------------------------------------------------------------------
+# Remarks: reference and capture are linear 16 bit samples at the same
+#   rate (what M10Client.save() returns, for instance). Returns a dict of
+#   the measurements, with "passed" and the list of "failures"
+#============================================================================
+
+def compare (reference, capture, thresholds = None, sample_rate = SAMPLE_RATE):
+    limits = dict(DEFAULT_THRESHOLDS)
+    if (thresholds):
+        limits.update (thresholds)
+
+    if ((len(reference) == 0) or (len(capture) == 0)):
+        raise M10Error ("nothing to compare")
+
+    lag, peak = _cross_correlation (reference, capture)
+
+    # the overlapping part, with the capture moved back by lag
+    r_start = max(0, -lag)
+    c_start = max(0, lag)
+    m = min(len(reference) - r_start, len(capture) - c_start)
+
+    r = reference[r_start : r_start + m]
+    c = capture[c_start : c_start + m]
+
+    if (numpy is not None):
+        r = numpy.asarray (r, dtype = numpy.float64)
+        c = numpy.asarray (c, dtype = numpy.float64)
+
+        energy_r = float(numpy.dot (r, r))
+        energy_c = float(numpy.dot (c, c))
+        cross = float(numpy.dot (r, c))
+
+        gain = cross / energy_r if (energy_r > 0) else 0.0
+        d = c - gain * r
+        residual = float(numpy.dot (d, d))
+    else:
+        energy_r = sum(x * x for x in r)
+        energy_c = sum(x * x for x in c)
+        cross = sum(x * y for x, y in zip(r, c))
+
+        gain = cross / energy_r if (energy_r > 0) else 0.0
+        residual = sum((y - gain * x) ** 2 for x, y in zip(r, c))
+
+    signal = gain * gain * energy_r
+
+    bands_r, bands_c, power_c = _band_powers (r, c)
+
+    result = {
+        'lag'               : lag,
+        'lag_ms'            : 1000.0 * lag / sample_rate,
+        'overlap'           : m,
+        'correlation'       : cross / math.sqrt(energy_r * energy_c) if (energy_r * energy_c > 0) else 0.0,
+        'gain'              : gain,
+        'snr'               : _db (signal / residual) if (residual > 0) else (math.inf if (signal > 0) else -math.inf),
+        'reference_level'   : _db (energy_r / m / 32768.0 ** 2),
+        'capture_level'     : _db (energy_c / m / 32768.0 ** 2),
+        'spectral_distance' : _spectral_distance (bands_r, bands_c),
+        'thd'               : _thd (power_c)
+    }
+
+    result['level_diff'] = result['capture_level'] - result['reference_level']
+
+    failures = []
+
+    if (result['correlation'] < limits['min_correlation']):
+        failures.append ("correlation {0:.2f} < {1}".format(result['correlation'], limits['min_correlation']))
+
+    if (result['snr'] < limits['min_snr']):
+        failures.append ("snr {0:.1f} dB < {1} dB".format(result['snr'], limits['min_snr']))
+
+    if (abs(result['level_diff']) > limits['max_level_diff']):
+        failures.append ("level off by {0:.1f} dB".format(result['level_diff']))
+
+    if (result['spectral_distance'] > limits['max_spectral_distance']):
+        failures.append ("spectral distance {0:.1f} dB > {1} dB".format(result['spectral_distance'], limits['max_spectral_distance']))
+
+    if ((limits['max_thd'] is not None) and (result['thd'] > limits['max_thd'])):
+        failures.append ("thd {0:.2f}% > {1}%".format(result['thd'], limits['max_thd']))
+
+    result['passed'] = not failures
+    result['failures'] = failures
+
+    return result
+
+#============================================================================
+# format_result
+#============================================================================
+
+def format_result (result):
+    return ("{0}  lag {1:+.1f} ms, corr {2:.3f}, snr {3:.1f} dB, level {4:+.1f} dB, "
+            "spectral {5:.1f} dB, thd {6:.2f}%{7}").format(
+            "PASS" if result['passed'] else "FAIL", result['lag_ms'], result['correlation'],
+            result['snr'], result['level_diff'], result['spectral_distance'], result['thd'],
+            "" if result['passed'] else "  (" + ", ".join(result['failures']) + ")")
+
+#============================================================================
+# json_result : result with the measurements that are not finite (snr of
+#   an exact match, levels of silence) as null, as JSON has no Infinity
+#============================================================================
+
+def json_result (result):
+    return {name : (None if (isinstance (value, float) and not math.isfinite (value)) else value)
+            for name, value in result.items()}
+
+#============================================================================
+# load_samples : a WAV file as linear 16 bit samples at SAMPLE_RATE
+#============================================================================
+
+def load_samples (file_name):
+    wave_file = _wave_file (file_name)
+    samples = wave_file._data_extract (0)
+    samples = wave_file.to_linear16 (samples, wave_file.bits_per_sample)
+
+    return wave_file.resample (samples, wave_file.sample_rate, SAMPLE_RATE)
+
+
+#############################################################################
+# batch : the reference is handed to each worker process once
+#############################################################################
+
+_reference = None
+_thresholds = None
+
+def _init_worker (reference, thresholds):
+    global _reference, _thresholds
+
+    _reference = reference
+    _thresholds = thresholds
+
+def _compare_file (capture_file):
+    try:
+        return capture_file, compare (_reference, load_samples (capture_file), _thresholds), None
+    except (M10Error, OSError) as e:
+        return capture_file, None, str(e)
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    from wav_batch import find_inputs
+
+    parser = argparse.ArgumentParser(description="compare captures with a reference clip")
+    parser.add_argument("reference")
+    parser.add_argument("captures", nargs="+", help="WAV files, directories or glob patterns")
+    parser.add_argument("--jobs", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--json", action="store_true", help="one JSON object per capture")
+
+    for name, value in DEFAULT_THRESHOLDS.items():
+        parser.add_argument("--" + name, type=float, default=value)
+
+    args = parser.parse_args()
+
+    # only the command line needs worker processes, and importing them is
+    # most of the import time of this module
+    from concurrent.futures import ProcessPoolExecutor
+
+    thresholds = {name : getattr(args, name) for name in DEFAULT_THRESHOLDS}
+    captures = find_inputs (args.captures)
+
+    if (not captures):
+        print ("no captures in", " ".join(args.captures))
+        sys.exit(1)
+
+    try:
+        reference = load_samples (args.reference)
+    except (M10Error, OSError) as e:
+        print (args.reference, ":", e)
+        sys.exit(1)
+
+    if (len(reference) == 0):
+        print (args.reference, ": no samples")
+        sys.exit(1)
+
+    jobs = args.jobs or os.cpu_count() or 1
+    chunk_size = max(1, len(captures) // (4 * jobs))
+    failed = 0
+
+    with ProcessPoolExecutor (max_workers = jobs, initializer = _init_worker,
+                              initargs = (reference, thresholds)) as executor:
+        for capture_file, result, error in executor.map (_compare_file, captures, chunksize = chunk_size):
+            if (result is None):
+                failed = failed + 1
+                result = {'passed' : False, 'failures' : [error]}
+                line = "FAIL  " + error
+            else:
+                failed = failed + (not result['passed'])
+                line = format_result (result)
+
+            if (args.json):
+                print (json.dumps (dict(json_result (result), file = capture_file), allow_nan = False))
+            else:
+                print (capture_file, ":", line)
+
+    if (not args.json):
+        print ("{0:d} of {1:d} passed".format(len(captures) - failed, len(captures)))
+
+    if (failed):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10DSP : conditioning of the samples before they are mu-law encoded
+#
+# Remarks:
+#   The chain, in order:
+#     pre-emphasis : y[n] = x[n] - a * x[n - 1], lifts the highs that the
+#                    small speaker of the board loses (0 is off)
+#     gain         : fixed gain in dB, on top of the normalization
+#     normalize    : 'peak' brings the peak, 'rms' the RMS level, to target
+#                    dBFS. The level is measured by a scan pass over the
+#                    (pre-emphasized) samples before they are processed
+#     limiter      : above limit dBFS, the level is bent over with tanh so
+#                    it never reaches full scale (None for a hard clip)
+#
+#   Samples go through in blocks of BLOCK_SIZE, with the pre-emphasis state
+#   carried from block to block, so memory does not grow with the length
+#   of the clip. Each block is done with numpy if it is installed (imported
+#   on first use), or else with one pass of plain Python.
+#
+# Usage:
+#   Python M10DSP.py in.wav out.wav --normalize rms --target -18 --limit -3
+###############################################################################
+
+import argparse
+import math
+import sys
+
+from array import array
+
+from M10Errors import M10Error
+from wave_file import _wave_file
+
+# numpy is imported on first use, as wav_console loads this module on
+# start up, and numpy would be most of its start up time
+_numpy_module = None
+
+def _numpy ():
+    global _numpy_module
+
+    if (_numpy_module is None):
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+
+    return _numpy_module or None
+
+SAMPLE_RATE = 8000
+
+BLOCK_SIZE = 4096
+
+FULL_SCALE = 32767
+
+NORMALIZE_MODES = ('peak', 'rms')
+
+DEFAULT_TARGET = {
+    'peak' : -1.0,
+    'rms'  : -20.0
+}
+
+#============================================================================
+# dB conversions, against full scale
+#============================================================================
+
+def db_to_gain (db):
+    return 10 ** (db / 20)
+
+def gain_to_db (gain):
+    return 20 * math.log10(gain) if (gain > 0) else -math.inf
+
+#############################################################################
+# DSP_Chain
+#############################################################################
+
+class DSP_Chain:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    gain_db      : fixed gain
+    #    normalize    : None, 'peak' or 'rms'
+    #    target_db    : level to normalize to, dBFS (None for the default
+    #                   of the mode)
+    #    limit_db     : threshold of the soft limiter, dBFS, None for off
+    #    pre_emphasis : coefficient a, 0 for off
+    #========================================================================
+
+    def __init__ (self, gain_db = 0.0, normalize = None, target_db = None, limit_db = None, pre_emphasis = 0.0):
+        if ((normalize is not None) and (normalize not in NORMALIZE_MODES)):
+            raise M10Error ("normalize takes {0}".format(" or ".join(NORMALIZE_MODES)))
+
+        if ((pre_emphasis < 0) or (pre_emphasis >= 1)):
+            raise M10Error ("pre-emphasis takes 0 to 1 (exclusive)")
+
+        if ((limit_db is not None) and (limit_db >= 0)):
+            raise M10Error ("the limit is below 0 dBFS")
+
+        self.gain_db = gain_db
+        self.normalize = normalize
+        self.target_db = target_db
+        self.limit_db = limit_db
+        self.pre_emphasis = pre_emphasis
+
+        # results of the last process()
+        self.peak = 0
+        self.rms = 0.0
+        self.applied_gain_db = 0.0
+        self.limited = 0
+        self.clipped = 0
+
+    @property
+    def active (self):
+        return ((self.gain_db != 0) or (self.normalize is not None) or
+                (self.limit_db is not None) or (self.pre_emphasis != 0))
+
+    def describe (self):
+        if (not self.active):
+            return "off"
+
+        parts = []
+        if (self.pre_emphasis):
+            parts.append ("pre-emphasis {0:g}".format(self.pre_emphasis))
+        if (self.gain_db):
+            parts.append ("gain {0:+g} dB".format(self.gain_db))
+        if (self.normalize is not None):
+            parts.append ("{0} to {1:g} dBFS".format(self.normalize, self._target_db()))
+        if (self.limit_db is not None):
+            parts.append ("limit {0:g} dBFS".format(self.limit_db))
+
+        return ", ".join(parts)
+
+    def _target_db (self):
+        return DEFAULT_TARGET[self.normalize] if (self.target_db is None) else self.target_db
+
+    #========================================================================
+    # _blocks : the samples, pre-emphasized, as float blocks (numpy) or
+    #   lists (plain Python)
+    #========================================================================
+
+    def _blocks (self, samples):
+        numpy = _numpy()
+        a = self.pre_emphasis
+        previous = 0.0
+
+        for start in range (0, len(samples), BLOCK_SIZE):
+            block = samples[start : start + BLOCK_SIZE]
+
+            if (numpy is not None):
+                x = numpy.asarray (block, dtype = numpy.float64)
+                if (a):
+                    y = x.copy()
+                    y[0] -= a * previous
+                    y[1:] -= a * x[:-1]
+                    previous = x[-1]
+                    x = y
+            elif (a):
+                x = [i - a * j for i, j in zip(block, [previous] + list(block[:-1]))]
+                previous = block[-1]
+            else:
+                x = block
+
+            yield x
+
+    #========================================================================
+    # scan : peak and RMS of the pre-emphasized samples, in one pass
+    #========================================================================
+
+    def scan (self, samples):
+        numpy = _numpy()
+        peak = 0.0
+        squares = 0.0
+
+        for x in self._blocks (samples):
+            if (numpy is not None):
+                peak = max(peak, float(numpy.max (numpy.abs (x))))
+                squares = squares + float(numpy.dot (x, x))
+            else:
+                peak = max(peak, max(map(abs, x)))
+                squares = squares + math.fsum(i * i for i in x)
+
+        rms = math.sqrt(squares / len(samples)) if (len(samples)) else 0.0
+
+        return peak, rms
+
+    #========================================================================
+    # _gain : linear gain of the normalization and the fixed gain
+    #========================================================================
+
+    def _gain (self, peak, rms):
+        gain = db_to_gain (self.gain_db)
+
+        if (self.normalize is not None):
+            level = peak if (self.normalize == 'peak') else rms
+            if (level > 0):
+                gain = gain * db_to_gain (self._target_db()) * FULL_SCALE / level
+
+        return gain
+
+    #========================================================================
+    # process : the samples through the chain, as array('h')
+    #========================================================================
+
+    def process (self, samples):
+        self.limited = 0
+        self.clipped = 0
+
+        if (not self.active):
+            self.applied_gain_db = 0.0
+            return array('h', samples)
+
+        if (self.normalize is not None):
+            self.peak, self.rms = self.scan (samples)
+
+        gain = self._gain (self.peak, self.rms)
+        self.applied_gain_db = gain_to_db (gain)
+
+        numpy = _numpy()
+
+        out = array('h')
+        for x in self._blocks (samples):
+            if (numpy is not None):
+                out.frombytes (self._process_numpy (x, gain).tobytes())
+            else:
+                out.extend (self._process_list (x, gain))
+
+        return out
+
+    def _process_numpy (self, x, gain):
+        numpy = _numpy()
+        y = x * gain
+
+        if (self.limit_db is not None):
+            threshold = db_to_gain (self.limit_db) * FULL_SCALE
+            knee = FULL_SCALE - threshold
+
+            magnitude = numpy.abs (y)
+            over = magnitude > threshold
+            self.limited = self.limited + int(numpy.count_nonzero (over))
+
+            y[over] = numpy.sign (y[over]) * (threshold + knee * numpy.tanh ((magnitude[over] - threshold) / knee))
+
+        y = numpy.rint (y)
+        self.clipped = self.clipped + int(numpy.count_nonzero ((y > FULL_SCALE) | (y < -FULL_SCALE - 1)))
+
+        return numpy.clip (y, -FULL_SCALE - 1, FULL_SCALE).astype (numpy.int16)
+
+    def _process_list (self, x, gain):
+        out = []
+
+        if (self.limit_db is not None):
+            threshold = db_to_gain (self.limit_db) * FULL_SCALE
+            knee = FULL_SCALE - threshold
+        else:
+            threshold = math.inf
+
+        for i in x:
+            y = i * gain
+
+            if (abs(y) > threshold):
+                self.limited = self.limited + 1
+                y = math.copysign (threshold + knee * math.tanh ((abs(y) - threshold) / knee), y)
+
+            y = int(round(y))
+            if ((y > FULL_SCALE) or (y < -FULL_SCALE - 1)):
+                self.clipped = self.clipped + 1
+                y = max(-FULL_SCALE - 1, min(FULL_SCALE, y))
+
+            out.append (y)
+
+        return out
+
+    #========================================================================
+    # report : what the last process() did
+    #========================================================================
+
+    def report (self):
+        text = "gain {0:+.1f} dB".format(self.applied_gain_db)
+
+        if (self.limit_db is not None):
+            text = text + ", {0:d} samples limited".format(self.limited)
+        if (self.clipped):
+            text = text + ", {0:d} samples clipped".format(self.clipped)
+
+        return text
+
+#============================================================================
+# set_option : one console setting, from strings. Returns the new chain
+#   (a chain is replaced, never changed, since batch workers hold copies)
+#============================================================================
+
+OPTIONS = ('gain', 'normalize', 'target', 'limit', 'emphasis')
+
+def set_option (chain, name, value):
+    settings = {
+        'gain_db'      : chain.gain_db,
+        'normalize'    : chain.normalize,
+        'target_db'    : chain.target_db,
+        'limit_db'     : chain.limit_db,
+        'pre_emphasis' : chain.pre_emphasis
+    }
+
+    off = value in ("off", "none")
+
+    try:
+        if (name == 'gain'):
+            settings['gain_db'] = 0.0 if off else float(value)
+        elif (name == 'normalize'):
+            settings['normalize'] = None if off else value
+        elif (name == 'target'):
+            settings['target_db'] = None if off else float(value)
+        elif (name == 'limit'):
+            settings['limit_db'] = None if off else float(value)
+        elif (name == 'emphasis'):
+            settings['pre_emphasis'] = 0.0 if off else float(value)
+        else:
+            raise M10Error ("no DSP setting {0}, use one of {1}".format(name, " ".join(OPTIONS)))
+    except ValueError:
+        raise M10Error ("{0} is not a number".format(value))
+
+    return DSP_Chain (**settings)
+
+#============================================================================
+# add_arguments / from_args : the chain as command line options
+#============================================================================
+
+def add_arguments (parser):
+    group = parser.add_argument_group ("sample conditioning (see M10DSP.py)")
+    group.add_argument("--gain", type=float, default=0.0, help="gain in dB")
+    group.add_argument("--normalize", choices=NORMALIZE_MODES, default=None)
+    group.add_argument("--target", type=float, default=None, help="normalization target, dBFS")
+    group.add_argument("--limit", type=float, default=None, help="soft limiter threshold, dBFS")
+    group.add_argument("--emphasis", type=float, default=0.0, help="pre-emphasis coefficient, such as 0.9")
+
+def from_args (args):
+    return DSP_Chain (args.gain, args.normalize, args.target, args.limit, args.emphasis)
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="condition a WAV file the way load_wav does")
+    parser.add_argument("input_file")
+    parser.add_argument("output_file", help="8kHz 16 bit WAV file")
+    add_arguments (parser)
+    args = parser.parse_args()
+
+    try:
+        chain = from_args (args)
+
+        wave_file = _wave_file (args.input_file)
+        samples = wave_file._data_extract (0)
+        samples = wave_file.to_linear16 (samples, wave_file.bits_per_sample)
+        samples = wave_file.resample (samples, wave_file.sample_rate, SAMPLE_RATE)
+
+        samples = chain.process (samples)
+        _wave_file (args.output_file).sample_save_pcm (samples)
+    except (OSError, M10Error) as e:
+        print (e)
+        sys.exit(1)
+
+    print (chain.describe(), ":", chain.report())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,824 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Emulator : the wav_record_playback sketch, in Python
+#
+# Remarks:
+#   A serial port look-alike (write / read / in_waiting / ...) that runs
+#   the same input FSM and play / record FSM as the sketch, on an emulated
+#   SRAM. Hand it to M10Client to use the host tools without a board:
+#
+#       m10 = M10Client("emulator", serial_port = M10Emulator())
+#
+#   There is no real time on the emulator:
+#     - while playing, play_samples(n) returns the next n samples that the
+#       sketch would write to the CODEC. The decoders in here are written
+#       the way the sketch does it, independently of wave_file.py, so they
+#       serve as the reference for the host side codecs
+#     - while recording, every read() that finds nothing to return records
+#       another 8192 samples from record_source and returns the '\n' the
+#       sketch sends for them
+#
+#   The sketch ships with compressedFlag = 0 (16 bit samples), but the host
+#   tools load and save mu-law, so the emulator starts in mu-law mode.
+#
+#   Noisy_Link goes between M10Client and the emulator to flip bits on the
+#   wire, and adds up the time the traffic would take on a real link.
+#
+# Usage:
+#   Python M10Emulator.py verify file.wav [mulaw|adpcm]
+#     loads the file into the emulator and checks that what it plays back
+#     is bit exact with the host side decoder
+#   Python M10Emulator.py bench [fec_group ...]
+#     writes and reads back 32KB over a Noisy_Link, at several bit error
+#     rates, without FEC and with each FEC group size (4 8 16 by default)
+###############################################################################
+
+import math
+import random
+import sys
+
+from CRC16_CCITT import CRC16_CCITT
+from wave_file import _wave_file
+
+#############################################################################
+# constants of the sketch
+#############################################################################
+
+FRAME_SYNC_2 = 0xBA
+FRAME_SYNC_1 = 0xAB
+FRAME_SYNC_0 = 0x11
+
+FRAME_LENGTH = 12
+SYNC_LENGTH = 3
+EXT_FRAME_LENGTH = 128 + FRAME_LENGTH
+
+FRAME_TYPE_MEM_WRITE_WORD = 0x37
+FRAME_TYPE_MEM_WRITE_BYTE = 0x38
+FRAME_TYPE_MEM_WRITE_EXT  = 0x39
+FRAME_TYPE_MEM_WRITE_FEC  = 0x3A
+FRAME_TYPE_MEM_PARITY     = 0x3B
+FRAME_TYPE_REG_BATCH      = 0x3C
+FRAME_TYPE_MEM_READ_WORD  = 0x40
+FRAME_TYPE_MEM_READ_EXT   = 0x41
+FRAME_TYPE_MEM_READ_GROUP = 0x42
+FRAME_TYPE_REG_ACCESS     = 0x44
+FRAME_TYPE_MEM_CRC        = 0x46
+FRAME_TYPE_MEM_FILL       = 0x58
+FRAME_TYPE_CMD_PLAY       = 0x50
+FRAME_TYPE_CMD_RECORD     = 0x52
+FRAME_TYPE_CMD_VOLUME     = 0x54
+FRAME_TYPE_CMD_CODEC      = 0x56
+FRAME_TYPE_CMD_PLAY_CLIP  = 0x5A
+FRAME_TYPE_CMD_GET_LENGTH = 0x5C
+
+FRAME_TYPE_ACK            = 0x34
+FRAME_TYPE_ACK_EXT        = 0x35
+FRAME_TYPE_ACK_PARITY     = 0x36
+
+# frames that carry 128 bytes of data
+_EXT_FRAME_TYPES = (FRAME_TYPE_MEM_WRITE_EXT, FRAME_TYPE_MEM_WRITE_FEC, FRAME_TYPE_MEM_PARITY, FRAME_TYPE_REG_BATCH)
+_FEC_FRAME_TYPES = (FRAME_TYPE_MEM_WRITE_FEC, FRAME_TYPE_MEM_PARITY)
+
+REG_WRITE = 0x80
+REG_BATCH_MAX = 42
+REG_DAC_VOL_CONTROL = 7
+
+# Si3000 registers after CODEC.begin(), see M10CODEC.cpp
+# (the DAC volume is set by CODEC.outputVolume() in setup())
+_SI3000_RESET_VALUES = {1 : 0x10, 2 : 0x00, 3 : 24, 4 : 255, 5 : 0x3A, 6 : 0x7C, 9 : 0x0F}
+
+CODEC_LINEAR    = 0
+CODEC_MULAW     = 1
+CODEC_IMA_ADPCM = 2
+
+SRAM_SIZE = 128 * 1024
+
+# clip library TOC, see M10Library.py
+TOC_MAGIC = b"M10L"
+TOC_VERSION = 1
+TOC_CLIP_TABLE = 8
+TOC_CLIP_ENTRY_SIZE = 12
+TOC_EXTENT_TABLE = 200
+TOC_EXTENT_REPEAT = 0x8000
+
+FEC_NO_GROUP = 0xFFFFFFFF
+
+_INPUT_STATE_IDLE          = 0
+_INPUT_STATE_SYNC_1        = 1
+_INPUT_STATE_SYNC_0        = 2
+_INPUT_STATE_INPUT_WAIT    = 3
+_INPUT_STATE_INPUT_WAIT_EXT = 4
+
+_STATE_UART   = "uart"
+_STATE_PLAY   = "play"
+_STATE_RECORD = "record"
+
+_IMA_INDEX_TABLE = [-1, -1, -1, -1, 2, 4, 6, 8,
+                    -1, -1, -1, -1, 2, 4, 6, 8]
+
+_IMA_STEP_TABLE = _wave_file._IMA_STEP_TABLE
+
+class M10Emulator:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    codec         : initial value of compressedFlag
+    #    record_source : linear samples that the "microphone" picks up,
+    #                    silence if None
+    #    fill          : False to emulate a sketch without MEM_FILL
+    #    fec           : False to emulate a sketch without the FEC frames
+    #    mem_crc       : False to emulate a sketch without MEM_CRC
+    #========================================================================
+
+    def __init__ (self, codec = CODEC_MULAW, record_source = None, fill = True, fec = True, mem_crc = True):
+        self.sram = bytearray(SRAM_SIZE)
+        self.codec = codec
+        self.registers = [_SI3000_RESET_VALUES.get (i, 0) for i in range (32)]
+        self._output_volume (28)
+        self.record_source = record_source
+        self.fill = fill
+        self.fec = fec
+        self.mem_crc = mem_crc
+
+        self.mem_addr = 0
+        self.play_addr = 0
+        self.record_addr = 0
+        self.state = _STATE_UART
+
+        # codec of what is playing, and the clip (None if the whole SRAM)
+        self.play_codec = codec
+        self.clip_index = None
+
+        # group being written with FEC frames
+        self.fec_base = FEC_NO_GROUP
+        self.fec_received = 0
+        self.fec_repaired = 0
+
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.crc_errors = 0
+
+        self._crc16_ccitt = CRC16_CCITT()
+        self._wave = _wave_file()
+        self._out = bytearray()
+        self._record_pos = 0
+
+        self._input_state = _INPUT_STATE_IDLE
+        self._input_data = bytearray(EXT_FRAME_LENGTH)
+        self._input_counter = 0
+
+        self._adpcm_reset()
+
+        self.timeout = 0
+        self.is_open = True
+
+    #========================================================================
+    # serial port interface
+    #========================================================================
+
+    def write (self, data):
+        self.bytes_received = self.bytes_received + len(data)
+
+        for c in bytes(data):
+            self._input (c)
+
+        return len(data)
+
+    def read (self, size = 1):
+        if ((len(self._out) == 0) and (self.state == _STATE_RECORD)):
+            self._record_tick()
+
+        ret = bytes(self._out[0 : size])
+        del self._out[0 : size]
+
+        return ret
+
+    @property
+    def in_waiting (self):
+        return len(self._out)
+
+    def reset_input_buffer (self):
+        self._out = bytearray()
+
+    def flush (self):
+        pass
+
+    def close (self):
+        self.is_open = False
+
+    #========================================================================
+    # _sram_read / _sram_write
+    #========================================================================
+
+    def _sram_read (self, addr):
+        return self.sram[addr % SRAM_SIZE]
+
+    def _sram_write (self, addr, data):
+        self.sram[addr % SRAM_SIZE] = data & 0xFF
+
+    def _sram_read16 (self, addr):
+        return self._sram_read (addr) + (self._sram_read (addr + 1) << 8)
+
+    def _sram_read32 (self, addr):
+        return self._sram_read16 (addr) + (self._sram_read16 (addr + 2) << 16)
+
+    #========================================================================
+    # _send_reply_back
+    #========================================================================
+
+    def _send_reply_back (self, m, n):
+        buf = bytes([FRAME_SYNC_2, FRAME_SYNC_1, FRAME_SYNC_0, FRAME_TYPE_ACK,
+                     (m >> 8) & 0xFF, m & 0xFF,
+                     (n >> 24) & 0xFF, (n >> 16) & 0xFF, (n >> 8) & 0xFF, n & 0xFF])
+
+        self._out += buf
+        self._out += bytes(self._crc16_ccitt.get_crc (buf))
+
+    def _send_ext_reply (self, frame_type, data):
+        buf = bytes([FRAME_SYNC_2, FRAME_SYNC_1, FRAME_SYNC_0, frame_type]) + bytes(data)
+
+        self._out += buf
+        self._out += bytes(self._crc16_ccitt.get_crc (buf))
+
+    #========================================================================
+    # _input : FSM() and input_FSM() of the sketch, one byte at a time
+    #========================================================================
+
+    def _input (self, c):
+        if (self.state == _STATE_UART):
+            ret = self._input_FSM (c)
+
+            if (ret == FRAME_TYPE_CMD_PLAY):
+                self.play_addr = 0
+                self.play_codec = self.codec
+                self.clip_index = None
+                self._adpcm_reset()
+                self.state = _STATE_PLAY
+            elif (ret == FRAME_TYPE_CMD_PLAY_CLIP):
+                self._clip_start (self.clip_index)
+                self.state = _STATE_PLAY
+            elif (ret == FRAME_TYPE_CMD_RECORD):
+                self.record_addr = 0
+                if (self.codec == CODEC_IMA_ADPCM):
+                    self.codec = CODEC_MULAW
+                self.state = _STATE_RECORD
+
+        elif (self.state == _STATE_PLAY):
+            if (c == ord(' ')):
+                self.state = _STATE_UART
+            elif (c == ord('+')):
+                self._output_volume (min(self.volume + 1, 32))
+            elif (c == ord('-')):
+                self._output_volume (max(self.volume - 1, 0))
+
+        elif (self.state == _STATE_RECORD):
+            if (c == ord(' ')):
+                self.mem_addr = self.record_addr
+                self.state = _STATE_UART
+
+    def _input_FSM (self, c):
+        state = self._input_state
+        data = self._input_data
+
+        if (state == _INPUT_STATE_IDLE):
+            self._input_counter = 0
+            if (c == FRAME_SYNC_2):
+                self._input_state = _INPUT_STATE_SYNC_1
+                data[0 : FRAME_LENGTH] = bytes(FRAME_LENGTH)
+                data[0] = c
+                self._input_counter = 1
+
+        elif (state == _INPUT_STATE_SYNC_1):
+            if (c == FRAME_SYNC_1):
+                self._input_state = _INPUT_STATE_SYNC_0
+                data[self._input_counter] = c
+                self._input_counter = self._input_counter + 1
+            else:
+                self._input_state = _INPUT_STATE_IDLE
+
+        elif (state == _INPUT_STATE_SYNC_0):
+            if (c == FRAME_SYNC_0):
+                self._input_state = _INPUT_STATE_INPUT_WAIT
+                data[self._input_counter] = c
+                self._input_counter = self._input_counter + 1
+            else:
+                self._input_state = _INPUT_STATE_IDLE
+
+        elif (state == _INPUT_STATE_INPUT_WAIT):
+            data[self._input_counter] = c
+            self._input_counter = self._input_counter + 1
+
+            if (self._input_counter == FRAME_LENGTH):
+                if ((data[SYNC_LENGTH] in _EXT_FRAME_TYPES) and
+                    (self.fec or (data[SYNC_LENGTH] not in _FEC_FRAME_TYPES))):
+                    self._input_state = _INPUT_STATE_INPUT_WAIT_EXT
+                else:
+                    self._input_state = _INPUT_STATE_IDLE
+                    return self._frame (FRAME_LENGTH - 2)
+
+        elif (state == _INPUT_STATE_INPUT_WAIT_EXT):
+            data[self._input_counter] = c
+            self._input_counter = self._input_counter + 1
+
+            if (self._input_counter == EXT_FRAME_LENGTH - 2):
+                self._input_state = _INPUT_STATE_IDLE
+                return self._frame (EXT_FRAME_LENGTH - 4)
+
+        return 0
+
+    #========================================================================
+    # _frame : the INPUT_STATE_FRAME_TYPE part of input_FSM()
+    #========================================================================
+
+    def _frame (self, crc_offset):
+        data = self._input_data
+        frame_type = data[SYNC_LENGTH]
+
+        crc_received = (data[crc_offset] << 8) + data[crc_offset + 1]
+        crc = self._crc16_ccitt.get_crc (data[0 : crc_offset])
+
+        self.frames_received = self.frames_received + 1
+
+        if (crc_received != (crc[0] << 8) + crc[1]):
+            self.crc_errors = self.crc_errors + 1
+            return 0
+
+        return self._execute (frame_type, data)
+
+    def _execute (self, frame_type, data):
+        start_addr = int.from_bytes (data[SYNC_LENGTH + 1 : SYNC_LENGTH + 5], "big")
+        data_high = data[SYNC_LENGTH + 5]
+        data_low = data[SYNC_LENGTH + 6]
+
+        if (frame_type == FRAME_TYPE_CMD_VOLUME):
+            self._output_volume (min(data_low, 32))
+            self._send_reply_back (0xbeef, start_addr)
+        elif (frame_type == FRAME_TYPE_CMD_CODEC):
+            self.codec = data_low
+            self._send_reply_back (0xbeef, start_addr)
+        elif (frame_type == FRAME_TYPE_CMD_GET_LENGTH):
+            self._send_reply_back (0xbeef, self.mem_addr)
+        elif (frame_type == FRAME_TYPE_MEM_WRITE_BYTE):
+            self._sram_write (start_addr, data_low)
+            self._send_reply_back (data_low, start_addr)
+        elif (frame_type == FRAME_TYPE_MEM_WRITE_WORD):
+            self._sram_write (start_addr, data_low)
+            self._sram_write (start_addr + 1, data_high)
+            self._send_reply_back (data_high * 256 + data_low, start_addr)
+        elif (frame_type == FRAME_TYPE_MEM_READ_WORD):
+            data_low = self._sram_read (start_addr)
+            data_high = self._sram_read (start_addr + 1)
+            self._send_reply_back (data_high * 256 + data_low, start_addr)
+        elif (frame_type == FRAME_TYPE_MEM_WRITE_EXT):
+            for i in range (EXT_FRAME_LENGTH - FRAME_LENGTH):
+                self._sram_write (start_addr + i, data[SYNC_LENGTH + 5 + i])
+            self._send_reply_back (0xabcd, start_addr)
+            self.mem_addr = start_addr
+        elif ((frame_type == FRAME_TYPE_MEM_FILL) and self.fill):
+            for i in range (data_high * (EXT_FRAME_LENGTH - FRAME_LENGTH)):
+                self._sram_write (start_addr + i, data_low)
+            self._send_reply_back (0xabcd, start_addr)
+            if (data_high):
+                self.mem_addr = start_addr + (data_high - 1) * (EXT_FRAME_LENGTH - FRAME_LENGTH)
+        elif (frame_type == FRAME_TYPE_REG_ACCESS):
+            if (start_addr & REG_WRITE):
+                self.registers[start_addr & 0x1F] = data_low
+                self._send_reply_back (data_low, start_addr)
+            else:
+                self._send_reply_back (self.registers[start_addr & 0x1F], start_addr)
+        elif (frame_type == FRAME_TYPE_REG_BATCH):
+            reply = bytearray(128)
+            for j in range (min(start_addr, REG_BATCH_MAX)):
+                register, value = data[SYNC_LENGTH + 5 + j * 3], data[SYNC_LENGTH + 6 + j * 3] * 256 + data[SYNC_LENGTH + 7 + j * 3]
+                if (register & REG_WRITE):
+                    self.registers[register & 0x1F] = value & 0xFF
+                else:
+                    value = self.registers[register & 0x1F]
+                reply[j * 2 : j * 2 + 2] = value.to_bytes (2, "big")
+            self._send_ext_reply (FRAME_TYPE_ACK_EXT, reply)
+        elif ((frame_type == FRAME_TYPE_MEM_WRITE_FEC) and self.fec):
+            self._fec_write (data[SYNC_LENGTH + 1], start_addr & 0x00FFFFFF, data)
+        elif ((frame_type == FRAME_TYPE_MEM_PARITY) and self.fec):
+            self._fec_parity (data[SYNC_LENGTH + 1], start_addr & 0x00FFFFFF, data)
+        elif ((frame_type == FRAME_TYPE_MEM_CRC) and self.mem_crc):
+            length = (data_high * 256 + data_low) * 128
+            crc = self._crc16_ccitt.get_crc ([self._sram_read (start_addr + i) for i in range (length)])
+            self._send_reply_back ((crc[0] << 8) + crc[1], start_addr)
+        elif (frame_type == FRAME_TYPE_MEM_READ_EXT):
+            self._send_ext_reply (FRAME_TYPE_ACK_EXT, [self._sram_read (start_addr + i) for i in range (128)])
+        elif ((frame_type == FRAME_TYPE_MEM_READ_GROUP) and self.fec):
+            start_addr = start_addr & 0x00FFFFFF
+            parity = bytearray(128)
+            for j in range (data[SYNC_LENGTH + 1]):
+                block = [self._sram_read (start_addr + j * 128 + i) for i in range (128)]
+                for i in range (128):
+                    parity[i] = parity[i] ^ block[i]
+                self._send_ext_reply (FRAME_TYPE_ACK_EXT, block)
+            self._send_ext_reply (FRAME_TYPE_ACK_PARITY, parity)
+        elif (frame_type == FRAME_TYPE_CMD_PLAY):
+            self._send_reply_back (0xabcd, start_addr)
+            return FRAME_TYPE_CMD_PLAY
+        elif (frame_type == FRAME_TYPE_CMD_RECORD):
+            self._send_reply_back (0xabcd, start_addr)
+            return FRAME_TYPE_CMD_RECORD
+        elif (frame_type == FRAME_TYPE_CMD_PLAY_CLIP):
+            if (self._clip_valid (data_low)):
+                self.clip_index = data_low
+                self._send_reply_back (0xabcd, start_addr)
+                return FRAME_TYPE_CMD_PLAY_CLIP
+            self._send_reply_back (0xdead, start_addr)
+
+        return 0
+
+    #========================================================================
+    # _output_volume : CODEC.outputVolume()
+    #========================================================================
+
+    def _output_volume (self, volume):
+        self.volume = volume
+
+        if (volume == 0):
+            self.registers[REG_DAC_VOL_CONTROL] = 0
+        else:
+            self.registers[REG_DAC_VOL_CONTROL] = (min(volume - 1, 31) << 2) | 3
+
+    #========================================================================
+    # forward error correction, the FEC frames of the sketch
+    #========================================================================
+
+    def _fec_write (self, j, addr, data):
+        if (self.fec_base != addr - j * 128):
+            self.fec_base = addr - j * 128
+            self.fec_received = 0
+
+        for i in range (128):
+            self._sram_write (addr + i, data[SYNC_LENGTH + 5 + i])
+
+        self.fec_received = self.fec_received | (1 << j)
+
+    def _fec_parity (self, group, addr, data):
+        if (self.fec_base != addr):
+            self.fec_base = addr
+            self.fec_received = 0
+
+        missing = [j for j in range (group) if not (self.fec_received & (1 << j))]
+        mask = sum(1 << j for j in missing)
+
+        if (len(missing) > 1):
+            self._send_reply_back (0x0bad, mask)
+            return
+
+        if (missing):
+            block = bytearray(data[SYNC_LENGTH + 5 : SYNC_LENGTH + 5 + 128])
+            for j in range (group):
+                if (j != missing[0]):
+                    for i in range (128):
+                        block[i] = block[i] ^ self._sram_read (addr + j * 128 + i)
+
+            for i in range (128):
+                self._sram_write (addr + missing[0] * 128 + i, block[i])
+
+            self.fec_repaired = self.fec_repaired + 1
+
+        self._send_reply_back (0xabcd, mask)
+
+        self.mem_addr = addr + (group - 1) * 128
+        self.fec_base = FEC_NO_GROUP
+        self.fec_received = 0
+
+    #========================================================================
+    # clip library, the clip_*() functions of the sketch
+    #========================================================================
+
+    def _clip_valid (self, index):
+        for i in range (len(TOC_MAGIC)):
+            if (self._sram_read (i) != TOC_MAGIC[i]):
+                return 0
+
+        return (self._sram_read (4) == TOC_VERSION) and (index < self._sram_read (5))
+
+    def _clip_start (self, index):
+        entry = TOC_CLIP_TABLE + index * TOC_CLIP_ENTRY_SIZE
+
+        self._clip_extent = self._sram_read16 (entry)
+        self._clip_left = self._sram_read32 (entry + 4)
+        self.play_codec = self._sram_read (entry + 8)
+
+        self._adpcm_reset()
+        self._clip_load_extent (self._clip_extent)
+
+    def _clip_load_extent (self, extent):
+        block = self._sram_read16 (TOC_EXTENT_TABLE + extent * 4)
+        count = self._sram_read16 (TOC_EXTENT_TABLE + extent * 4 + 2)
+
+        self.play_addr = block * 128
+
+        if (count & TOC_EXTENT_REPEAT):
+            self._extent_repeat = count & ~TOC_EXTENT_REPEAT
+            self._extent_end = self.play_addr + 128
+        else:
+            self._extent_repeat = 1
+            self._extent_end = self.play_addr + count * 128
+
+    def _clip_advance (self, num_of_bytes):
+        self._clip_left = self._clip_left - num_of_bytes
+
+        if (self._clip_left <= 0):
+            self._clip_start (self.clip_index)
+        elif (self.play_addr >= self._extent_end):
+            if (self._extent_repeat > 1):
+                self._extent_repeat = self._extent_repeat - 1
+                self.play_addr = self.play_addr - 128
+            else:
+                self._clip_extent = self._clip_extent + 1
+                self._clip_load_extent (self._clip_extent)
+
+    #========================================================================
+    # IMA ADPCM decoder of the sketch
+    #========================================================================
+
+    def _adpcm_reset (self):
+        self._adpcm_predictor = 0
+        self._adpcm_index = 0
+        self._adpcm_byte = 0
+        self._adpcm_phase = 0
+
+    def _ima_adpcm_decode (self, nibble):
+        step = _IMA_STEP_TABLE[self._adpcm_index]
+
+        diff = step >> 3
+        if (nibble & 4):
+            diff = diff + step
+        if (nibble & 2):
+            diff = diff + (step >> 1)
+        if (nibble & 1):
+            diff = diff + (step >> 2)
+
+        if (nibble & 8):
+            self._adpcm_predictor = self._adpcm_predictor - diff
+        else:
+            self._adpcm_predictor = self._adpcm_predictor + diff
+
+        self._adpcm_predictor = max(-32768, min(32767, self._adpcm_predictor))
+        self._adpcm_index = max(0, min(88, self._adpcm_index + _IMA_INDEX_TABLE[nibble]))
+
+        return self._adpcm_predictor
+
+    #========================================================================
+    # play_samples : STATE_PLAY of the sketch, n times
+    #========================================================================
+
+    def play_samples (self, n):
+        out = []
+
+        while ((len(out) < n) and (self.state == _STATE_PLAY)):
+            if (self.play_codec == CODEC_IMA_ADPCM):
+                if (self._adpcm_phase == 0):
+                    self._adpcm_byte = self._sram_read (self.play_addr)
+                    self.play_addr = self.play_addr + 1
+                    data = self._ima_adpcm_decode (self._adpcm_byte & 0xF)
+                    self._adpcm_phase = 1
+                else:
+                    data = self._ima_adpcm_decode (self._adpcm_byte >> 4)
+                    self._adpcm_phase = 0
+                    if (self.clip_index is not None):
+                        self._clip_advance (1)
+            elif (self.play_codec == CODEC_LINEAR):
+                low = self._sram_read (self.play_addr)
+                high = self._sram_read (self.play_addr + 1)
+                self.play_addr = self.play_addr + 2
+                data = (high << 8) + low
+                if (data > 32767):
+                    data = data - 65536
+                if (self.clip_index is not None):
+                    self._clip_advance (2)
+            else:
+                data = self._wave.Mulaw2linear (self._sram_read (self.play_addr))
+                self.play_addr = self.play_addr + 1
+                if (self.clip_index is not None):
+                    self._clip_advance (1)
+
+            if ((self.clip_index is None) and (self.play_addr >= self.mem_addr) and (self._adpcm_phase == 0)):
+                self.play_addr = 0
+                self._adpcm_reset()
+
+            out.append (data)
+
+        return out
+
+    #========================================================================
+    # _record_tick : STATE_RECORD of the sketch, until it sends a '\n'
+    #========================================================================
+
+    def _record_tick (self):
+        while (1):
+            if ((self.record_source is not None) and (self._record_pos < len(self.record_source))):
+                sample = self.record_source[self._record_pos]
+                self._record_pos = self._record_pos + 1
+            else:
+                sample = 0
+
+            if (self.codec == CODEC_LINEAR):
+                self._sram_write (self.record_addr, sample & 0xFF)
+                self._sram_write (self.record_addr + 1, (sample >> 8) & 0xFF)
+                self.record_addr = self.record_addr + 2
+                tick = (self.record_addr & 0x3FFF) == 0
+            else:
+                self._sram_write (self.record_addr, self._wave.linear2Mulaw (sample))
+                self.record_addr = self.record_addr + 1
+                tick = (self.record_addr & 0x1FFF) == 0
+
+            if (self.record_addr >= SRAM_SIZE):
+                self.record_addr = SRAM_SIZE - 2
+
+            if (tick):
+                self._out += b"\n"
+                return
+
+
+#############################################################################
+# Noisy_Link : flips bits between the host and the emulator
+#############################################################################
+
+class Noisy_Link:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    board      : M10Emulator
+    #    error_rate : chance of a bit flip, per byte, both ways
+    #    baud_rate  : for link_time
+    #    latency    : time from a write to the first byte of the reply, such
+    #                 as the latency of a USB serial adapter
+    #========================================================================
+
+    def __init__ (self, board, error_rate = 0.0, baud_rate = 115200, latency = 0.002, seed = 1):
+        self.board = board
+        self.error_rate = error_rate
+        self.baud_rate = baud_rate
+        self.latency = latency
+
+        self.timeout = 0
+        self.is_open = True
+
+        # seconds the traffic so far takes on the wire, and waiting for it
+        self.link_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bit_errors = 0
+
+        self._random = random.Random (seed)
+        self._until_error = self._gap()
+
+    def _gap (self):
+        if (self.error_rate <= 0):
+            return math.inf
+
+        return int(math.log (1.0 - self._random.random()) / math.log (1.0 - self.error_rate))
+
+    def _corrupt (self, data):
+        data = bytearray(data)
+
+        while (self._until_error < len(data)):
+            data[self._until_error] = data[self._until_error] ^ (1 << self._random.randrange (8))
+            self.bit_errors = self.bit_errors + 1
+            self._until_error = self._until_error + 1 + self._gap()
+
+        self._until_error = self._until_error - len(data)
+
+        return bytes(data)
+
+    def _wire_time (self, num_of_bytes):
+        return num_of_bytes * 10.0 / self.baud_rate
+
+    def write (self, data):
+        self.bytes_sent = self.bytes_sent + len(data)
+        self.link_time = self.link_time + self._wire_time (len(data))
+
+        return self.board.write (self._corrupt (data))
+
+    #========================================================================
+    # read : a short read costs the whole timeout, which is at least what a
+    #   full reply takes
+    #========================================================================
+
+    def read (self, size = 1):
+        data = self._corrupt (self.board.read (size))
+
+        self.bytes_received = self.bytes_received + len(data)
+        self.link_time = self.link_time + self.latency + self._wire_time (len(data))
+
+        if (len(data) < size):
+            self.link_time = self.link_time + max(self.timeout, self._wire_time (size))
+
+        return data
+
+    @property
+    def in_waiting (self):
+        return self.board.in_waiting
+
+    def reset_input_buffer (self):
+        self.board.reset_input_buffer()
+
+    def flush (self):
+        pass
+
+    def close (self):
+        self.is_open = False
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def _bench (fec_groups):
+    from M10Client import M10Client
+
+    source = random.Random (2)
+    image = bytes(source.getrandbits (8) for i in range (256 * 128))
+
+    print ("{0:>10s} {1:>6s} {2:>8s} {3:>9s} {4:>6s} {5:>9s} {6:>9s}".format(
+           "bit error", "fec", "seconds", "bytes", "flips", "timeouts", "repaired"))
+
+    for error_rate in (0.0, 1e-5, 1e-4, 3e-4, 1e-3, 3e-3):
+        for group in [0] + fec_groups:
+            link = Noisy_Link (M10Emulator(), error_rate)
+            m10 = M10Client ("emulator", serial_port = link, fec_group = group)
+
+            m10.write_image (image)
+            back = m10.read_image (len(image))
+
+            if (bytes(back) != image):
+                print ("read back differs at error rate", error_rate)
+                sys.exit(1)
+
+            print ("{0:10.0e} {1:6d} {2:8.2f} {3:9d} {4:6d} {5:9d} {6:9d}".format(
+                   error_rate, group, link.link_time, link.bytes_sent + link.bytes_received,
+                   link.bit_errors, m10.timeouts, m10.fec_repaired))
+
+def main():
+
+    from M10Client import M10Client
+
+    if ((len(sys.argv) >= 2) and (sys.argv[1] == "bench")):
+        _bench ([int(arg) for arg in sys.argv[2:]] or [4, 8, 16])
+        return
+
+    if ((len(sys.argv) < 3) or (sys.argv[1] != "verify")):
+        print ("Usage: Python M10Emulator.py verify file.wav [mulaw|adpcm]")
+        print ("       Python M10Emulator.py bench [fec_group ...]")
+        sys.exit(1)
+
+    codec = M10Client.CODECS[sys.argv[3] if len(sys.argv) > 3 else "adpcm"]
+
+    wave_file = _wave_file (sys.argv[2])
+    samples = wave_file._data_extract (0)
+
+    emulator = M10Emulator()
+    m10 = M10Client ("emulator", serial_port = emulator)
+
+    if (codec == CODEC_IMA_ADPCM):
+        samples = samples[0 : 2 * SRAM_SIZE]
+        expected = wave_file.ima_adpcm_decode (wave_file.ima_adpcm_encode (samples), len(samples))
+    else:
+        samples = samples[0 : SRAM_SIZE]
+        expected = wave_file.mulaw_decode (wave_file.mulaw_encode (samples))
+
+    m10.load (samples, codec = codec)
+    m10.play()
+
+    # the sketch plays up to the start of the last EXT frame
+    num_of_samples = emulator.mem_addr * (2 if codec == CODEC_IMA_ADPCM else 1)
+    played = emulator.play_samples (num_of_samples)
+
+    if (list(expected[0 : num_of_samples]) == played):
+        print ("{0:d} samples, {1:d} bytes of SRAM, bit exact".format(num_of_samples, emulator.mem_addr))
+        print ("{0:d} frames, {1:d} bytes sent".format(emulator.frames_received, emulator.bytes_received))
+    else:
+        mismatch = [i for i in range (num_of_samples) if expected[i] != played[i]]
+        print ("{0:d} of {1:d} samples differ, first at {2:d}".format(len(mismatch), num_of_samples, mismatch[0]))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
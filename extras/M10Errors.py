@@ -0,0 +1,57 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Errors : exception types raised by the host side tools
+#
+# Remarks:
+#   Everything raised on purpose derives from M10Error, so a caller that
+#   embeds M10Client only needs a single except clause.
+###############################################################################
+
+class M10Error (Exception):
+    pass
+
+#============================================================================
+# the serial port can not be opened, or is used while closed
+#============================================================================
+
+class M10PortError (M10Error):
+    pass
+
+#============================================================================
+# a frame could not be delivered (CRC error / timeout) after all retries
+#============================================================================
+
+class M10LinkError (M10Error):
+    pass
+
+#============================================================================
+# malformed or unsupported audio file
+#============================================================================
+
+class M10FormatError (M10Error):
+    pass
+
+#============================================================================
+# a replayed session wrote something else than the recorded one
+#============================================================================
+
+class M10ReplayError (M10Error):
+    pass
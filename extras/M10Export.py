@@ -0,0 +1,197 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Export : captures in formats that analysis code can load directly
+#
+# Remarks:
+#   Formats, each written next to the WAV file with its own extension:
+#     npy       : .npy        int16 samples
+#     npy_mulaw : .mulaw.npy  uint8, the mu-law bytes as they are in the SRAM
+#     raw       : .raw        int16 samples, little endian, no header
+#     json      : .json       sidecar: port, time, sample rate, codec,
+#                             number of samples, CRC16_CCITT of the SRAM
+#                             image, and the names of the other files
+#
+#   The .npy files are written by hand (format version 1.0, header padded
+#   to 64 bytes), so numpy is not needed here, and the samples go from the
+#   receive buffer to the file without a copy. They can be memory mapped
+#   with numpy.load (file_name, mmap_mode = 'r'), and the .raw file with
+#   numpy.memmap (file_name, dtype = '<i2').
+#
+# Usage:
+#   Python M10Export.py capture.wav npy raw json
+###############################################################################
+
+import argparse
+import json
+import os
+import sys
+
+from array import array
+from time import time, strftime, gmtime
+
+from M10Errors import M10Error
+from wave_file import _wave_file
+
+FORMATS = {
+    'npy'       : ".npy",
+    'npy_mulaw' : ".mulaw.npy",
+    'raw'       : ".raw",
+    'json'      : ".json"
+}
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_NPY_ALIGN = 64
+
+#============================================================================
+# _little_endian : a buffer of samples in little endian order, the samples
+#   themselves unless the machine is big endian
+#============================================================================
+
+def _little_endian (samples):
+    if (sys.byteorder != "little"):
+        samples = array('h', samples)
+        samples.byteswap()
+
+    return memoryview(samples).cast('B')
+
+#============================================================================
+# npy_header : .npy header of a one dimensional array
+#============================================================================
+
+def npy_header (descr, length):
+    header = "{{'descr': '{0}', 'fortran_order': False, 'shape': ({1:d},), }}".format(descr, length)
+
+    # magic, header length (2 bytes), header, '\n', all padded with spaces
+    size = len(_NPY_MAGIC) + 2 + len(header) + 1
+    header = header + " " * (-size % _NPY_ALIGN) + "\n"
+
+    return _NPY_MAGIC + len(header).to_bytes (2, "little") + header.encode ("latin1")
+
+#============================================================================
+# write_npy / write_raw
+#============================================================================
+
+def write_npy (file_name, samples):
+    with open(file_name, "wb") as f:
+        f.write (npy_header ("<i2", len(samples)))
+        f.write (_little_endian (samples))
+
+def write_npy_mulaw (file_name, image):
+    with open(file_name, "wb") as f:
+        f.write (npy_header ("|u1", len(image)))
+        f.write (image)
+
+def write_raw (file_name, samples):
+    with open(file_name, "wb") as f:
+        f.write (_little_endian (samples))
+
+#============================================================================
+# metadata : the sidecar of a capture
+#============================================================================
+
+def metadata (num_of_samples, port = "", sample_rate = 8000, codec = "mulaw", crc = None, timestamp = None):
+    if (timestamp is None):
+        timestamp = time()
+
+    return {
+        "port"           : port,
+        "timestamp"      : timestamp,
+        "time"           : strftime ("%Y-%m-%dT%H:%M:%SZ", gmtime(timestamp)),
+        "sample_rate"    : sample_rate,
+        "codec"          : codec,
+        "num_of_samples" : num_of_samples,
+        "sample_format"  : "int16, little endian",
+        "crc"            : None if (crc is None) else "0x{0:04x}".format(crc)
+    }
+
+#============================================================================
+# export
+#------------------------------------------------------------------------
+# Remarks: write samples (array('h')) and image (the mu-law bytes, needed
+#   by npy_mulaw only) in each of formats, named after base_name. info is
+#   the content of the sidecar. Returns the names of the files written
+#============================================================================
+
+def export (base_name, formats, samples, image = None, info = None):
+    for name in formats:
+        if (name not in FORMATS):
+            raise M10Error ("no export format {0}, use one of {1}".format(name, " ".join(FORMATS)))
+
+        if ((name == 'npy_mulaw') and (image is None)):
+            raise M10Error ("npy_mulaw needs the mu-law image")
+
+    files = {}
+
+    for name in formats:
+        file_name = base_name + FORMATS[name]
+
+        if (name == 'npy'):
+            write_npy (file_name, samples)
+        elif (name == 'npy_mulaw'):
+            write_npy_mulaw (file_name, image)
+        elif (name == 'raw'):
+            write_raw (file_name, samples)
+        else:
+            continue
+
+        files[name] = os.path.basename (file_name)
+
+    if ('json' in formats):
+        if (info is None):
+            info = metadata (len(samples))
+
+        file_name = base_name + FORMATS['json']
+        with open(file_name, "w") as f:
+            json.dump (dict(info, files = files), f, indent = 2)
+
+        files['json'] = os.path.basename (file_name)
+
+    return list(files.values())
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="export a 16 bit WAV file the way save_wav does")
+    parser.add_argument("wav_file")
+    parser.add_argument("formats", nargs="+", choices=sorted(FORMATS))
+    args = parser.parse_args()
+
+    try:
+        wave_file = _wave_file (args.wav_file)
+        samples = wave_file._data_extract (0)
+        samples = array('h', wave_file.to_linear16 (samples, wave_file.bits_per_sample))
+
+        image = wave_file.mulaw_encode (samples) if ('npy_mulaw' in args.formats) else None
+        info = metadata (len(samples), sample_rate = wave_file.sample_rate, codec = "linear")
+
+        files = export (os.path.splitext(args.wav_file)[0], args.formats, samples, image, info)
+    except (OSError, M10Error) as e:
+        print (e)
+        sys.exit(1)
+
+    print (" ".join(files), "written")
+
+if __name__ == "__main__":
+    main()
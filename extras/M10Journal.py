@@ -0,0 +1,272 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Journal : journal of an SRAM transfer, so it can be resumed
+#
+# Remarks:
+#   File layout (all little endian):
+#     offset 0 : header, see _HEADER
+#     then     : one byte per 128 byte block, 1 once the block was
+#                acknowledged by the sketch (write) or received (read)
+#     then     : the received blocks (read only)
+#
+#   The header holds the direction, length and address of the transfer,
+#   the SHA-256 of the image (write only) and the port. A transfer only
+#   picks up a journal whose header is the same, any other journal is
+#   started over.
+#
+#   The journal is written every FLUSH_BLOCKS blocks or FLUSH_SECONDS,
+#   whichever comes first, so a transfer that is cut off loses at most
+#   that much. For reads, the blocks are on disk before the bitmap that
+#   marks them.
+#
+#   M10Client.write_image / read_image take the journal. Whether the SRAM
+#   still holds what the journal says (the board may have been reset, or
+#   have recorded since) is checked at the end with the MEM_CRC frame of
+#   the sketch; if it does not, the transfer starts over once. Sketches
+#   without MEM_CRC have to be trusted.
+#
+#       journal = Transfer_Journal ("song.wav.m10j", "COM3")
+#       try:
+#           m10.write_image (image, 0, progress, journal)
+#       finally:
+#           journal.close()
+###############################################################################
+
+import os
+import struct
+
+from time import monotonic
+
+_MAGIC = b"M10JRNL\x00"
+_VERSION = 1
+
+# magic, version, direction, block_size, length, addr, image sha256, port
+_HEADER = struct.Struct("<8sHcxH2xII32s32s")
+
+BLOCK_SIZE = 128
+
+FLUSH_BLOCKS = 64
+
+# seconds
+FLUSH_SECONDS = 1.0
+
+#############################################################################
+# Transfer_Journal
+#############################################################################
+
+class Transfer_Journal:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    file_name : journal file, created on the first transfer
+    #    port      : serial port of the board
+    #    resume    : pick up a matching journal left by an earlier transfer,
+    #                or start over
+    #========================================================================
+
+    def __init__ (self, file_name, port = "", resume = True):
+        self.file_name = file_name
+        self.port = port
+        self._resume = resume
+
+        self._file = None
+        self._header = None
+
+        self.num_of_blocks = 0
+        self.data = None
+        self._done = bytearray()
+
+        # blocks taken from the journal instead of the board
+        self.resumed = 0
+
+        self._dirty = []
+        self._last_flush = 0
+
+    #========================================================================
+    # begin_write / begin_read : open the journal of a transfer, and return
+    #   the blocks still to be done
+    #========================================================================
+
+    def begin_write (self, data, addr):
+        # imported here, it is a good part of the start up time of wav_console
+        import hashlib
+
+        return self._begin (b"W", len(data), addr, hashlib.sha256 (data).digest())
+
+    def begin_read (self, length, addr):
+        return self._begin (b"R", length, addr, bytes(32))
+
+    #========================================================================
+    # read_length : length of the read from addr that the journal on disk
+    #   is for, if it is one this journal would resume (same port, address
+    #   and block size). None if there is none. A new session does not know
+    #   how much was recorded, this is how its save picks up the journal
+    #========================================================================
+
+    def read_length (self, addr):
+        if (not self._resume):
+            return None
+
+        try:
+            with open(self.file_name, "rb") as f:
+                header = f.read (_HEADER.size)
+        except OSError:
+            return None
+
+        if (len(header) != _HEADER.size):
+            return None
+
+        magic, version, direction, block_size, length, journal_addr, digest, port = _HEADER.unpack (header)
+
+        # struct pads the port with zeros
+        if ((magic, version, direction, block_size, journal_addr, port) !=
+            (_MAGIC, _VERSION, b"R", BLOCK_SIZE, addr, self.port.encode()[0:32].ljust (32, b"\x00"))):
+            return None
+
+        return length
+
+    def _begin (self, direction, length, addr, digest):
+        self.close()
+
+        self.num_of_blocks = (length + BLOCK_SIZE - 1) // BLOCK_SIZE
+        self._header = _HEADER.pack (_MAGIC, _VERSION, direction, BLOCK_SIZE, length, addr,
+                                     digest, self.port.encode()[0:32])
+
+        self._done = bytearray(self.num_of_blocks)
+        self.data = bytearray(self.num_of_blocks * BLOCK_SIZE) if (direction == b"R") else None
+        self.resumed = 0
+
+        if (not (self._resume and self._load())):
+            self._create()
+
+        self._dirty = []
+        self._last_flush = monotonic()
+
+        return [block for block in range (self.num_of_blocks) if (not self._done[block])]
+
+    def _size (self):
+        return _HEADER.size + self.num_of_blocks + (len(self.data) if (self.data is not None) else 0)
+
+    def _load (self):
+        try:
+            f = open(self.file_name, "r+b")
+        except OSError:
+            return False
+
+        content = f.read()
+
+        if ((len(content) != self._size()) or (content[0 : _HEADER.size] != self._header)):
+            f.close()
+            return False
+
+        start = _HEADER.size
+        self._done[:] = content[start : start + self.num_of_blocks]
+
+        if (self.data is not None):
+            start = start + self.num_of_blocks
+            self.data[:] = content[start : start + len(self.data)]
+
+        self._file = f
+        self.resumed = self._done.count (1)
+
+        return True
+
+    def _create (self):
+        self._file = open(self.file_name, "w+b")
+        self._file.write (self._header)
+        self._file.write (self._done)
+        if (self.data is not None):
+            self._file.write (self.data)
+
+        self._sync()
+
+    def _sync (self):
+        self._file.flush()
+        os.fsync (self._file.fileno())
+
+    #========================================================================
+    # mark : a block is done, with the data received for it (read)
+    #========================================================================
+
+    def mark (self, block, data = None):
+        self._done[block] = 1
+
+        if (data is not None):
+            self.data[block * BLOCK_SIZE : block * BLOCK_SIZE + len(data)] = data
+
+        self._dirty.append (block)
+
+        if ((len(self._dirty) >= FLUSH_BLOCKS) or (monotonic() - self._last_flush >= FLUSH_SECONDS)):
+            self.flush()
+
+    #========================================================================
+    # flush : the blocks marked since the last flush to disk, the data
+    #   before the bitmap
+    #========================================================================
+
+    def flush (self):
+        if ((self._file is None) or (not self._dirty)):
+            return
+
+        if (self.data is not None):
+            data_start = _HEADER.size + self.num_of_blocks
+            for block in self._dirty:
+                self._file.seek (data_start + block * BLOCK_SIZE)
+                self._file.write (self.data[block * BLOCK_SIZE : (block + 1) * BLOCK_SIZE])
+            self._sync()
+
+        self._file.seek (_HEADER.size)
+        self._file.write (self._done)
+        self._sync()
+
+        self._dirty = []
+        self._last_flush = monotonic()
+
+    #========================================================================
+    # restart : the SRAM does not match the journal, the next begin_write /
+    #   begin_read starts over
+    #========================================================================
+
+    def restart (self):
+        self._resume = False
+
+    #========================================================================
+    # finish / close : finish removes the journal of a completed transfer,
+    #   close keeps it (flushed) for a later resume
+    #========================================================================
+
+    def finish (self):
+        if (self._file is not None):
+            self._file.close()
+            self._file = None
+
+        try:
+            os.remove (self.file_name)
+        except OSError:
+            pass
+
+    def close (self):
+        if (self._file is not None):
+            self.flush()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,381 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Library : several clips in the SRAM, played by index
+#
+# Remarks:
+#   SRAM layout (all little endian):
+#     offset 0   : header, see _TOC_HEADER
+#     offset 8   : MAX_CLIPS clip entries, see _CLIP_ENTRY
+#     offset 200 : extents, see _EXTENT, up to the end of the TOC
+#     offset 512 : 128 byte blocks of encoded audio
+#
+#   A clip is a list of extents, each one a run of blocks in the SRAM. An
+#   extent with _EXTENT_REPEAT set in its count plays the same block count
+#   times instead, which is how a stretch of silence takes up one block.
+#   Blocks are shared between clips: a block that is already in the SRAM
+#   (in any clip) is not stored again.
+#
+#   The sketch reads the TOC when it gets a CMD_PLAY_CLIP frame, so
+#   switching clips takes one frame. The manifest (clip names, the layout
+#   and the block index of the image) is kept on the host, as JSON.
+#
+# Usage:
+#   Python M10Library.py pack library.snap prompt1.wav prompt2.wav:adpcm ...
+#     writes library.snap (upload with restore_sram) and the manifest,
+#     library.m10lib.json
+###############################################################################
+
+import json
+import os
+import struct
+import sys
+
+import M10Snapshot
+
+from M10Errors import M10FormatError
+from wave_file import _wave_file
+
+_TOC_MAGIC = b"M10L"
+_TOC_VERSION = 1
+
+# magic, version, num_of_clips, num_of_extents
+_TOC_HEADER = struct.Struct("<4sBBH")
+
+# first_extent, num_of_extents, length (in bytes), codec
+_CLIP_ENTRY = struct.Struct("<HHIB3x")
+
+# block, count
+_EXTENT = struct.Struct("<HH")
+_EXTENT_REPEAT = 0x8000
+
+BLOCK_SIZE = 128
+TOC_SIZE = 4 * BLOCK_SIZE
+MAX_CLIPS = 16
+
+_CLIP_TABLE_OFFSET = _TOC_HEADER.size
+_EXTENT_TABLE_OFFSET = _CLIP_TABLE_OFFSET + MAX_CLIPS * _CLIP_ENTRY.size
+MAX_EXTENTS = (TOC_SIZE - _EXTENT_TABLE_OFFSET) // _EXTENT.size
+
+SRAM_SIZE = 128 * 1024
+
+MANIFEST_SUFFIX = ".m10lib.json"
+
+# codecs, same values as M10Client.CODEC_*
+_CODEC_MULAW = 1
+_CODEC_IMA_ADPCM = 2
+
+_CODEC_NAMES = {
+    _CODEC_MULAW     : 'mulaw',
+    _CODEC_IMA_ADPCM : 'adpcm'
+}
+
+#############################################################################
+# Clip_Library
+#############################################################################
+
+class Clip_Library:
+
+    def __init__ (self):
+        self.clips = []
+        self.extents = []
+
+        self._blocks = []
+        self._block_table = {}
+
+    #========================================================================
+    # _place_block : SRAM block number of block, stored if it is new
+    #========================================================================
+
+    def _place_block (self, block):
+        block_number = self._block_table.get (block)
+
+        if (block_number is None):
+            block_number = TOC_SIZE // BLOCK_SIZE + len(self._blocks)
+            if ((block_number + 1) * BLOCK_SIZE > SRAM_SIZE):
+                raise M10FormatError ("the clips do not fit in the SRAM")
+
+            self._blocks.append (block)
+            self._block_table[block] = block_number
+
+        return block_number
+
+    #========================================================================
+    # add_clip
+    #------------------------------------------------------------------------
+    # Remarks: add a clip that is already encoded, return its index.
+    #   The last block is padded with the last byte of the clip
+    #========================================================================
+
+    def add_clip (self, name, encoded, codec):
+        if (len(self.clips) >= MAX_CLIPS):
+            raise M10FormatError ("at most {0:d} clips fit in the TOC".format(MAX_CLIPS))
+
+        if (len(encoded) == 0):
+            raise M10FormatError ("clip {0} is empty".format(name))
+
+        encoded = bytes(encoded)
+        padding = (-len(encoded)) % BLOCK_SIZE
+        padded = encoded + encoded[-1:] * padding
+
+        blocks = [padded[i : i + BLOCK_SIZE] for i in range (0, len(padded), BLOCK_SIZE)]
+
+        blocks_placed = len(self._blocks)
+        extents = []
+        i = 0
+
+        while (i < len(blocks)):
+            run = 1
+            while ((i + run < len(blocks)) and (run < _EXTENT_REPEAT - 1) and (blocks[i + run] == blocks[i])):
+                run = run + 1
+
+            block_number = self._place_block (blocks[i])
+
+            if (run > 1):
+                extents.append ([block_number, run | _EXTENT_REPEAT])
+            elif (extents and (extents[-1][1] & _EXTENT_REPEAT == 0) and
+                  (extents[-1][0] + extents[-1][1] == block_number)):
+                extents[-1][1] = extents[-1][1] + 1
+            else:
+                extents.append ([block_number, 1])
+
+            i = i + run
+
+        if (len(self.extents) + len(extents) > MAX_EXTENTS):
+            del self._blocks[blocks_placed:]
+            self._block_table = {block : n for block, n in self._block_table.items()
+                                 if (n < TOC_SIZE // BLOCK_SIZE + blocks_placed)}
+            raise M10FormatError ("clip {0} does not fit in the TOC".format(name))
+
+        self.clips.append ({
+            'name'         : name,
+            'codec'        : codec,
+            'length'       : len(encoded),
+            'first_extent' : len(self.extents),
+            'num_of_extents' : len(extents)
+        })
+
+        self.extents.extend (extents)
+
+        return len(self.clips) - 1
+
+    #========================================================================
+    # add_samples : encode linear samples with codec, then add_clip
+    #========================================================================
+
+    def add_samples (self, name, samples, codec = _CODEC_MULAW):
+        wave = _wave_file()
+
+        if (codec == _CODEC_IMA_ADPCM):
+            encoded = wave.ima_adpcm_encode (samples)
+        else:
+            encoded = wave.mulaw_encode (samples)
+
+        return self.add_clip (name, encoded, codec)
+
+    #========================================================================
+    # toc / image
+    #========================================================================
+
+    def toc (self):
+        toc = bytearray(TOC_SIZE)
+
+        _TOC_HEADER.pack_into (toc, 0, _TOC_MAGIC, _TOC_VERSION, len(self.clips), len(self.extents))
+
+        for i, clip in enumerate (self.clips):
+            _CLIP_ENTRY.pack_into (toc, _CLIP_TABLE_OFFSET + i * _CLIP_ENTRY.size,
+                                   clip['first_extent'], clip['num_of_extents'], clip['length'], clip['codec'])
+
+        for i, (block, count) in enumerate (self.extents):
+            _EXTENT.pack_into (toc, _EXTENT_TABLE_OFFSET + i * _EXTENT.size, block, count)
+
+        return toc
+
+    def image (self):
+        return self.toc() + b"".join (self._blocks)
+
+    def find (self, name_or_index):
+        for i, clip in enumerate (self.clips):
+            if (clip['name'] == name_or_index):
+                return i
+
+        try:
+            index = int(name_or_index)
+        except ValueError:
+            index = -1
+
+        if ((index < 0) or (index >= len(self.clips))):
+            raise M10FormatError ("no clip {0} in the library".format(name_or_index))
+
+        return index
+
+    def describe (self):
+        lines = []
+        for i, clip in enumerate (self.clips):
+            lines.append ("  {0:2d}  {1:<24s} {2:<6s} {3:7d} bytes  {4:d} extents".format(
+                i, clip['name'], _CODEC_NAMES.get(clip['codec'], "?"), clip['length'], clip['num_of_extents']))
+
+        lines.append ("  {0:d} bytes of SRAM used".format(len(self.image())))
+
+        return lines
+
+    #========================================================================
+    # manifest
+    #========================================================================
+
+    def save_manifest (self, file_name, index = None):
+        image = self.image()
+
+        if (index is None):
+            index = M10Snapshot.block_index (image)
+
+        manifest = {
+            'clips'   : self.clips,
+            'extents' : self.extents,
+            'index'   : list(index)
+        }
+
+        with open(file_name, "w") as f:
+            json.dump (manifest, f, indent = 1)
+
+    @staticmethod
+    def load_manifest (file_name):
+        with open(file_name) as f:
+            try:
+                manifest = json.load (f)
+            except ValueError as e:
+                raise M10FormatError ("{0} is not a clip library manifest: {1}".format(file_name, e)) from e
+
+        if (not _valid_manifest (manifest)):
+            raise M10FormatError ("{0} is not a clip library manifest".format(file_name))
+
+        library = Clip_Library()
+        library.clips = manifest['clips']
+        library.extents = manifest['extents']
+
+        return library, manifest['index']
+
+#============================================================================
+# manifest_file : the manifest that goes with a snapshot, a suffix of its
+#   own, so it is not taken for the .json of save_wav (see M10Export.py)
+#============================================================================
+
+def manifest_file (snapshot_file):
+    return os.path.splitext(snapshot_file)[0] + MANIFEST_SUFFIX
+
+_CLIP_FIELDS = (('name', str), ('codec', int), ('length', int), ('first_extent', int), ('num_of_extents', int))
+
+def _valid_manifest (manifest):
+    if ((not isinstance (manifest, dict)) or
+        any((not isinstance (manifest.get (key), list)) for key in ('clips', 'extents', 'index'))):
+        return False
+
+    for clip in manifest['clips']:
+        if ((not isinstance (clip, dict)) or
+            any((not isinstance (clip.get (key), value_type)) for key, value_type in _CLIP_FIELDS)):
+            return False
+
+    return all((isinstance (extent, list) and (len(extent) == 2) and all(isinstance (i, int) for i in extent))
+               for extent in manifest['extents'])
+
+#============================================================================
+# read_toc : clip entries and extents from an SRAM image
+#============================================================================
+
+def read_toc (image):
+    if (len(image) < TOC_SIZE):
+        raise M10FormatError ("no clip library in the SRAM")
+
+    magic, version, num_of_clips, num_of_extents = _TOC_HEADER.unpack_from (image, 0)
+
+    if ((magic != _TOC_MAGIC) or (version != _TOC_VERSION)):
+        raise M10FormatError ("no clip library in the SRAM")
+
+    clips = [_CLIP_ENTRY.unpack_from (image, _CLIP_TABLE_OFFSET + i * _CLIP_ENTRY.size)
+             for i in range (num_of_clips)]
+    extents = [_EXTENT.unpack_from (image, _EXTENT_TABLE_OFFSET + i * _EXTENT.size)
+               for i in range (num_of_extents)]
+
+    return clips, extents
+
+#============================================================================
+# parse_clip_arg : "file.wav" or "file.wav:adpcm"
+#============================================================================
+
+def parse_clip_arg (arg):
+    file_name, _, codec_name = arg.rpartition (":")
+
+    if ((not file_name) or (codec_name not in ('mulaw', 'adpcm'))):
+        return arg, _CODEC_MULAW
+
+    return file_name, (_CODEC_IMA_ADPCM if codec_name == 'adpcm' else _CODEC_MULAW)
+
+#============================================================================
+# pack_files : a Clip_Library of WAV files, each conditioned by dsp (an
+#   M10DSP.DSP_Chain) if there is one
+#============================================================================
+
+def pack_files (args, verbose = 0, dsp = None):
+    library = Clip_Library()
+
+    for arg in args:
+        file_name, codec = parse_clip_arg (arg)
+
+        wave_file = _wave_file (file_name)
+        samples = wave_file._data_extract (verbose)
+        samples = wave_file.to_linear16 (samples, wave_file.bits_per_sample)
+        samples = wave_file.resample (samples, wave_file.sample_rate, 8000)
+
+        if ((dsp is not None) and dsp.active):
+            samples = dsp.process (samples)
+
+        name = os.path.splitext(os.path.basename(file_name))[0]
+        library.add_samples (name, samples, codec)
+
+    return library
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    if ((len(sys.argv) < 4) or (sys.argv[1] != "pack")):
+        print ("Usage: Python M10Library.py pack library.snap clip.wav[:adpcm] ...")
+        sys.exit(1)
+
+    snapshot_file = sys.argv[2]
+
+    try:
+        library = pack_files (sys.argv[3:])
+    except (OSError, M10FormatError) as e:
+        print (e)
+        sys.exit(1)
+
+    image = library.image()
+    index = M10Snapshot.write_snapshot (snapshot_file, image)
+    library.save_manifest (manifest_file (snapshot_file), index)
+
+    for line in library.describe():
+        print (line)
+
+if __name__ == "__main__":
+    main()
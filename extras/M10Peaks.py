@@ -0,0 +1,349 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Peaks : min / max / RMS pyramid of a recording, for waveform previews
+#
+# Remarks:
+#   Level 0 has the min, max and sum of squares of every BASE samples, and
+#   each level above combines FANOUT buckets of the level below, up to a
+#   single bucket for the whole recording. A query for N pixels of a range
+#   picks the coarsest level whose buckets are no wider than a pixel, so
+#   each pixel looks at FANOUT + 1 buckets at most, whatever the length of
+#   the range.
+#
+#   The index is built in one pass (numpy reduceat if numpy is installed)
+#   and kept next to the WAV file or SRAM snapshot, as file_name + ".peaks".
+#   It is rebuilt when the size or time of the file changes.
+#
+#   File layout (little endian):
+#     header : see _HEADER
+#     then   : for each level, min (int16), max (int16) and sum of squares
+#              (double) of each bucket
+#
+# Usage:
+#   Python M10Peaks.py capture.wav [start_seconds [end_seconds]]
+#   Python M10Peaks.py board.snap
+###############################################################################
+
+import argparse
+import math
+import operator
+import os
+import shutil
+import struct
+import sys
+
+from array import array
+
+import M10Snapshot
+
+from M10Errors import M10FormatError
+from wave_file import _wave_file
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_MAGIC = b"M10PEAKS"
+_VERSION = 1
+
+# magic, version, base, fanout, num_of_samples, source size, source mtime
+_HEADER = struct.Struct("<8sHHHxxIId")
+
+SAMPLE_RATE = 8000
+
+BASE = 64
+FANOUT = 4
+
+#============================================================================
+# _reduce : fn over every n values, the last group may be short
+#============================================================================
+
+def _reduce (values, n, fn):
+    return [fn(values[i : i + n]) for i in range (0, len(values), n)]
+
+def _sum_of_squares (values):
+    return float(sum(map(operator.mul, values, values)))
+
+def _to_array (typecode, values):
+    result = array(typecode)
+
+    if ((numpy is not None) and isinstance(values, numpy.ndarray)):
+        result.frombytes (values.astype(result.typecode).tobytes())
+    else:
+        result.extend (values)
+
+    return result
+
+#############################################################################
+# Peak_Index
+#############################################################################
+
+class Peak_Index:
+
+    def __init__ (self, num_of_samples, levels, base = BASE, fanout = FANOUT):
+        self.num_of_samples = num_of_samples
+        self.levels = levels
+        self.base = base
+        self.fanout = fanout
+
+    def bucket_size (self, level):
+        return self.base * self.fanout ** level
+
+    #========================================================================
+    # build : levels of (mins, maxs, squares), one array per column
+    #========================================================================
+
+    @staticmethod
+    def build (samples, base = BASE, fanout = FANOUT):
+        if (numpy is not None):
+            values = numpy.asarray (samples, dtype = numpy.int64)
+            starts = numpy.arange (0, len(values), base)
+
+            if (len(values)):
+                mins = numpy.minimum.reduceat (values, starts)
+                maxs = numpy.maximum.reduceat (values, starts)
+                squares = numpy.add.reduceat ((values * values).astype(numpy.float64), starts)
+            else:
+                mins = maxs = squares = values
+        else:
+            mins = _reduce (samples, base, min)
+            maxs = _reduce (samples, base, max)
+            squares = _reduce (samples, base, _sum_of_squares)
+
+        levels = [(_to_array('h', mins), _to_array('h', maxs), _to_array('d', squares))]
+
+        while (len(levels[-1][0]) > 1):
+            mins, maxs, squares = levels[-1]
+            levels.append ((array('h', _reduce (mins, fanout, min)),
+                            array('h', _reduce (maxs, fanout, max)),
+                            array('d', _reduce (squares, fanout, sum))))
+
+        return Peak_Index (len(samples), levels, base, fanout)
+
+    #========================================================================
+    # query
+    #------------------------------------------------------------------------
+    # Remarks: (min, max, rms) of each of width pixels over samples start
+    #   to end (exclusive). Pixel edges are rounded out to the buckets of
+    #   the level used, so neighbouring pixels may share a bucket
+    #========================================================================
+
+    def query (self, start, end, width):
+        start = max(0, int(start))
+        end = min(self.num_of_samples, int(end))
+
+        if ((end <= start) or (width <= 0) or (not self.levels)):
+            return []
+
+        span = (end - start) / width
+
+        level = 0
+        while ((level + 1 < len(self.levels)) and (self.bucket_size(level + 1) <= span)):
+            level = level + 1
+
+        size = self.bucket_size (level)
+        mins, maxs, squares = self.levels[level]
+
+        columns = []
+        for i in range (width):
+            first = int(start + i * span) // size
+            last = max(first + 1, -(-int(start + (i + 1) * span) // size))
+            last = min(last, len(mins))
+
+            count = min(last * size, self.num_of_samples) - first * size
+
+            columns.append ((min(mins[first : last]), max(maxs[first : last]),
+                             math.sqrt(sum(squares[first : last]) / count)))
+
+        return columns
+
+    #========================================================================
+    # save / load
+    #========================================================================
+
+    def save (self, file_name, source_size = 0, source_mtime = 0.0):
+        with open(file_name, "wb") as f:
+            f.write (_HEADER.pack (_MAGIC, _VERSION, self.base, self.fanout,
+                                   self.num_of_samples, source_size, source_mtime))
+
+            for column in (column for level in self.levels for column in level):
+                if (sys.byteorder != "little"):
+                    column = array(column.typecode, column)
+                    column.byteswap()
+
+                f.write (column)
+
+    @staticmethod
+    def load (file_name):
+        with open(file_name, "rb") as f:
+            content = f.read()
+
+        if (len(content) < _HEADER.size):
+            raise M10FormatError ("{0} is not a peak index".format(file_name))
+
+        magic, version, base, fanout, num_of_samples, source_size, source_mtime = _HEADER.unpack_from (content, 0)
+
+        if ((magic != _MAGIC) or (version != _VERSION) or (base == 0) or (fanout < 2)):
+            raise M10FormatError ("{0} is not a peak index".format(file_name))
+
+        levels = []
+        offset = _HEADER.size
+        count = -(-num_of_samples // base)
+
+        while (count):
+            level = []
+            for typecode in ('h', 'h', 'd'):
+                column = array(typecode)
+                end = offset + count * column.itemsize
+
+                if (end > len(content)):
+                    raise M10FormatError ("{0} is cut short".format(file_name))
+
+                column.frombytes (content[offset : end])
+                if (sys.byteorder != "little"):
+                    column.byteswap()
+
+                level.append (column)
+                offset = end
+
+            levels.append (tuple(level))
+            count = 0 if (count == 1) else -(-count // fanout)
+
+        index = Peak_Index (num_of_samples, levels, base, fanout)
+
+        return index, source_size, source_mtime
+
+#============================================================================
+# load_source : samples of a WAV file, or of an SRAM snapshot (as mu-law,
+#   which is what the sketch records)
+#============================================================================
+
+def load_source (file_name):
+    if (file_name.lower().endswith (".wav")):
+        wave_file = _wave_file (file_name)
+        samples = wave_file._data_extract (0)
+        samples = wave_file.to_linear16 (samples, wave_file.bits_per_sample)
+
+        return wave_file.resample (samples, wave_file.sample_rate, SAMPLE_RATE)
+
+    with M10Snapshot.SRAM_Snapshot (file_name) as snapshot:
+        return _wave_file().mulaw_decode (snapshot.image)
+
+#============================================================================
+# peak_index_for : the index kept next to file_name, (re)built if it is
+#   missing or older than the file
+#============================================================================
+
+def peak_index_for (file_name):
+    peaks_file = file_name + ".peaks"
+    stat = os.stat (file_name)
+
+    try:
+        index, source_size, source_mtime = Peak_Index.load (peaks_file)
+        if ((source_size == stat.st_size) and (source_mtime == stat.st_mtime)):
+            return index
+    except (OSError, M10FormatError):
+        pass
+
+    index = Peak_Index.build (load_source (file_name))
+
+    try:
+        index.save (peaks_file, stat.st_size, stat.st_mtime)
+    except OSError:
+        pass
+
+    return index
+
+#============================================================================
+# text_waveform : the columns of a query as lines of text, scaled to the
+#   loudest peak. '|' spans min to max, '#' spans -rms to +rms
+#============================================================================
+
+def text_waveform (columns, rows = 15):
+    peak = max([max(-low, high) for low, high, rms in columns] + [1])
+    half = (rows - 1) / 2
+
+    def row (value):
+        return min(rows - 1, max(0, int(round(half - value * half / peak))))
+
+    grid = [[' '] * len(columns) for i in range (rows)]
+    grid[int(half)] = ['-'] * len(columns)
+
+    for x, (low, high, rms) in enumerate (columns):
+        for y in range (row(high), row(low) + 1):
+            grid[y][x] = '|'
+        for y in range (row(rms), row(-rms) + 1):
+            grid[y][x] = '#'
+
+    lines = ["".join(line) for line in grid]
+    lines.append ("peak {0:.1f} dBFS".format(20 * math.log10(peak / 32768)))
+
+    return lines
+
+#============================================================================
+# preview : text waveform of seconds start to end of index
+#============================================================================
+
+def preview (index, start = 0.0, end = None, width = None, rows = 15):
+    if (width is None):
+        width = shutil.get_terminal_size((80, 24)).columns - 1
+
+    first = int(start * SAMPLE_RATE)
+    last = index.num_of_samples if (end is None) else int(end * SAMPLE_RATE)
+    last = min(last, index.num_of_samples)
+
+    columns = index.query (first, last, width)
+    if (not columns):
+        return ["nothing to show"]
+
+    lines = text_waveform (columns, rows)
+    lines.append ("{0:.2f} s to {1:.2f} s, {2:.1f} ms per column".format(
+                  first / SAMPLE_RATE, last / SAMPLE_RATE, (last - first) * 1000 / SAMPLE_RATE / width))
+
+    return lines
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="waveform preview of a WAV file or SRAM snapshot")
+    parser.add_argument("file_name")
+    parser.add_argument("start", type=float, nargs="?", default=0.0, help="seconds")
+    parser.add_argument("end", type=float, nargs="?", default=None, help="seconds")
+    parser.add_argument("--width", type=int, default=None)
+    parser.add_argument("--rows", type=int, default=15)
+    args = parser.parse_args()
+
+    try:
+        index = peak_index_for (args.file_name)
+    except (OSError, M10FormatError) as e:
+        print (e)
+        sys.exit(1)
+
+    for line in preview (index, args.start, args.end, args.width, args.rows):
+        print (line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Pipeline : background threads next to the serial I/O
+#
+# Remarks:
+#   Most of a transfer is spent waiting for the sketch to answer, and the
+#   serial port releases the GIL while it waits, so work done by a second
+#   thread in that time is free.
+#
+#   Producer runs a generator in a thread, ahead of the I/O thread that
+#   iterates over it (M10Client builds the frames of the next blocks while
+#   the current one is on the wire). The generator fills buffers that it
+#   takes from a fixed pool, and the I/O thread hands each one back once
+#   it is done with it, so the producer is never more than the pool ahead.
+#
+#   Consumer is the other way round: the I/O thread puts what it received,
+#   and a thread works on it (M10Client.save decodes the blocks as they
+#   come in). put() blocks once depth items are waiting.
+#
+#   An exception in the thread is raised again in the I/O thread, and
+#   leaving the with block for any reason (Ctrl-C included) stops the
+#   thread.
+#
+#       with Producer (frames, [bytearray(4096) for i in range (4)]) as producer:
+#           for buffer in producer:
+#               port.write (buffer)
+#               producer.release (buffer)
+###############################################################################
+
+import queue
+import threading
+
+# how often a blocked thread looks for a stop
+_POLL_SECONDS = 0.1
+
+_END = object()
+
+class _Stopped (Exception):
+    pass
+
+#############################################################################
+# Producer
+#############################################################################
+
+class Producer:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    produce : generator function, called in the thread as
+    #              produce(take). take() returns a free buffer of the pool,
+    #              waiting for one if needed
+    #    buffers : the pool
+    #========================================================================
+
+    def __init__ (self, produce, buffers, name = "M10 producer"):
+        self._produce = produce
+
+        self._free = queue.Queue()
+        for buffer in buffers:
+            self._free.put (buffer)
+
+        self._ready = queue.Queue()
+        self._stop = threading.Event()
+
+        self._thread = threading.Thread (target = self._run, name = name, daemon = True)
+        self._thread.start()
+
+    def _take (self):
+        while (1):
+            if (self._stop.is_set()):
+                raise _Stopped
+
+            try:
+                return self._free.get (timeout = _POLL_SECONDS)
+            except queue.Empty:
+                pass
+
+    def _run (self):
+        try:
+            for item in self._produce (self._take):
+                if (self._stop.is_set()):
+                    return
+                self._ready.put ((item, None))
+
+            self._ready.put ((_END, None))
+        except _Stopped:
+            pass
+        except BaseException as e:
+            self._ready.put ((None, e))
+
+    def __iter__ (self):
+        return self
+
+    def __next__ (self):
+        item, error = self._ready.get()
+
+        if (error is not None):
+            raise error
+
+        if (item is _END):
+            self._ready.put ((_END, None))
+            raise StopIteration
+
+        return item
+
+    def release (self, buffer):
+        self._free.put (buffer)
+
+    def close (self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, *args):
+        self.close()
+
+#############################################################################
+# Consumer
+#############################################################################
+
+class Consumer:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    consume : function, called in the thread with each item, in the
+    #              order they were put
+    #    depth   : items that can wait before put() blocks
+    #========================================================================
+
+    def __init__ (self, consume, depth = 8, name = "M10 consumer"):
+        self._consume = consume
+        self._items = queue.Queue (depth)
+        self._stop = threading.Event()
+        self._error = None
+
+        self._thread = threading.Thread (target = self._run, name = name, daemon = True)
+        self._thread.start()
+
+    def _run (self):
+        while (1):
+            try:
+                item = self._items.get (timeout = _POLL_SECONDS)
+            except queue.Empty:
+                if (self._stop.is_set()):
+                    return
+                continue
+
+            if ((item is _END) or self._stop.is_set()):
+                return
+
+            if (self._error is None):
+                try:
+                    self._consume (item)
+                except BaseException as e:
+                    self._error = e
+
+    def put (self, item):
+        if (self._error is not None):
+            raise self._error
+
+        self._items.put (item)
+
+    #========================================================================
+    # finish : wait for every item to be consumed
+    #========================================================================
+
+    def finish (self):
+        self._items.put (_END)
+        self._thread.join()
+
+        if (self._error is not None):
+            raise self._error
+
+    def close (self):
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, *args):
+        self.close()
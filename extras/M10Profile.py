@@ -0,0 +1,250 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Profile : CPU profile of console commands
+#
+# Remarks:
+#   Command_Profiler runs a command under cProfile, and at the same time
+#   samples the stack of the thread every millisecond (where the
+#   interpreter can list the frames of other threads), along with the
+#   threads the command starts (see M10Pipeline.py), which cProfile does
+#   not see. For each command it writes
+#     prefix-001-load_wav.pstats    : cProfile statistics, for pstats or
+#                                     snakeviz
+#     prefix-001-load_wav.collapsed : the sampled stacks, one line per
+#                                     stack "a;b;c count", for
+#                                     flamegraph.pl or speedscope
+#   and prints the time spent in codec, CRC, list building and serial
+#   code, and the functions that took the most time of their own.
+#
+#   The samples are wall clock time, so they show the time spent waiting
+#   for the board too, which cProfile puts in the serial read.
+#
+#   wav_console imports this module only for --profile or the profile
+#   command, so it costs nothing otherwise.
+#
+# Usage:
+#   Python wav_console.py COM6 --profile
+#   >> profile load_wav song.wav
+#
+#   Python M10Profile.py m10profile-001-load_wav.pstats --top 20
+###############################################################################
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import threading
+
+from collections import Counter
+from time import sleep
+
+DEFAULT_PREFIX = "m10profile"
+
+# seconds between stack samples
+SAMPLE_INTERVAL = 0.001
+
+# (category, file names, names of built in functions)
+_CATEGORIES = (
+    ('codec',  ('wave_file.py', 'M10DSP.py', 'M10Tables.py'), ()),
+    ('crc',    ('CRC16_CCITT.py',), ('crc_hqx', 'crc32')),
+    ('lists',  (), ("of 'list' objects", "of 'bytearray' objects", '<listcomp>', '<genexpr>', 'built-in method builtins.map')),
+    ('serial', ('serialposix.py', 'serialwin32.py', 'serialutil.py', 'M10Emulator.py', 'M10Trace.py'),
+               ('select.select', 'posix.read', 'posix.write', 'ReadFile', 'WriteFile'))
+)
+
+#============================================================================
+# category : category of a pstats function key (file, line, name)
+#============================================================================
+
+def category (key):
+    file_name, line, name = key
+    base_name = os.path.basename (file_name)
+
+    for category_name, file_names, names in _CATEGORIES:
+        if ((base_name in file_names) or any((i in name) for i in names)):
+            return category_name
+
+    return 'other'
+
+def _label (key):
+    file_name, line, name = key
+
+    if (file_name == "~"):
+        return name
+
+    return "{0}:{1:d}({2})".format(os.path.basename(file_name), line, name)
+
+#============================================================================
+# summary : lines of text, the time of each category and the top functions
+#   by their own time, from a pstats.Stats
+#============================================================================
+
+def summary (stats, top = 10):
+    totals = Counter()
+    functions = []
+
+    for key, (cc, nc, tt, ct, callers) in stats.stats.items():
+        totals[category (key)] += tt
+        functions.append ((tt, nc, key))
+
+    lines = ["  " + "  ".join("{0} {1:.3f} s".format(name, totals[name])
+                              for name in ('codec', 'crc', 'lists', 'serial', 'other'))]
+
+    lines.append ("  own time   calls  category  function")
+    for tt, nc, key in sorted (functions, key = lambda i : i[0], reverse = True)[0:top]:
+        lines.append ("  {0:7.3f} s {1:7d}  {2:<8s}  {3}".format(tt, nc, category (key), _label (key)))
+
+    return lines
+
+#############################################################################
+# Stack_Sampler : samples the stack of a thread, and of the threads started
+#   after the sampler, from a thread of its own
+#############################################################################
+
+class Stack_Sampler:
+
+    available = hasattr (sys, "_current_frames")
+
+    def __init__ (self, thread_id, interval = SAMPLE_INTERVAL):
+        self._interval = interval
+
+        # threads that were there before, such as the console input
+        self._ignore = set(sys._current_frames()) - set([thread_id])
+        self._stop = threading.Event()
+        self.stacks = Counter()
+
+        self._thread = threading.Thread (target = self._run, name = "M10Profile sampler", daemon = True)
+
+    def start (self):
+        self._thread.start()
+
+    def stop (self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run (self):
+        own_id = threading.get_ident()
+
+        while (not self._stop.is_set()):
+            for thread_id, frame in sys._current_frames().items():
+                if ((thread_id == own_id) or (thread_id in self._ignore)):
+                    continue
+
+                stack = []
+                while (frame is not None):
+                    code = frame.f_code
+                    stack.append ("{0}:{1}".format(os.path.basename(code.co_filename), code.co_name))
+                    frame = frame.f_back
+
+                if (stack):
+                    self.stacks[";".join(reversed(stack))] += 1
+
+            sleep (self._interval)
+
+    def write_collapsed (self, file_name):
+        with open(file_name, "w") as f:
+            for stack, count in sorted (self.stacks.items()):
+                f.write ("{0} {1:d}\n".format(stack, count))
+
+#############################################################################
+# Command_Profiler
+#############################################################################
+
+class Command_Profiler:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    prefix : start of the names of the files written, may include a
+    #             directory
+    #    top    : functions listed in the summary
+    #========================================================================
+
+    def __init__ (self, prefix = DEFAULT_PREFIX, top = 10):
+        self.prefix = prefix
+        self.top = top
+        self.count = 0
+
+    #========================================================================
+    # run : function(*args) under the profiler, returns what it returns
+    #========================================================================
+
+    def run (self, name, function, *args):
+        self.count = self.count + 1
+        base_name = "{0}-{1:03d}-{2}".format(self.prefix, self.count, name)
+
+        sampler = None
+        if (Stack_Sampler.available):
+            sampler = Stack_Sampler (threading.get_ident())
+            sampler.start()
+
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            return function (*args)
+        finally:
+            profile.disable()
+            if (sampler is not None):
+                sampler.stop()
+
+            self._report (base_name, profile, sampler)
+
+    def _report (self, base_name, profile, sampler):
+        files = [base_name + ".pstats"]
+        profile.dump_stats (files[0])
+
+        if (sampler is not None):
+            files.append (base_name + ".collapsed")
+            sampler.write_collapsed (files[1])
+
+        stats = pstats.Stats (profile)
+
+        print ("\nprofile: {0:.3f} s, written {1}".format(stats.total_tt, " ".join(files)))
+        for line in summary (stats, self.top):
+            print (line)
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="summary of a profile written by wav_console --profile")
+    parser.add_argument("pstats_file")
+    parser.add_argument("--top", type=int, default=10, help="functions to list")
+    args = parser.parse_args()
+
+    try:
+        stats = pstats.Stats (args.pstats_file)
+    except (OSError, TypeError, ValueError) as e:
+        print (e)
+        sys.exit(1)
+
+    print ("{0}: {1:.3f} s".format(args.pstats_file, stats.total_tt))
+    for line in summary (stats, args.top):
+        print (line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Progress : rate limited progress reporting for transfers
+#
+# Remarks:
+#   A Progress object is passed to M10Client as the progress callback.
+#   Each call only stores the counters and looks at the clock; the sink
+#   is invoked at most "rate" times per second, and once more at the end.
+#
+#   Sinks receive a Progress_State and decide how to show it:
+#     Quiet_Sink : nothing
+#     TTY_Sink   : single status line, rewritten in place
+#     JSON_Sink  : one JSON object per line, for other programs to parse
+###############################################################################
+
+import json
+import sys
+
+from time import monotonic
+
+#############################################################################
+# Progress_State : snapshot handed to the sinks
+#############################################################################
+
+class Progress_State:
+
+    def __init__ (self, label, done, total, elapsed):
+        self.label = label
+        self.done = done
+        self.total = total
+        self.elapsed = elapsed
+
+        if (elapsed > 0):
+            self.rate = done / elapsed
+        else:
+            self.rate = 0.0
+
+        if ((self.rate > 0) and (total > done)):
+            self.eta = (total - done) / self.rate
+        else:
+            self.eta = 0.0
+
+    @property
+    def percent (self):
+        if (self.total):
+            return self.done * 100.0 / self.total
+        else:
+            return 100.0
+
+    def as_dict (self):
+        return {"label"   : self.label,
+                "done"    : self.done,
+                "total"   : self.total,
+                "percent" : round(self.percent, 1),
+                "elapsed" : round(self.elapsed, 3),
+                "rate"    : round(self.rate, 1),
+                "eta"     : round(self.eta, 3)}
+
+
+#############################################################################
+# sinks
+#############################################################################
+
+class Quiet_Sink:
+
+    def update (self, state):
+        pass
+
+    def finish (self, state):
+        pass
+
+class TTY_Sink:
+
+    _LINE_LENGTH = 72
+
+    def __init__ (self, stream = None):
+        self._stream = stream if stream is not None else sys.stdout
+
+    def _line (self, state):
+        line = "{0} {1:5.1f} % {2:7.1f} KB/s  ETA {3:5.1f} s".format(
+            state.label, state.percent, state.rate / 1024, state.eta)
+
+        return "\r" + line.ljust(TTY_Sink._LINE_LENGTH)
+
+    def update (self, state):
+        self._stream.write (self._line (state))
+        self._stream.flush()
+
+    def finish (self, state):
+        line = "{0} {1:d} bytes in {2:.2f} s, {3:.1f} KB/s".format(
+            state.label, state.done, state.elapsed, state.rate / 1024)
+
+        self._stream.write ("\r" + line.ljust(TTY_Sink._LINE_LENGTH) + "\n")
+        self._stream.flush()
+
+class JSON_Sink:
+
+    def __init__ (self, stream = None):
+        self._stream = stream if stream is not None else sys.stdout
+
+    def _write (self, state, event):
+        record = state.as_dict()
+        record["event"] = event
+        self._stream.write (json.dumps(record) + "\n")
+        self._stream.flush()
+
+    def update (self, state):
+        self._write (state, "progress")
+
+    def finish (self, state):
+        self._write (state, "done")
+
+_SINKS = {
+    'tty'   : TTY_Sink,
+    'quiet' : Quiet_Sink,
+    'json'  : JSON_Sink
+}
+
+#============================================================================
+# make_sink : sink by name, such as "tty", "quiet" or "json". A sink object
+#   is returned as it is
+#============================================================================
+
+def make_sink (name):
+    if (not isinstance(name, str)):
+        return name
+
+    return _SINKS[name]()
+
+
+#############################################################################
+# Progress
+#############################################################################
+
+class Progress:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    sink  : where the progress goes, Quiet_Sink if None
+    #    label : text shown in front of the numbers
+    #    rate  : maximum number of sink updates per second
+    #========================================================================
+
+    def __init__ (self, sink = None, label = "", rate = 10):
+        self.sink = sink if sink is not None else Quiet_Sink()
+        self.label = label
+        self._interval = 1.0 / rate
+
+        self.start()
+
+    def start (self, label = None):
+        if (label is not None):
+            self.label = label
+
+        self.done = 0
+        self.total = 0
+        self._start_time = monotonic()
+        self._next_update = self._start_time + self._interval
+
+    def __call__ (self, done, total):
+        self.done = done
+        self.total = total
+
+        now = monotonic()
+        if (now >= self._next_update):
+            self._next_update = now + self._interval
+            self.sink.update (Progress_State (self.label, done, total, now - self._start_time))
+
+    def finish (self):
+        state = Progress_State (self.label, self.done, self.total, monotonic() - self._start_time)
+        self.sink.finish (state)
+
+        return state
@@ -0,0 +1,272 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Registers : cached map of the Si3000 registers
+#
+# Remarks:
+#   Registers and fields are named after M10CODEC.h, in lower case and
+#   without the SI3000_ prefix (dac_vol_control, txg, ...).
+#
+#   Register_Map keeps the last known value of every register, so reads
+#   only go to the board for registers it has not seen (status_report is
+#   always read). Writes of an unchanged value are dropped, and fields are
+#   set without reading the register again.
+#
+#   Inside a transaction, writes only mark the register dirty, and all the
+#   dirty registers go out together when it ends, the last value of each,
+#   in the order they were first written. M10Client.codec_registers() puts
+#   them into as few frames as it can, so each step of a sweep costs one
+#   frame:
+#
+#       regs = Register_Map (m10)
+#       for gain in range (32):
+#           with regs.transaction():
+#               regs.set_field ('txg', gain)
+#               regs.set_field ('rxg', gain)
+#           ... record / measure ...
+###############################################################################
+
+from contextlib import contextmanager
+
+from M10Errors import M10Error
+
+REGISTERS = {
+    'control_1'         : 1,
+    'control_2'         : 2,
+    'pll1_div_n1'       : 3,
+    'pll1_mul_m1'       : 4,
+    'rx_gain_control_1' : 5,
+    'adc_vol_control'   : 6,
+    'dac_vol_control'   : 7,
+    'status_report'     : 8,
+    'analog_atten'      : 9
+}
+
+# name : (register, shift, width)
+FIELDS = {
+    'sr'   : (1, 7, 1),
+    'spd'  : (1, 4, 1),
+    'lpd'  : (1, 3, 1),
+    'hpd'  : (1, 2, 1),
+    'mpd'  : (1, 1, 1),
+    'cpd'  : (1, 0, 1),
+
+    'hpfd' : (2, 4, 1),
+    'pll'  : (2, 3, 1),
+    'dl1'  : (2, 2, 1),
+    'dl2'  : (2, 1, 1),
+
+    'lig'  : (5, 6, 2),
+    'lim'  : (5, 5, 1),
+    'mcg'  : (5, 3, 2),
+    'mcm'  : (5, 2, 1),
+    'him'  : (5, 1, 1),
+    'iir'  : (5, 0, 1),
+
+    'rxg'  : (6, 2, 5),
+    'lom'  : (6, 1, 1),
+    'hom'  : (6, 0, 1),
+
+    'txg'  : (7, 2, 5),
+    'slm'  : (7, 1, 1),
+    'srm'  : (7, 0, 1),
+
+    'slsc' : (8, 7, 1),
+    'srsc' : (8, 6, 1),
+    'losc' : (8, 5, 1),
+
+    'lot'  : (9, 2, 2),
+    'sot'  : (9, 0, 2)
+}
+
+# registers the Si3000 changes by itself
+VOLATILE = (REGISTERS['status_report'],)
+
+#============================================================================
+# register_number : register number of a name, or of a number as a string
+#============================================================================
+
+def register_number (register):
+    if (isinstance(register, int)):
+        number = register
+    elif (register in REGISTERS):
+        number = REGISTERS[register]
+    else:
+        try:
+            number = int(register, 0)
+        except ValueError:
+            raise M10Error ("no register {0}".format(register))
+
+    if ((number < 0) or (number > 0x1F)):
+        raise M10Error ("no register {0}".format(register))
+
+    return number
+
+#############################################################################
+# Register_Map
+#############################################################################
+
+class Register_Map:
+
+    def __init__ (self, client):
+        self._client = client
+        self._values = {}
+
+        # register : value, in the order they were first written
+        self._dirty = {}
+        self._depth = 0
+
+    #========================================================================
+    # read / read_many : cached values, the missing ones read in one go
+    #========================================================================
+
+    def read (self, register):
+        return self.read_many ([register])[0]
+
+    def read_many (self, registers):
+        numbers = [register_number (register) for register in registers]
+
+        missing = []
+        for number in numbers:
+            if (((number not in self._values) or (number in VOLATILE)) and
+                (number not in self._dirty) and (number not in missing)):
+                missing.append (number)
+
+        if (missing):
+            values = self._client.codec_registers ([(number, None) for number in missing])
+            for number, value in zip(missing, values):
+                self._values[number] = value & 0xFF
+
+        return [self._values[number] for number in numbers]
+
+    #========================================================================
+    # write : sent at once, or at the end of the transaction
+    #========================================================================
+
+    def write (self, register, value):
+        number = register_number (register)
+        value = value & 0xFF
+
+        if ((self._values.get (number) == value) and (number not in VOLATILE)):
+            return
+
+        self._values[number] = value
+        self._dirty[number] = value
+
+        if (self._depth == 0):
+            self.flush()
+
+    #========================================================================
+    # get_field / set_field
+    #========================================================================
+
+    def get_field (self, field):
+        register, shift, width = self._field (field)
+
+        return (self.read (register) >> shift) & ((1 << width) - 1)
+
+    def set_field (self, field, value):
+        register, shift, width = self._field (field)
+        mask = ((1 << width) - 1) << shift
+
+        if ((value < 0) or (value >= (1 << width))):
+            raise M10Error ("{0} takes 0 to {1:d}".format(field, (1 << width) - 1))
+
+        self.write (register, (self.read (register) & ~mask) | (value << shift))
+
+    def _field (self, field):
+        if (field not in FIELDS):
+            raise M10Error ("no field {0}".format(field))
+
+        return FIELDS[field]
+
+    #========================================================================
+    # flush : write the dirty registers
+    #========================================================================
+
+    def flush (self):
+        if (self._dirty):
+            ops = list(self._dirty.items())
+            self._dirty = {}
+
+            try:
+                self._client.codec_registers (ops)
+            except M10Error:
+                # what the board holds is not known any more
+                for number, value in ops:
+                    self._values.pop (number, None)
+                raise
+
+    #========================================================================
+    # transaction : writes are held back until the outermost transaction
+    #   ends, and dropped if it ends with an exception
+    #========================================================================
+
+    @contextmanager
+    def transaction (self):
+        self._depth = self._depth + 1
+
+        try:
+            yield self
+        except BaseException:
+            self._depth = self._depth - 1
+            if (self._depth == 0):
+                for number in self._dirty:
+                    self._values.pop (number, None)
+                self._dirty = {}
+            raise
+
+        self._depth = self._depth - 1
+
+        if (self._depth == 0):
+            self.flush()
+
+    #========================================================================
+    # invalidate : forget the cached value of a register, or of all, after
+    #   something else changed them (volume_up, a reset of the board ...)
+    #========================================================================
+
+    def invalidate (self, register = None):
+        if (register is None):
+            self._values = {}
+        else:
+            self._values.pop (register_number (register), None)
+
+    @property
+    def dirty (self):
+        return list(self._dirty)
+
+    #========================================================================
+    # describe : every register, read in one go
+    #========================================================================
+
+    def describe (self):
+        names = sorted (REGISTERS, key = REGISTERS.get)
+        values = self.read_many (names)
+
+        lines = []
+        for name, value in zip(names, values):
+            number = REGISTERS[name]
+            fields = ["{0}={1:d}".format(field, (value >> shift) & ((1 << width) - 1))
+                      for field, (register, shift, width) in FIELDS.items() if (register == number)]
+
+            lines.append ("  {0:2d} {1:<18s} 0x{2:02x}  {3}".format(number, name, value, " ".join(fields)))
+
+        return lines
@@ -0,0 +1,274 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Snapshot : raw SRAM snapshot files
+#
+# Remarks:
+#   File layout (all little endian):
+#     offset 0  : 64 byte header, see _HEADER
+#     offset 64 : block index, one CRC16_CCITT per 128 byte block
+#     then      : the raw SRAM image
+#
+#   Snapshots are memory mapped, so the image and the index can be used
+#   without reading the file. Two snapshots are compared with one slice
+#   compare per block, and only blocks that differ are looked at byte by
+#   byte, which makes comparing many snapshots against a reference cheap.
+#   The index is what lets a restore skip the blocks a board already has.
+#
+# Usage:
+#   Python M10Snapshot.py diff reference.snap board1.snap board2.snap ...
+###############################################################################
+
+import binascii
+import mmap
+import struct
+import sys
+
+from array import array
+from time import time
+
+from M10Errors import M10FormatError
+
+_MAGIC = b"M10SRAM\x00"
+_VERSION = 1
+
+# magic, version, block_size, num_of_blocks, image_crc, timestamp, port
+_HEADER = struct.Struct("<8sHHIH2xd32s4x")
+_HEADER_SIZE = 64
+
+BLOCK_SIZE = 128
+
+#============================================================================
+# crc16 : same CRC as CRC16_CCITT.get_crc(), as a single integer
+#============================================================================
+
+def crc16 (data):
+    return binascii.crc_hqx (data, 0xFFFF)
+
+#============================================================================
+# block_index : CRC of every block_size bytes of image
+#============================================================================
+
+def block_index (image, block_size = BLOCK_SIZE):
+    view = memoryview(image)
+    return array('H', [binascii.crc_hqx (view[i : i + block_size], 0xFFFF)
+                       for i in range (0, len(view), block_size)])
+
+#============================================================================
+# changed_blocks : blocks whose CRC differs from base_index.
+#   Blocks beyond the end of base_index count as changed
+#============================================================================
+
+def changed_blocks (index, base_index):
+    if (base_index is None):
+        return list(range(len(index)))
+
+    if (index == base_index):
+        return []
+
+    return [i for i in range(len(index)) if (i >= len(base_index)) or (index[i] != base_index[i])]
+
+#============================================================================
+# diff_images
+#------------------------------------------------------------------------
+# Remarks: return the changed byte ranges as a list of (start, end),
+#   end exclusive. Equal blocks are skipped with a single slice compare,
+#   only the blocks that differ are scanned byte by byte
+#============================================================================
+
+def diff_images (image_a, image_b, block_size = BLOCK_SIZE):
+    a = memoryview(image_a)
+    b = memoryview(image_b)
+
+    common = min(len(a), len(b))
+    ranges = []
+    start = -1
+
+    for block_start in range (0, common, block_size):
+        block_end = min(block_start + block_size, common)
+
+        if (a[block_start : block_end] == b[block_start : block_end]):
+            if (start >= 0):
+                ranges.append ((start, block_start))
+                start = -1
+            continue
+
+        for i in range (block_start, block_end):
+            if (a[i] != b[i]):
+                if (start < 0):
+                    start = i
+            elif (start >= 0):
+                ranges.append ((start, i))
+                start = -1
+
+    if (start >= 0):
+        ranges.append ((start, common))
+
+    if (len(a) != len(b)):
+        if (ranges and (ranges[-1][1] == common)):
+            ranges[-1] = (ranges[-1][0], max(len(a), len(b)))
+        else:
+            ranges.append ((common, max(len(a), len(b))))
+
+    return ranges
+
+#============================================================================
+# write_snapshot
+#============================================================================
+
+def write_snapshot (file_name, image, port = "", index = None):
+    if (index is None):
+        index = block_index (image)
+
+    num_of_blocks = (len(image) + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+    header = _HEADER.pack (_MAGIC, _VERSION, BLOCK_SIZE, num_of_blocks,
+                           crc16 (image), time(), port.encode()[0:32])
+
+    index_bytes = array('H', index)
+    if (sys.byteorder != "little"):
+        index_bytes.byteswap()
+
+    with open(file_name, "wb") as f:
+        f.write (header)
+        f.write (index_bytes)
+        f.write (image)
+
+    return index
+
+#############################################################################
+# SRAM_Snapshot : a snapshot file, memory mapped
+#############################################################################
+
+class SRAM_Snapshot:
+
+    def __init__ (self, file_name):
+        self.file_name = file_name
+
+        with open(file_name, "rb") as f:
+            try:
+                self._mmap = mmap.mmap (f.fileno(), 0, access = mmap.ACCESS_READ)
+            except ValueError:
+                raise M10FormatError ("{0} is empty".format(file_name))
+
+        self._view = view = memoryview(self._mmap)
+
+        self.image = None
+
+        if (len(view) < _HEADER_SIZE):
+            self.close()
+            raise M10FormatError ("{0} is not an SRAM snapshot".format(file_name))
+
+        (magic, version, self.block_size, self.num_of_blocks,
+         self.image_crc, self.timestamp, port) = _HEADER.unpack_from (view)
+
+        if ((magic != _MAGIC) or (version != _VERSION)):
+            self.close()
+            raise M10FormatError ("{0} is not an SRAM snapshot".format(file_name))
+
+        self.port = port.rstrip(b"\x00").decode(errors = "replace")
+
+        image_start = _HEADER_SIZE + 2 * self.num_of_blocks
+
+        self.index = array('H')
+        self.index.frombytes (view[_HEADER_SIZE : image_start])
+        if (sys.byteorder != "little"):
+            self.index.byteswap()
+
+        self.image = view[image_start:]
+
+    def verify (self):
+        return (crc16 (self.image) == self.image_crc) and (block_index (self.image, self.block_size) == self.index)
+
+    def close (self):
+        if (self.image is not None):
+            self.image.release()
+            self.image = None
+
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        self.close()
+
+#============================================================================
+# diff_snapshots
+#------------------------------------------------------------------------
+# Remarks: equal image CRC and equal index is taken as a quick "maybe
+#   equal", which is then confirmed with a single compare of the images
+#============================================================================
+
+def diff_snapshots (snapshot_a, snapshot_b):
+    if ((snapshot_a.image_crc == snapshot_b.image_crc) and
+        (snapshot_a.index == snapshot_b.index) and
+        (snapshot_a.image == snapshot_b.image)):
+        return []
+
+    return diff_images (snapshot_a.image, snapshot_b.image, snapshot_a.block_size)
+
+#============================================================================
+# format_ranges
+#============================================================================
+
+def format_ranges (ranges):
+    lines = []
+    for start, end in ranges:
+        lines.append ("  0x{0:05x} - 0x{1:05x}  ({2:d} bytes)".format(start, end - 1, end - start))
+
+    return lines
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    if ((len(sys.argv) < 4) or (sys.argv[1] != "diff")):
+        print ("Usage: Python M10Snapshot.py diff reference.snap snapshot.snap ...")
+        sys.exit(1)
+
+    exit_code = 0
+
+    with SRAM_Snapshot (sys.argv[2]) as reference:
+        for file_name in sys.argv[3:]:
+            try:
+                with SRAM_Snapshot (file_name) as snapshot:
+                    ranges = diff_snapshots (reference, snapshot)
+            except (OSError, M10FormatError) as e:
+                print (file_name, ":", e)
+                exit_code = 2
+                continue
+
+            if (ranges):
+                print (file_name, ": {0:d} changed ranges".format(len(ranges)))
+                for line in format_ranges (ranges):
+                    print (line)
+                exit_code = max(exit_code, 1)
+            else:
+                print (file_name, ": identical")
+
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
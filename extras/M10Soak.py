@@ -0,0 +1,376 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Soak : endurance test of the console and the board
+#
+# Remarks:
+#   Runs a sequence of console commands over and over, against a board or
+#   the emulator (see M10Emulator.py), and writes one JSON line per cycle:
+#     cycle, time, seconds   : when, and how long the cycle took
+#     kbps                   : KB/s of the transfers of the cycle
+#     retries                : CRC errors and timeouts of the cycle
+#     errors                 : commands that failed
+#     heap_kb, heap_peak_kb  : Python heap after the cycle (tracemalloc,
+#                              after a garbage collection, less what the
+#                              soak itself holds)
+#
+#   The first --warmup cycles are not measured against, the next
+#   --baseline cycles set the baseline (medians). From then on the median
+#   of the last --window cycles is compared with it, and flagged when
+#     - throughput drops by more than --max-slowdown percent
+#     - the heap grows by more than --max-growth KB (the lines that
+#       allocated the most since the baseline are printed)
+#     - the retries per cycle go over --max-retries
+#     - more than --max-errors commands failed in all
+#   The exit code is 1 if anything was flagged, for CI.
+#
+#   Commands are separated by ';'. Besides the console commands, "stop"
+#   stops the board and "wait 2.5" sleeps, to let a play or record run.
+#
+#   tracemalloc slows Python down a lot, --no-tracemalloc measures the
+#   throughput without it.
+#
+# Usage:
+#   Python M10Soak.py --emulator "load_wav song.wav; play; stop; record 2; save_wav out.wav" --cycles 200
+#   Python M10Soak.py COM6 "load_wav song.wav; play; wait 3; stop" --hours 48 --output soak.jsonl
+###############################################################################
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import statistics
+import sys
+import tracemalloc
+
+from collections import deque
+from time import monotonic, sleep, time
+
+from M10Errors import M10Error
+
+DEFAULT_OUTPUT = "soak.jsonl"
+
+#============================================================================
+# parse_sequence : the commands of a cycle, from "cmd args; cmd args ..."
+#============================================================================
+
+def parse_sequence (text):
+    commands = [command.strip() for command in text.split (";")]
+
+    return [command for command in commands if (command)]
+
+#############################################################################
+# Transfer_Sink : progress sink that keeps the totals of the transfers
+#############################################################################
+
+class Transfer_Sink:
+
+    def __init__ (self):
+        self.reset()
+
+    def reset (self):
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def update (self, state):
+        pass
+
+    def finish (self, state):
+        self.bytes = self.bytes + state.done
+        self.seconds = self.seconds + state.elapsed
+
+#############################################################################
+# Soak
+#############################################################################
+
+class Soak:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    console   : Wav_Console to run the commands on, made with
+    #                sink as its progress sink
+    #    sink      : Transfer_Sink
+    #    commands  : list of command lines
+    #    output    : file for the JSON lines
+    #    args      : the thresholds, see main()
+    #========================================================================
+
+    def __init__ (self, console, sink, commands, output, args):
+        self._console = console
+        self._sink = sink
+        self._commands = commands
+        self._output = output
+        self._args = args
+
+        # only what the checks need is kept, so the soak itself does not
+        # grow: the baseline cycles, then the last window
+        self.cycles = 0
+        self._measured = []
+        self._window = deque(maxlen = args.window)
+
+        self.flags = {}
+        self.errors = 0
+
+        self._baseline = None
+        self._snapshot = None
+
+        # heap taken by the snapshot of the baseline
+        self._own_heap = 0
+
+    #========================================================================
+    # run_cycle : the commands once, returns the record of the cycle
+    #========================================================================
+
+    def run_cycle (self, cycle):
+        m10 = self._console.client
+        link_before = m10.link_stats()
+        self._sink.reset()
+
+        errors = []
+        start_time = monotonic()
+
+        for command in self._commands:
+            words = command.split()
+
+            try:
+                with contextlib.redirect_stdout (sys.stdout if self._args.verbose else io.StringIO()):
+                    if (words[0] == "wait"):
+                        sleep (float(words[1]))
+                    elif (words[0] == "stop"):
+                        self._console.execute ("")
+                    else:
+                        self._console.execute (command)
+            except (M10Error, OSError, ValueError, IndexError) as e:
+                errors.append ("{0}: {1}".format(command, e))
+
+        seconds = monotonic() - start_time
+        link_after = m10.link_stats()
+
+        record = {
+            "cycle"   : cycle,
+            "time"    : round(time(), 3),
+            "seconds" : round(seconds, 3),
+            "kbps"    : round(self._sink.bytes / self._sink.seconds / 1024, 2) if (self._sink.seconds > 0) else None,
+            "retries" : ((link_after['crc_errors'] + link_after['timeouts']) -
+                         (link_before['crc_errors'] + link_before['timeouts'])),
+            "errors"  : len(errors)
+        }
+
+        if (tracemalloc.is_tracing()):
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            record["heap_kb"] = round((current - self._own_heap) / 1024, 1)
+            record["heap_peak_kb"] = round((peak - self._own_heap) / 1024, 1)
+            if (hasattr (tracemalloc, "reset_peak")):
+                tracemalloc.reset_peak()
+
+        if (errors):
+            record["error_messages"] = errors
+            self.errors = self.errors + len(errors)
+
+        self.cycles = cycle
+        if (cycle > self._args.warmup):
+            if (self._baseline is None):
+                self._measured.append (record)
+            self._window.append (record)
+
+        return record
+
+    #========================================================================
+    # check : compare the latest cycles with the baseline, returns the new
+    #   flags
+    #========================================================================
+
+    def _median (self, records, name):
+        values = [record[name] for record in records if (record.get (name) is not None)]
+
+        return statistics.median (values) if (values) else None
+
+    def check (self):
+        args = self._args
+        new_flags = []
+
+        if ((self._baseline is None) and (len(self._measured) >= args.baseline)):
+            self._baseline = {name : self._median (self._measured, name) for name in ("kbps", "heap_kb", "retries")}
+            self._measured = []
+            self._window.clear()
+
+            if (tracemalloc.is_tracing()):
+                before = tracemalloc.get_traced_memory()[0]
+                self._snapshot = tracemalloc.take_snapshot()
+                self._own_heap = tracemalloc.get_traced_memory()[0] - before
+
+        if ((self.errors > args.max_errors) and ('errors' not in self.flags)):
+            new_flags.append (('errors', "{0:d} commands failed".format(self.errors)))
+
+        if ((self._baseline is not None) and (len(self._window) == args.window)):
+            window = list(self._window)
+
+            kbps = self._median (window, "kbps")
+            base_kbps = self._baseline["kbps"]
+            if ((kbps is not None) and base_kbps and (kbps < base_kbps * (1 - args.max_slowdown / 100))):
+                new_flags.append (('slowdown', "throughput {0:.1f} KB/s, baseline {1:.1f} KB/s".format(kbps, base_kbps)))
+
+            heap = self._median (window, "heap_kb")
+            base_heap = self._baseline["heap_kb"]
+            if ((heap is not None) and (base_heap is not None) and (heap - base_heap > args.max_growth)):
+                new_flags.append (('leak', "heap {0:.0f} KB, baseline {1:.0f} KB".format(heap, base_heap)))
+
+            retries = self._median (window, "retries")
+            if ((args.max_retries is not None) and (retries > args.max_retries)):
+                new_flags.append (('retries', "{0:g} retries per cycle".format(retries)))
+
+        new_flags = [(name, text) for name, text in new_flags if (name not in self.flags)]
+        for name, text in new_flags:
+            self.flags[name] = (self.cycles, text)
+
+        return new_flags
+
+    #========================================================================
+    # top_growth : the lines that allocated the most since the baseline,
+    #   other than tracemalloc and the soak
+    #========================================================================
+
+    def top_growth (self, count = 5):
+        if ((self._snapshot is None) or (not tracemalloc.is_tracing())):
+            return []
+
+        own = [tracemalloc.Filter (False, tracemalloc.__file__), tracemalloc.Filter (False, __file__)]
+
+        snapshot = tracemalloc.take_snapshot().filter_traces (own)
+        stats = snapshot.compare_to (self._snapshot.filter_traces (own), "lineno")
+
+        return ["  {0:+9.1f} KB  {1}".format(stat.size_diff / 1024, stat.traceback)
+                for stat in stats[0:count] if (stat.size_diff > 0)]
+
+    #========================================================================
+    # run : cycles until the count or the time is reached, or Ctrl-C
+    #========================================================================
+
+    def run (self):
+        args = self._args
+        end_time = None if (args.hours is None) else monotonic() + args.hours * 3600
+
+        with open(self._output, "w") as f:
+            try:
+                cycle = 0
+                while (((args.cycles is None) or (cycle < args.cycles)) and
+                       ((end_time is None) or (monotonic() < end_time))):
+                    cycle = cycle + 1
+                    record = self.run_cycle (cycle)
+
+                    f.write (json.dumps (record) + "\n")
+                    f.flush()
+
+                    print ("cycle {0:d}: {1:.2f} s, {2} KB/s, {3:d} retries, {4:d} errors{5}".format(
+                           cycle, record["seconds"], "-" if (record["kbps"] is None) else record["kbps"],
+                           record["retries"], record["errors"],
+                           ", heap {0:.0f} KB".format(record["heap_kb"]) if ("heap_kb" in record) else ""))
+
+                    for name, text in self.check():
+                        print ("FLAG", name, ":", text)
+                        if (name == 'leak'):
+                            for line in self.top_growth():
+                                print (line)
+            except KeyboardInterrupt:
+                print ("\nstopped")
+
+        return self.flags
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="run console commands over and over, and watch for drift")
+    parser.add_argument("port", nargs="?", default=None, help="serial port, not needed with --emulator")
+    parser.add_argument("commands", help="commands separated by ';'")
+    parser.add_argument("--emulator", action="store_true", help="run against M10Emulator instead of a board")
+    parser.add_argument("--baud_rate", type=int, default=115200)
+    parser.add_argument("--fec", type=int, default=0, metavar="GROUP")
+    parser.add_argument("--cycles", type=int, default=None)
+    parser.add_argument("--hours", type=float, default=None)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON lines, one per cycle")
+    parser.add_argument("--warmup", type=int, default=3, help="cycles left out of the baseline")
+    parser.add_argument("--baseline", type=int, default=5, help="cycles that make the baseline")
+    parser.add_argument("--window", type=int, default=5, help="cycles compared with the baseline")
+    parser.add_argument("--max-slowdown", type=float, default=20.0, help="percent")
+    parser.add_argument("--max-growth", type=float, default=1024.0, help="KB of heap")
+    parser.add_argument("--max-retries", type=float, default=None, help="per cycle")
+    parser.add_argument("--max-errors", type=int, default=0, help="failed commands in all")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="do not track the heap")
+    parser.add_argument("--verbose", action="store_true", help="show the output of the commands")
+    args = parser.parse_args()
+
+    if (args.emulator and (args.port is not None)):
+        parser.error ("no port with --emulator")
+
+    if ((not args.emulator) and (args.port is None)):
+        parser.error ("a port or --emulator is needed")
+
+    commands = parse_sequence (args.commands)
+    if (not commands):
+        parser.error ("no commands")
+
+    if ((args.cycles is None) and (args.hours is None)):
+        args.cycles = 100
+
+    # wav_console is imported here, so tracemalloc sees what it allocates
+    if (not args.no_tracemalloc):
+        tracemalloc.start()
+
+    from wav_console import Wav_Console
+
+    serial_port = None
+    port = args.port
+    if (args.emulator):
+        from M10Emulator import M10Emulator
+        serial_port = M10Emulator()
+        port = "emulator"
+
+    sink = Transfer_Sink()
+
+    try:
+        console = Wav_Console (port, args.baud_rate, sink, serial_port = serial_port, fec_group = args.fec)
+    except M10Error as e:
+        print (e)
+        sys.exit(1)
+
+    soak = Soak (console, sink, commands, args.output, args)
+    flags = soak.run()
+
+    console.client.close()
+
+    print (soak.cycles, "cycles written to", args.output, ",", soak.errors, "failed commands")
+
+    if (flags):
+        for name, (cycle, text) in sorted (flags.items(), key = lambda i : i[1][0]):
+            print ("FLAG", name, "since cycle", cycle, ":", text)
+        sys.exit(1)
+
+    print ("no regressions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Startup : import time budget of the tools
+#
+# Remarks:
+#   Each module is imported by a fresh interpreter with -X importtime,
+#   a few times, and the fastest run is kept. The script exits with 1 if a
+#   module takes longer than the budget, so CI catches an import that
+#   makes every launch slower (numpy, multiprocessing ... should be
+#   imported where they are used, see wav_console.py). The test suite
+#   runs the same check, see tests/test_startup.py.
+#
+#   Run "python -m compileall" first, or the time to compile the modules
+#   is measured too. make_tables.py --check is the other half of the start
+#   up check: the tables have to be generated, or they are built at run
+#   time.
+#
+# Usage:
+#   Python M10Startup.py
+#   Python M10Startup.py wav_console M10Client --budget 30 --top 10
+###############################################################################
+
+import argparse
+import os
+import subprocess
+import sys
+
+from M10Errors import M10Error
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MODULES = ("wav_console", "M10Client")
+
+# milliseconds
+DEFAULT_BUDGET = 40.0
+
+#============================================================================
+# import_times : (name, self, cumulative) of each import of one run of
+#   "python -X importtime -c 'import module'", times in microseconds, in
+#   the order they are printed (a module after what it imported)
+#============================================================================
+
+def import_times (module):
+    result = subprocess.run ([sys.executable, "-X", "importtime", "-c", "import " + module],
+                             cwd = _HERE, stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+                             universal_newlines = True)
+
+    if (result.returncode != 0):
+        raise M10Error ("import {0} failed: {1}".format(module, result.stderr.strip().splitlines()[-1]))
+
+    times = []
+
+    for line in result.stderr.splitlines():
+        if (not line.startswith ("import time:")):
+            continue
+
+        # the name is indented by 2 per level, after "| "
+        fields = line[len("import time:"):].split ("|")
+        try:
+            times.append ((fields[2][1:].rstrip(), int(fields[0]), int(fields[1])))
+        except (IndexError, ValueError):
+            pass    # the header line
+
+    return times
+
+#============================================================================
+# measure : cumulative import time of module in ms, and the times of its
+#   fastest run
+#============================================================================
+
+def measure (module, runs = 5):
+    best = None
+
+    for i in range (runs):
+        times = import_times (module)
+
+        total = [cumulative for name, self_time, cumulative in times if (name == module)]
+        if (not total):
+            raise M10Error ("no import time for {0}".format(module))
+
+        if ((best is None) or (total[-1] < best[0])):
+            best = (total[-1], times)
+
+    return best[0] / 1000, best[1]
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="check the import time of the tools")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="milliseconds per module")
+    parser.add_argument("--runs", type=int, default=5, help="imports per module, the fastest is kept")
+    parser.add_argument("--top", type=int, default=5, help="show the slowest imports of each module")
+    args = parser.parse_args()
+
+    over = 0
+
+    for module in args.modules:
+        try:
+            total, times = measure (module, max(1, args.runs))
+        except M10Error as e:
+            print (e)
+            sys.exit(1)
+
+        verdict = "ok"
+        if (total > args.budget):
+            verdict = "OVER BUDGET"
+            over = over + 1
+
+        print ("{0:<16s} {1:7.1f} ms  (budget {2:.0f} ms)  {3}".format(module, total, args.budget, verdict))
+
+        names = [name for name, self_time, cumulative in times]
+        end = len(names) - 1 - names[::-1].index (module)
+
+        # what the module imported are the indented lines just before it
+        own = []
+        for name, self_time, cumulative in reversed (times[0 : end]):
+            if (not name.startswith (" ")):
+                break
+            own.append ((self_time, name.strip()))
+
+        for self_time, name in sorted (own, reverse = True)[0 : args.top]:
+            print ("    {0:7.1f} ms  {1}".format(self_time / 1000, name))
+
+    if (over):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
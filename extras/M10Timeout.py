@@ -0,0 +1,90 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Timeout : reply timeouts from the measured round trip time
+#
+# Remarks:
+#   The same estimator as TCP (RFC 6298):
+#     srtt   = 7/8 srtt + 1/8 rtt
+#     rttvar = 3/4 rttvar + 1/4 |srtt - rtt|
+#     rto    = srtt + 4 rttvar, kept between floor and ceiling
+#
+#   Until the first sample, the timeout is the initial value. Each timeout
+#   doubles the rto (up to ceiling) until the next good sample. Only
+#   replies to frames that were sent once are sampled, since the reply to
+#   a resent frame could be the late reply to the first one.
+###############################################################################
+
+class RTT_Estimator:
+
+    _ALPHA = 1.0 / 8
+    _BETA = 1.0 / 4
+    _K = 4
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    initial : timeout (in seconds) until the first sample
+    #    floor   : shortest timeout, covers the latency of USB serial ports
+    #    ceiling : longest timeout
+    #========================================================================
+
+    def __init__ (self, initial = 1.0, floor = 0.02, ceiling = 6.0):
+        self.floor = floor
+        self.ceiling = ceiling
+
+        self.srtt = None
+        self.rttvar = None
+        self.rto = min(max(initial, floor), ceiling)
+
+        self.samples = 0
+        self.timeouts = 0
+        self.max_rtt = 0.0
+
+    def update (self, rtt):
+        if (self.srtt is None):
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_Estimator._BETA) * self.rttvar + RTT_Estimator._BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_Estimator._ALPHA) * self.srtt + RTT_Estimator._ALPHA * rtt
+
+        self.rto = min(max(self.srtt + RTT_Estimator._K * self.rttvar, self.floor), self.ceiling)
+
+        self.samples = self.samples + 1
+        self.max_rtt = max(self.max_rtt, rtt)
+
+    def backoff (self):
+        self.timeouts = self.timeouts + 1
+        self.rto = min(self.rto * 2, self.ceiling)
+
+    def timeout (self):
+        return self.rto
+
+    def as_dict (self):
+        return {
+            'srtt'     : self.srtt,
+            'rttvar'   : self.rttvar,
+            'rto'      : self.rto,
+            'max_rtt'  : self.max_rtt,
+            'samples'  : self.samples,
+            'timeouts' : self.timeouts
+        }
@@ -0,0 +1,373 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Trace : record the serial traffic of a session, and replay it
+#
+# Remarks:
+#   Serial_Tap sits between M10Client and the serial port, and writes every
+#   write() and read() to a trace file, with the time since the previous
+#   event. wav_console adds a note with each command line.
+#
+#   File layout (little endian):
+#     header : b"M10TRACE", version (uint16), start time (double)
+#     events : kind (1 byte), microseconds since the previous event
+#              (uint32), size asked for (uint16), size (uint16), data
+#       kind is b"W" (write), b"R" (read, data is what was returned,
+#       which is short after a timeout) or b"C" (note, utf-8 text)
+#
+#   Replay_Serial plays the board side of a trace: write() checks that the
+#   host sends what it sent in the recording, and read() returns the
+#   recorded reply, no earlier than the recorded board latency (divided by
+#   speed) after the write before it. The time the host itself takes is
+#   not replayed but measured, which is what makes a trace a performance
+#   regression case for the host code.
+#
+# Usage:
+#   Python wav_console.py COM6 --trace session.m10t
+#   Python M10Trace.py replay session.m10t [--speed 10]
+#   Python M10Trace.py dump session.m10t
+###############################################################################
+
+import argparse
+import struct
+import sys
+
+from time import monotonic, sleep, time
+
+from M10Errors import M10FormatError, M10ReplayError
+
+_MAGIC = b"M10TRACE"
+_VERSION = 1
+
+# magic, version, start time
+_HEADER = struct.Struct("<8sHd")
+
+# kind, microseconds since the previous event, size asked for, size
+_EVENT = struct.Struct("<cIHH")
+
+EVENT_WRITE = b"W"
+EVENT_READ  = b"R"
+EVENT_NOTE  = b"C"
+
+_MAX_DELTA = 0xFFFFFFFF
+
+#############################################################################
+# Serial_Tap : pyserial look-alike that records what goes through it
+#############################################################################
+
+class Serial_Tap:
+
+    def __init__ (self, serial_port, file_name):
+        self._serial = serial_port
+        self._file = open(file_name, "wb")
+        self._last_time = monotonic()
+
+        self._file.write (_HEADER.pack (_MAGIC, _VERSION, time()))
+
+    def _event (self, kind, data, size = None):
+        now = monotonic()
+        delta = min(int((now - self._last_time) * 1e6), _MAX_DELTA)
+        self._last_time = now
+
+        if (size is None):
+            size = len(data)
+
+        self._file.write (_EVENT.pack (kind, delta, min(size, 0xFFFF), len(data)))
+        self._file.write (data)
+
+    def note (self, text):
+        self._event (EVENT_NOTE, text.encode()[0:0xFFFF])
+        self._file.flush()
+
+    def write (self, data):
+        data = bytes(data)
+
+        for i in range (0, len(data), 0xFFFF):
+            self._event (EVENT_WRITE, data[i : i + 0xFFFF])
+
+        return self._serial.write (data)
+
+    def read (self, size = 1):
+        data = self._serial.read (size)
+        self._event (EVENT_READ, data[0:0xFFFF], size)
+
+        return data
+
+    @property
+    def in_waiting (self):
+        return self._serial.in_waiting
+
+    @property
+    def timeout (self):
+        return self._serial.timeout
+
+    @timeout.setter
+    def timeout (self, value):
+        self._serial.timeout = value
+
+    def reset_input_buffer (self):
+        self._serial.reset_input_buffer()
+
+    def flush (self):
+        self._serial.flush()
+
+    def fileno (self):
+        return self._serial.fileno()
+
+    def close (self):
+        if (not self._file.closed):
+            self._file.close()
+
+        self._serial.close()
+
+#============================================================================
+# read_trace : (kind, delta in seconds, size asked for, data) for each event
+#============================================================================
+
+def read_trace (file_name):
+    with open(file_name, "rb") as f:
+        content = f.read()
+
+    if (len(content) < _HEADER.size):
+        raise M10FormatError ("{0} is not a trace".format(file_name))
+
+    magic, version, start_time = _HEADER.unpack_from (content, 0)
+    if ((magic != _MAGIC) or (version != _VERSION)):
+        raise M10FormatError ("{0} is not a trace".format(file_name))
+
+    events = []
+    offset = _HEADER.size
+
+    # a trace cut short by a crash ends with a partial event, which is dropped
+    while (offset + _EVENT.size <= len(content)):
+        kind, delta, size, length = _EVENT.unpack_from (content, offset)
+        offset = offset + _EVENT.size
+
+        if (offset + length > len(content)):
+            break
+
+        events.append ((kind, delta / 1e6, size, content[offset : offset + length]))
+        offset = offset + length
+
+    return start_time, events
+
+#############################################################################
+# Replay_Serial : the board side of a trace
+#############################################################################
+
+class Replay_Serial:
+
+    #========================================================================
+    # __init__
+    #
+    # Parameter:
+    #    events : from read_trace()
+    #    speed  : board latency is divided by speed, 0 for no waiting
+    #    strict : raise M10ReplayError when the host writes something else
+    #             than the recording, or else count it in mismatches
+    #========================================================================
+
+    def __init__ (self, events, speed = 1.0, strict = 1):
+        self._events = [event for event in events if (event[0] != EVENT_NOTE)]
+        self._next = 0
+        self._speed = speed
+        self._strict = strict
+
+        # time the board took since the last write, and when that was
+        self._latency = 0.0
+        self._last_write = monotonic()
+
+        self.mismatches = 0
+        self.timeout = 0
+        self.is_open = True
+
+    def _mismatch (self, message):
+        self.mismatches = self.mismatches + 1
+
+        if (self._strict):
+            raise M10ReplayError (message)
+
+    #========================================================================
+    # write : each write of the host is checked against the next recorded
+    #   write(s). The host may split or join writes differently, so the
+    #   bytes are compared, not the calls
+    #========================================================================
+
+    def write (self, data):
+        data = bytes(data)
+        offset = 0
+
+        while (offset < len(data)):
+            if ((self._next >= len(self._events)) or (self._events[self._next][0] != EVENT_WRITE)):
+                self._mismatch ("unexpected write of {0:d} bytes at event {1:d}".format(len(data) - offset, self._next))
+                return len(data)
+
+            kind, delta, size, recorded = self._events[self._next]
+            chunk = data[offset : offset + len(recorded)]
+
+            if (chunk != recorded[0 : len(chunk)]):
+                self._mismatch ("write differs from the recording at event {0:d}".format(self._next))
+
+            if (len(chunk) < len(recorded)):
+                self._events[self._next] = (kind, 0.0, size, recorded[len(chunk):])
+            else:
+                self._next = self._next + 1
+
+            offset = offset + len(chunk)
+
+        self._latency = 0.0
+        self._last_write = monotonic()
+
+        return len(data)
+
+    #========================================================================
+    # read : the recorded reply, once the recorded board latency is over
+    #========================================================================
+
+    def read (self, size = 1):
+        if ((self._next >= len(self._events)) or (self._events[self._next][0] != EVENT_READ)):
+            self._mismatch ("unexpected read at event {0:d}".format(self._next))
+            return b""
+
+        kind, delta, recorded_size, data = self._events[self._next]
+        self._next = self._next + 1
+
+        self._latency = self._latency + delta
+
+        if (self._speed):
+            wait = self._last_write + self._latency / self._speed - monotonic()
+            if (wait > 0):
+                sleep (wait)
+
+        return data
+
+    @property
+    def in_waiting (self):
+        if ((self._next < len(self._events)) and (self._events[self._next][0] == EVENT_READ)):
+            return len(self._events[self._next][3])
+
+        return 0
+
+    @property
+    def done (self):
+        return self._next >= len(self._events)
+
+    def reset_input_buffer (self):
+        pass
+
+    def flush (self):
+        pass
+
+    def close (self):
+        self.is_open = False
+
+#============================================================================
+# commands : the console command lines of a trace, with the recorded time
+#   from each one to the next
+#============================================================================
+
+def commands (events):
+    lines = []
+    elapsed = 0.0
+
+    for kind, delta, size, data in events:
+        elapsed = elapsed + delta
+
+        if (kind == EVENT_NOTE):
+            if (lines):
+                lines[-1][1] = elapsed
+            lines.append ([data.decode(errors = "replace"), 0.0])
+            elapsed = 0.0
+
+    if (lines):
+        lines[-1][1] = elapsed
+
+    return lines
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def _dump (file_name):
+    start_time, events = read_trace (file_name)
+    elapsed = 0.0
+
+    for kind, delta, size, data in events:
+        elapsed = elapsed + delta
+
+        if (kind == EVENT_NOTE):
+            print ("{0:12.6f}  >> {1}".format(elapsed, data.decode(errors = "replace")))
+        elif ((kind == EVENT_READ) and (len(data) < size)):
+            print ("{0:12.6f}  R {1:4d} of {2:4d}  {3}".format(elapsed, len(data), size, data[0:16].hex()))
+        else:
+            print ("{0:12.6f}  {1} {2:4d}          {3}".format(elapsed, kind.decode(), len(data), data[0:16].hex()))
+
+def _replay (file_name, speed):
+    from wav_console import Wav_Console
+
+    start_time, events = read_trace (file_name)
+
+    board = Replay_Serial (events, speed)
+    console = Wav_Console ("replay", progress_sink = "quiet", serial_port = board)
+
+    total_recorded = 0.0
+    total_replayed = 0.0
+
+    print ("{0:>10s} {1:>10s}  command".format("recorded", "replayed"))
+
+    for line, recorded in commands (events):
+        start = monotonic()
+        console._on_line (line)
+        replayed = monotonic() - start
+
+        total_recorded = total_recorded + recorded
+        total_replayed = total_replayed + replayed
+
+        print ("{0:10.3f} {1:10.3f}  {2}".format(recorded, replayed, line))
+
+    print ("{0:10.3f} {1:10.3f}  total, speed {2}".format(total_recorded, total_replayed, speed))
+
+    if (board.mismatches):
+        raise M10ReplayError ("{0:d} writes differ from the recording".format(board.mismatches))
+
+    if (not board.done):
+        raise M10ReplayError ("the replay stopped before the end of the trace")
+
+def main():
+
+    parser = argparse.ArgumentParser(description="serial session traces")
+    parser.add_argument("action", choices=["dump", "replay"])
+    parser.add_argument("trace_file")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="divide the board latency by this, 0 for no waiting")
+    args = parser.parse_args()
+
+    try:
+        if (args.action == "dump"):
+            _dump (args.trace_file)
+        else:
+            _replay (args.trace_file, args.speed)
+    except (OSError, M10FormatError, M10ReplayError) as e:
+        print (e)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# Remarks:
+#   Generates M10Tables.py, the lookup tables of the CRC and the sample
+#   codecs, from the reference code (CRC16_CCITT._initial,
+#   _wave_file.linear2Mulaw / Mulaw2linear, the IMA ADPCM step tables).
+#   The tables are checked in, so the tools do not build them each time
+#   they start; run this again after changing any of that code.
+#
+#   --check compares M10Tables.py with what would be generated, and exits
+#   with 1 if it is out of date (for CI)
+#
+# Usage:
+#   Python make_tables.py
+#   Python make_tables.py --check
+###############################################################################
+
+import argparse
+import os
+import sys
+
+from CRC16_CCITT import CRC16_CCITT
+from wave_file import _wave_file
+
+_OUTPUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "M10Tables.py")
+
+_HEADER = """\
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Tables : lookup tables, generated by make_tables.py. Do not edit.
+#
+# Remarks:
+#   CRC16_CCITT_TABLE   : 256 entries, see CRC16_CCITT.py
+#   MULAW_ENCODE        : 16384 mu-law codes, for sample // 4 + 8192
+#   MULAW_DECODE        : 256 linear samples
+#   IMA_DELTA           : 89 x 16 signed differences, step index * 16 + nibble
+#   IMA_NEXT_INDEX      : 89 x 16 next step indexes, same order
+###############################################################################
+"""
+
+#============================================================================
+# _format_ints : a tuple literal, wrapped
+#============================================================================
+
+def _format_ints (name, values, per_line = 12):
+    lines = ["{0} = (".format(name)]
+
+    for i in range (0, len(values), per_line):
+        lines.append ("    " + " ".join("{0:d},".format(value) for value in values[i : i + per_line]))
+
+    lines.append (")")
+
+    return "\n".join(lines) + "\n"
+
+def _format_bytes (name, data, per_line = 64):
+    lines = ["{0} = bytes.fromhex (".format(name)]
+
+    for i in range (0, len(data), per_line):
+        lines.append ("    \"{0}\"".format(data[i : i + per_line].hex()))
+
+    lines.append (")")
+
+    return "\n".join(lines) + "\n"
+
+#============================================================================
+# generate : the text of M10Tables.py
+#============================================================================
+
+def generate ():
+    crc = CRC16_CCITT()
+    wave = _wave_file()
+
+    crc_table = [crc._initial (i) & 0xFFFF for i in range (256)]
+    mulaw_encode = bytes(wave.linear2Mulaw ((i - 8192) * 4) for i in range (16384))
+    mulaw_decode = [wave.Mulaw2linear (i) for i in range (256)]
+
+    ima_delta = []
+    ima_next_index = []
+
+    for index, step in enumerate (_wave_file._IMA_STEP_TABLE):
+        for nibble in range (16):
+            diff = step >> 3
+            if (nibble & 4):
+                diff = diff + step
+            if (nibble & 2):
+                diff = diff + (step >> 1)
+            if (nibble & 1):
+                diff = diff + (step >> 2)
+            if (nibble & 8):
+                diff = -diff
+
+            ima_delta.append (diff)
+            ima_next_index.append (max(0, min(88, index + _wave_file._IMA_INDEX_TABLE[nibble])))
+
+    return "\n".join ([_HEADER,
+                       _format_ints ("CRC16_CCITT_TABLE", crc_table, 8),
+                       _format_bytes ("MULAW_ENCODE", mulaw_encode),
+                       _format_ints ("MULAW_DECODE", mulaw_decode),
+                       _format_ints ("IMA_DELTA", ima_delta, 16),
+                       _format_ints ("IMA_NEXT_INDEX", ima_next_index, 16)])
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="generate M10Tables.py")
+    parser.add_argument("--check", action="store_true", help="only check that M10Tables.py is up to date")
+    args = parser.parse_args()
+
+    text = generate()
+
+    if (args.check):
+        try:
+            with open(_OUTPUT_FILE, "r") as f:
+                current = f.read()
+        except OSError:
+            current = None
+
+        if (current != text):
+            print (_OUTPUT_FILE, "is out of date, run make_tables.py")
+            sys.exit(1)
+
+        print (_OUTPUT_FILE, "is up to date")
+    else:
+        with open(_OUTPUT_FILE, "w") as f:
+            f.write (text)
+
+        print (_OUTPUT_FILE, "written")
+
+if __name__ == "__main__":
+    main()
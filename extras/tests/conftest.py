@@ -0,0 +1,34 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# Remarks:
+#   Regression tests of the host tools, run against M10Emulator, so no
+#   board is needed:
+#     cd extras
+#     python -m pytest tests
+#
+#   The modules in extras import each other by name, the way the scripts
+#   are run, so extras goes on the path here.
+###############################################################################
+
+import os
+import sys
+
+sys.path.insert (0, os.path.dirname (os.path.dirname (os.path.abspath (__file__))))
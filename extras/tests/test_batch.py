@@ -0,0 +1,70 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# wav_batch : outputs never land on their inputs
+###############################################################################
+
+import sys
+import wave
+
+from array import array
+
+import pytest
+
+import wav_batch
+
+from M10Errors import M10Error
+
+def _write_wav (file_name, num_of_samples):
+    samples = array('h', [((i * 37) % 2000) - 1000 for i in range (num_of_samples)])
+    if (sys.byteorder != "little"):
+        samples.byteswap()
+
+    with wave.open (file_name, "wb") as f:
+        f.setnchannels (1)
+        f.setsampwidth (2)
+        f.setframerate (16000)
+        f.writeframes (samples.tobytes())
+
+#============================================================================
+# G.711 output in the input directory, with the default -o .
+#============================================================================
+
+def test_wav_output_in_input_directory (tmp_path, monkeypatch):
+    _write_wav (str(tmp_path / "a.wav"), 4000)
+    source = (tmp_path / "a.wav").read_bytes()
+
+    monkeypatch.chdir (tmp_path)
+    monkeypatch.setattr (sys, "argv", ["wav_batch.py", "a.wav", "--format", "wav", "--jobs", "1"])
+
+    wav_batch.main()
+
+    assert (tmp_path / "a.wav").read_bytes() == source
+    assert (tmp_path / "a.mulaw.wav").stat().st_size > 0
+
+    # a second run over the directory does not take the output for a clip
+    assert wav_batch.find_inputs ([str(tmp_path)]) == [str(tmp_path / "a.wav")]
+
+def test_output_over_input (tmp_path):
+    input_file = str(tmp_path / "a.snap")
+    open(input_file, "wb").close()
+
+    with pytest.raises (M10Error):
+        wav_batch.plan_tasks ([input_file], str(tmp_path), "snap", force = 1)
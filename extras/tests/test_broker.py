@@ -0,0 +1,187 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Broker : jobs run against M10Emulator, and requests that are turned
+#   down with an error message
+###############################################################################
+
+import os
+import threading
+
+from time import sleep
+
+import pytest
+
+from M10Broker import M10Broker, M10BrokerClient, _Job, _send_message, _recv_message
+from M10Emulator import M10Emulator
+from M10Errors import M10Error, M10PortError
+from wave_file import _wave_file
+
+def _serve (tmp_path, serial_factory = None):
+    socket_path = os.path.join (str(tmp_path), "m10broker.sock")
+    server = M10Broker (socket_path, serial_factory = serial_factory)
+
+    thread = threading.Thread (target = server.serve_forever, daemon = True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+@pytest.fixture
+def broker (tmp_path):
+    yield from _serve (tmp_path)
+
+#############################################################################
+# Slow_Board : an M10Emulator that takes a while over each write, and holds
+#   the writes back while its gate is closed
+#############################################################################
+
+class Slow_Board (M10Emulator):
+
+    def __init__ (self, write_time = 0.0):
+        M10Emulator.__init__ (self)
+
+        self.write_time = write_time
+        self.gate = threading.Event()
+        self.gate.set()
+        self.waiting = threading.Event()
+
+    def write (self, data):
+        if (not self.gate.is_set()):
+            self.waiting.set()
+            self.gate.wait()
+
+        sleep (self.write_time)
+
+        return M10Emulator.write (self, data)
+
+@pytest.fixture
+def board ():
+    return Slow_Board()
+
+@pytest.fixture
+def emulated_broker (tmp_path, board):
+    yield from _serve (tmp_path, lambda port : board)
+
+def _tone (num_of_samples):
+    return [((i * 37) % 2000) - 1000 for i in range (num_of_samples)]
+
+#============================================================================
+# load / save through the broker, with the progress streamed back
+#============================================================================
+
+def test_load_save (emulated_broker, board):
+    samples = _tone (128 * 128)
+    board.write_time = 0.002
+
+    progress = []
+
+    with M10BrokerClient (emulated_broker.socket_path, "emulator") as m10:
+        m10.ping()
+        m10.load (samples, lambda done, total : progress.append ((done, total)))
+        saved = m10.save (len(samples))
+
+    wave = _wave_file()
+
+    assert list(saved) == list(wave.mulaw_decode (wave.mulaw_encode (samples)))
+    assert progress
+    assert all((0 < done <= total) for done, total in progress)
+
+#############################################################################
+# _Recorder : stands in for the result queue of a job, and notes the order
+#   in which the jobs finish
+#############################################################################
+
+class _Recorder:
+
+    def __init__ (self, name, finished):
+        self.name = name
+        self.finished = finished
+        self.done = threading.Event()
+
+    def put (self, item):
+        message, payload = item
+
+        if (message["event"] != "progress"):
+            self.finished.append (self.name)
+            self.done.set()
+
+def test_priority_order (emulated_broker, board):
+    worker = emulated_broker.worker ("emulator")
+    finished = []
+
+    def submit (name, priority, op, payload = None):
+        job = _Job ({"op" : op}, payload)
+        job.results = _Recorder (name, finished)
+        worker.submit (priority, job)
+        return job
+
+    # the first job holds the worker while the others queue up
+    board.gate.clear()
+    jobs = [submit ("busy", 0, "load", bytes(256))]
+    assert board.waiting.wait (5)
+
+    for name, priority in (("five", 5), ("one", 1), ("three", 3), ("two a", 2), ("two b", 2)):
+        jobs.append (submit (name, priority, "stop"))
+
+    board.gate.set()
+
+    for job in jobs:
+        assert job.results.done.wait (5)
+
+    assert finished == ["busy", "one", "two a", "two b", "three", "five"]
+
+def test_priority_not_an_integer (emulated_broker):
+    with M10BrokerClient (emulated_broker.socket_path, "emulator") as m10:
+        for priority in ("high", 1.5, None, True):
+            m10.priority = priority
+            with pytest.raises (M10Error, match = "priority"):
+                m10.ping()
+
+        # the worker of the port is still there
+        m10.priority = 1
+        m10.ping()
+
+def test_no_port (broker):
+    with M10BrokerClient (broker.socket_path) as m10:
+        with pytest.raises (M10PortError, match = "no port given"):
+            m10.ping()
+
+        # the connection is still up
+        with pytest.raises (M10PortError, match = "no port given"):
+            m10.ping()
+
+def test_port_not_a_string (broker):
+    with M10BrokerClient (broker.socket_path) as m10:
+        m10.open()
+
+        for port in (None, "", 3, ["COM6"]):
+            _send_message (m10._stream, {"op" : "ping", "port" : port})
+            result, payload = _recv_message (m10._stream)
+
+            assert result == {"event" : "error", "type" : "M10PortError", "message" : "no port given"}
+
+def test_port_that_does_not_open (broker):
+    with M10BrokerClient (broker.socket_path, "/dev/no-such-m10-port") as m10:
+        with pytest.raises (M10PortError):
+            m10.ping()
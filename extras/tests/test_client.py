@@ -0,0 +1,428 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Client : the frame protocol against M10Emulator
+###############################################################################
+
+import os
+
+import pytest
+
+from M10Client import M10Client
+from M10Emulator import M10Emulator, Noisy_Link
+from M10Errors import M10Error
+from M10Journal import Transfer_Journal
+from M10Library import Clip_Library
+
+def _client (board, **kwargs):
+    return M10Client ("emulator", serial_port = board, **kwargs).open()
+
+def _tone (num_of_samples):
+    return [((i * 37) % 2000) - 1000 for i in range (num_of_samples)]
+
+#============================================================================
+# save in a new session reads only what was recorded (CMD_GET_LENGTH)
+#============================================================================
+
+def test_save_length_in_new_session ():
+    board = M10Emulator (record_source = _tone (3 * 8192))
+
+    m10 = _client (board)
+    m10.record (2)
+    recorded = m10.save()
+
+    m10 = _client (board)
+    samples = m10.save()
+
+    assert m10.length_supported
+    assert len(samples) == len(recorded) == 2 * 8192
+    assert samples == recorded
+
+def test_save_length_old_sketch ():
+    board = M10Emulator()
+
+    m10 = _client (board, timeout = 0.05)
+    m10.length_supported = False
+
+    assert len(m10.save()) == M10Client.SRAM_SIZE
+
+#============================================================================
+# replies that come late
+#============================================================================
+
+#############################################################################
+# Late_Link : holds back the reply to the nth frame of a type, until
+#   after_writes more writes went out. The sketch answers in order, so the
+#   replies to those writes wait behind it, and all of them come in with
+#   the last write
+#############################################################################
+
+class Late_Link:
+
+    def __init__ (self, board, frame_type, nth, after_writes):
+        self.board = board
+        self.frame_type = frame_type
+        self.nth = nth
+        self.after_writes = after_writes
+
+        self.timeout = 0
+        self.is_open = True
+
+        self._count = 0
+        self._held = None
+        self._countdown = 0
+        self._input = bytearray()
+
+    def write (self, data):
+        data = bytes(data)
+
+        self.board.write (data)
+        reply = self.board.read (self.board.in_waiting) if (self.board.in_waiting) else b""
+
+        if (self._held is not None):
+            self._held += reply
+            self._countdown = self._countdown - 1
+            if (self._countdown == 0):
+                self._input += self._held
+                self._held = None
+            return len(data)
+
+        if ((len(data) >= 12) and (data[0:3] == M10Client._CMD_SYNC) and (data[3] == self.frame_type)):
+            self._count = self._count + 1
+            if (self._count == self.nth):
+                self._held = bytearray(reply)
+                self._countdown = self.after_writes
+                return len(data)
+
+        self._input += reply
+
+        return len(data)
+
+    def read (self, size = 1):
+        ret = bytes(self._input[0 : size])
+        del self._input[0 : size]
+
+        return ret
+
+    @property
+    def in_waiting (self):
+        return len(self._input)
+
+    def reset_input_buffer (self):
+        self._input = bytearray()
+
+    def flush (self):
+        pass
+
+    def close (self):
+        self.is_open = False
+
+def _image (length):
+    return bytes(((i * 7) ^ (i >> 7)) & 0xFF for i in range (length))
+
+def test_late_read_reply ():
+    image = _image (64 * 128)
+
+    for after_writes in range (1, 6):
+        board = M10Emulator()
+        board.sram[0 : len(image)] = image
+
+        m10 = _client (Late_Link (board, M10Client._CMD_TYPE_MEM_READ_EXT, 5, after_writes))
+        data = m10.read_image (len(image))
+
+        assert m10.timeouts >= 1
+        assert bytes(data) == image, "late by {0:d} writes".format(after_writes)
+
+def test_late_write_reply ():
+    image = _image (64 * 128)
+
+    for after_writes in range (1, 6):
+        board = M10Emulator()
+
+        m10 = _client (Late_Link (board, M10Client._CMD_TYPE_MEM_WRITE_EXT, 5, after_writes))
+        m10.write_image (image)
+
+        assert bytes(board.sram[0 : len(image)]) == image, "late by {0:d} writes".format(after_writes)
+
+        m10.serial_port.frame_type = None
+        assert bytes(m10.read_image (len(image))) == image
+
+def test_late_reply_with_fec ():
+    image = _image (64 * 128)
+
+    for after_writes in range (1, 6):
+        board = M10Emulator()
+        board.sram[0 : len(image)] = image
+
+        m10 = _client (Late_Link (board, M10Client._CMD_TYPE_MEM_READ_GROUP, 2, after_writes), fec_group = 8)
+        m10.fec_supported = True
+
+        assert bytes(m10.read_image (len(image))) == image, "late by {0:d} writes".format(after_writes)
+
+#============================================================================
+# a save cut off in one session is resumed by the next (M10Journal)
+#============================================================================
+
+class _Cut_Off (Exception):
+    pass
+
+def _cut_off_after (num_of_blocks):
+    def progress (done, total):
+        if (done >= num_of_blocks * 128):
+            raise _Cut_Off
+
+    return progress
+
+def _resume_save_in_new_session (tmp_path, length_supported):
+    journal_file = str(tmp_path / "cap.wav.m10j")
+    board = M10Emulator (record_source = _tone (4 * 8192))
+
+    m10 = _client (board)
+    m10.record (3)
+    recorded = m10.save()
+
+    journal = Transfer_Journal (journal_file, m10.port)
+    try:
+        m10.save (None, _cut_off_after (100), journal)
+    except _Cut_Off:
+        pass
+    finally:
+        journal.close()
+
+    m10 = _client (board)
+    frames = board.frames_received
+
+    # without CMD_GET_LENGTH, the length comes from the journal
+    if (not length_supported):
+        m10.length_supported = False
+
+    journal = Transfer_Journal (journal_file, m10.port)
+    samples = m10.save (None, None, journal)
+    journal.close()
+
+    assert journal.resumed == 100
+    assert samples == recorded
+
+    # the 92 blocks left and the MEM_CRC check
+    assert board.frames_received - frames < 100
+    assert not os.path.exists (journal_file)
+
+def test_resume_save_in_new_session (tmp_path):
+    _resume_save_in_new_session (tmp_path, True)
+
+def test_resume_save_in_new_session_old_sketch (tmp_path):
+    _resume_save_in_new_session (tmp_path, False)
+
+#============================================================================
+# MEM_FILL : silence goes out as fill frames, and as EXT frames to a sketch
+# without them
+#============================================================================
+
+def _image_with_silence ():
+    return _image (16 * 128) + bytes([0xFF]) * (200 * 128) + _image (8 * 128)
+
+def test_fill ():
+    image = _image_with_silence()
+
+    board = M10Emulator()
+    m10 = _client (board)
+    m10.write_image (image)
+
+    assert m10.fill_supported
+    assert bytes(board.sram[0 : len(image)]) == image
+    assert board.frames_received == 16 + 1 + 8
+
+def test_fill_old_sketch ():
+    image = _image_with_silence()
+
+    board = M10Emulator (fill = False)
+    m10 = _client (board, timeout = 0.05)
+    m10.write_image (image)
+
+    assert m10.fill_supported is False
+    assert bytes(board.sram[0 : len(image)]) == image
+
+#============================================================================
+# FEC groups over a noisy line, and a sketch without the FEC frames
+#============================================================================
+
+def test_fec_noisy_link ():
+    image = _image (128 * 128)
+
+    link = Noisy_Link (M10Emulator(), 1e-3, seed = 3)
+    m10 = _client (link, fec_group = 8)
+
+    m10.write_image (image)
+    assert bytes(link.board.sram[0 : len(image)]) == image
+
+    assert bytes(m10.read_image (len(image))) == image
+
+    assert m10.fec_supported
+    assert m10.fec_repaired > 0
+    assert link.bit_errors > 0
+
+def test_fec_old_sketch ():
+    image = _image (64 * 128)
+
+    board = M10Emulator (fec = False)
+    m10 = _client (board, timeout = 0.05, fec_group = 8)
+
+    m10.write_image (image)
+    assert bytes(board.sram[0 : len(image)]) == image
+
+    assert bytes(m10.read_image (len(image))) == image
+    assert m10.fec_supported is False
+
+#============================================================================
+# a write cut off and resumed, checked with MEM_CRC
+#============================================================================
+
+def _cut_off_write (board, journal_file, image, num_of_blocks):
+    m10 = _client (board)
+
+    journal = Transfer_Journal (journal_file, m10.port)
+    try:
+        m10.write_image (image, 0, _cut_off_after (num_of_blocks), journal)
+    except _Cut_Off:
+        pass
+    finally:
+        journal.close()
+
+def _resume_write (board, journal_file, image):
+    m10 = _client (board, timeout = 0.05)
+
+    journal = Transfer_Journal (journal_file, m10.port)
+    m10.write_image (image, 0, None, journal)
+    journal.close()
+
+    return m10, journal
+
+def test_resume_write (tmp_path):
+    journal_file = str(tmp_path / "song.wav.m10j")
+    image = _image (128 * 128)
+    board = M10Emulator()
+
+    _cut_off_write (board, journal_file, image, 40)
+
+    frames = board.frames_received
+    m10, journal = _resume_write (board, journal_file, image)
+
+    assert journal.resumed >= 40
+    assert m10.mem_crc_supported
+    assert board.frames_received - frames == 128 - journal.resumed + 1
+    assert bytes(board.sram[0 : len(image)]) == image
+    assert not os.path.exists (journal_file)
+
+def test_resume_write_sram_changed (tmp_path):
+    journal_file = str(tmp_path / "song.wav.m10j")
+    image = _image (128 * 128)
+    board = M10Emulator()
+
+    _cut_off_write (board, journal_file, image, 40)
+
+    # the board was reset, or recorded, in between
+    board.sram[0 : 128] = bytes(128)
+
+    m10, journal = _resume_write (board, journal_file, image)
+
+    assert journal.resumed == 0
+    assert bytes(board.sram[0 : len(image)]) == image
+
+def test_resume_write_old_sketch (tmp_path):
+    journal_file = str(tmp_path / "song.wav.m10j")
+    image = _image (128 * 128)
+    board = M10Emulator (mem_crc = False)
+
+    _cut_off_write (board, journal_file, image, 40)
+    m10, journal = _resume_write (board, journal_file, image)
+
+    assert m10.mem_crc_supported is False
+    assert journal.resumed >= 40
+    assert bytes(board.sram[0 : len(image)]) == image
+
+#============================================================================
+# ADPCM loads over a noisy line, the codec frame is retried once the
+# sketch is known to take it
+#============================================================================
+
+def test_adpcm_load_noisy_link ():
+    samples = _tone (2048)
+
+    link = Noisy_Link (M10Emulator(), 3e-3, seed = 0)
+    m10 = _client (link)
+
+    for i in range (20):
+        codec = M10Client.CODEC_IMA_ADPCM if (i % 2 == 0) else M10Client.CODEC_MULAW
+        m10.load (samples, codec = codec)
+
+        assert link.board.codec == codec
+
+    assert m10.codec_supported
+    assert link.bit_errors > 0
+
+#============================================================================
+# clips played over a noisy line, CMD_PLAY_CLIP is retried once the sketch
+# is known to take it
+#============================================================================
+
+def test_play_clip_noisy_link ():
+    library = Clip_Library()
+    library.add_samples ("one", _tone (1024))
+    library.add_samples ("two", _tone (3000))
+
+    link = Noisy_Link (M10Emulator(), 3e-3, seed = 0)
+    image = library.image()
+    link.board.sram[0 : len(image)] = image
+
+    m10 = _client (link)
+
+    for i in range (40):
+        m10.play_clip (i % 2)
+        assert link.board.clip_index == i % 2
+
+        # stop on the board side, so a garbled stop does not leave it playing
+        link.board.write (b" ")
+
+    assert m10.clips_supported
+    assert link.bit_errors > 0
+
+    with pytest.raises (M10Error):
+        m10.play_clip (2)
+
+#============================================================================
+# saves over a noisy line, CMD_GET_LENGTH is retried once the sketch is
+# known to take it
+#============================================================================
+
+def test_save_length_noisy_link ():
+    board = M10Emulator (record_source = _tone (3 * 8192))
+    _client (board).record (1)
+
+    link = Noisy_Link (board, 3e-3, seed = 0)
+    m10 = _client (link)
+
+    assert len(m10.save()) == 8192
+
+    for i in range (200):
+        assert m10.stored_length() == 8192
+
+    assert len(m10.save()) == 8192
+    assert m10.length_supported
+    assert link.bit_errors > 0
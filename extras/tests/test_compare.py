@@ -0,0 +1,77 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Compare : the pass / fail gate of the command line
+###############################################################################
+
+import json
+import sys
+import wave
+
+from array import array
+
+import pytest
+
+import M10Compare
+
+def _write_wav (file_name, num_of_samples):
+    samples = array('h', [((i * 37) % 2000) - 1000 for i in range (num_of_samples)])
+    if (sys.byteorder != "little"):
+        samples.byteswap()
+
+    with wave.open (file_name, "wb") as f:
+        f.setnchannels (1)
+        f.setsampwidth (2)
+        f.setframerate (M10Compare.SAMPLE_RATE)
+        f.writeframes (samples.tobytes())
+
+def _main (monkeypatch, *args):
+    monkeypatch.setattr (sys, "argv", ["M10Compare.py"] + list(args) + ["--jobs", "1"])
+
+    with pytest.raises (SystemExit) as e:
+        M10Compare.main()
+        raise SystemExit (0)
+
+    return e.value.code
+
+def test_no_captures (tmp_path, monkeypatch):
+    _write_wav (str(tmp_path / "reference.wav"), 2000)
+
+    assert _main (monkeypatch, str(tmp_path / "reference.wav"), str(tmp_path / "cap*.wav")) == 1
+
+def test_missing_reference (tmp_path, monkeypatch, capsys):
+    _write_wav (str(tmp_path / "cap.wav"), 2000)
+
+    assert _main (monkeypatch, str(tmp_path / "reference.wav"), str(tmp_path / "cap.wav")) == 1
+    assert "reference.wav" in capsys.readouterr().out
+
+def test_json_exact_match (tmp_path, monkeypatch, capsys):
+    _write_wav (str(tmp_path / "reference.wav"), 2000)
+    _write_wav (str(tmp_path / "cap.wav"), 2000)
+
+    assert _main (monkeypatch, str(tmp_path / "reference.wav"), str(tmp_path / "cap.wav"), "--json") == 0
+
+    def no_constants (name):
+        raise ValueError (name)
+
+    result = json.loads (capsys.readouterr().out, parse_constant = no_constants)
+
+    assert result['passed']
+    assert result['snr'] is None
@@ -0,0 +1,129 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# wav_console : command lines against M10Emulator
+###############################################################################
+
+import os
+
+import pytest
+
+import M10Library
+import M10Snapshot
+
+from M10Emulator import M10Emulator
+from M10Errors import M10FormatError
+from wav_console import Wav_Console
+
+def _console (board, **kwargs):
+    return Wav_Console ("emulator", progress_sink = "quiet", serial_port = board, **kwargs)
+
+def _tone (num_of_samples):
+    return [((i * 37) % 2000) - 1000 for i in range (num_of_samples)]
+
+#============================================================================
+# save_wav leaves no peak index behind, and preview builds it from the
+# samples save_wav read, without reading the SRAM again
+#============================================================================
+
+def test_preview_after_save (tmp_path):
+    board = M10Emulator (record_source = _tone (2 * 8192))
+    console = _console (board)
+
+    wav_file = str(tmp_path / "cap.wav")
+    console.execute ("record 1")
+    console.execute ("save_wav " + wav_file)
+
+    assert sorted (os.listdir (str(tmp_path))) == ["cap.wav"]
+
+    frames = board.frames_received
+    console.execute ("preview")
+
+    assert board.frames_received == frames
+
+#============================================================================
+# load_wav / save_wav only keep a journal with --resume, and remove it once
+# the transfer is done
+#============================================================================
+
+def test_journal_only_with_resume (tmp_path):
+    wav_file = str(tmp_path / "cap.wav")
+
+    for resume in (False, True):
+        board = M10Emulator (record_source = _tone (2 * 8192))
+        console = _console (board, resume = resume)
+        journals = []
+
+        console.client.save = _watch_journal (console.client.save, journals)
+        console.client.load = _watch_journal (console.client.load, journals)
+
+        console.execute ("record 1")
+        console.execute ("save_wav " + wav_file)
+        console.execute ("load_wav " + wav_file)
+
+        assert [journal is not None for journal in journals] == [resume, resume]
+        assert sorted (os.listdir (str(tmp_path))) == ["cap.wav"]
+
+def _watch_journal (method, journals):
+    def call (*args):
+        journal = args[-1]
+        journals.append (journal)
+        if (journal is not None):
+            assert os.path.basename (journal.file_name) == "cap.wav.m10j"
+        return method (*args)
+
+    return call
+
+#============================================================================
+# the .json of save_wav is not taken for the manifest of a clip library
+#============================================================================
+
+def test_export_json_next_to_snapshot (tmp_path):
+    board = M10Emulator (record_source = _tone (2 * 8192))
+    console = _console (board)
+
+    console.execute ("record 1")
+    console.execute ("save_wav " + str(tmp_path / "cap.wav") + " json")
+    console.execute ("dump_sram " + str(tmp_path / "cap.snap"))
+    console.execute ("restore_sram " + str(tmp_path / "cap.snap"))
+
+    assert console._library is None
+
+    with pytest.raises (M10FormatError):
+        M10Library.Clip_Library.load_manifest (str(tmp_path / "cap.json"))
+
+def test_restore_library (tmp_path):
+    board = M10Emulator (record_source = _tone (2 * 8192))
+    console = _console (board)
+
+    console.execute ("record 1")
+    console.execute ("save_wav " + str(tmp_path / "cap.wav"))
+
+    snapshot_file = str(tmp_path / "library.snap")
+    library = M10Library.pack_files ([str(tmp_path / "cap.wav")])
+    index = M10Snapshot.write_snapshot (snapshot_file, library.image())
+    library.save_manifest (M10Library.manifest_file (snapshot_file), index)
+
+    console.execute ("restore_sram " + snapshot_file)
+
+    assert [clip['name'] for clip in console._library.clips] == ["cap"]
+
+    console.execute ("play cap")
+    assert board.clip_index == 0
@@ -0,0 +1,38 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Startup : the tools import within their budget, and without the
+#   modules that are imported where they are used
+###############################################################################
+
+import pytest
+
+import M10Startup
+
+_DEFERRED = ("numpy", "multiprocessing", "concurrent.futures", "serial")
+
+@pytest.mark.parametrize ("module", M10Startup.DEFAULT_MODULES)
+def test_import_time (module):
+    total, times = M10Startup.measure (module)
+
+    assert total <= M10Startup.DEFAULT_BUDGET
+
+    names = set (name.strip() for name, self_time, cumulative in times)
+    assert not names.intersection (_DEFERRED)
@@ -0,0 +1,68 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# M10Trace : a session recorded against M10Emulator replays without it
+###############################################################################
+
+import pytest
+
+import M10Trace
+
+from M10Emulator import M10Emulator
+from M10Errors import M10ReplayError
+from wav_console import Wav_Console
+
+def _tone (num_of_samples):
+    return [((i * 37) % 2000) - 1000 for i in range (num_of_samples)]
+
+def _record_session (tmp_path):
+    trace_file = str(tmp_path / "session.m10t")
+    wav_file = str(tmp_path / "cap.wav")
+
+    board = M10Emulator (record_source = _tone (2 * 8192))
+    console = Wav_Console ("emulator", progress_sink = "quiet", serial_port = board, trace_file = trace_file)
+
+    for line in ("record 1", "save_wav " + wav_file, "load_wav " + wav_file, "volume 20", "play", ""):
+        console._on_line (line)
+
+    console.client.close()
+
+    return trace_file
+
+def test_replay (tmp_path):
+    trace_file = _record_session (tmp_path)
+
+    start_time, events = M10Trace.read_trace (trace_file)
+    lines = [line for line, seconds in M10Trace.commands (events)]
+
+    assert lines[0 : 2] == ["record 1", "save_wav " + str(tmp_path / "cap.wav")]
+
+    M10Trace._replay (trace_file, 0)
+
+def test_replay_mismatch (tmp_path):
+    trace_file = _record_session (tmp_path)
+
+    start_time, events = M10Trace.read_trace (trace_file)
+    board = M10Trace.Replay_Serial (events, 0)
+
+    with pytest.raises (M10ReplayError):
+        board.write (b"\xff" * 12)
+
+    assert board.mismatches == 1
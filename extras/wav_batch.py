@@ -0,0 +1,220 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+###############################################################################
+# Remarks:
+#   Batch converter: WAV files in, files ready for the board out.
+#   Each file is parsed, converted to 16 bit, resampled to 8kHz and mu-law
+#   encoded in a worker process, so a large set of clips is converted with
+#   all the cores of the machine.
+#
+#   Output formats:
+#     snap : SRAM snapshot (see M10Snapshot.py), upload with restore_sram
+#     wav  : 8kHz G.711 mu-law WAV file, named .mulaw.wav so it never
+#            lands on a clip of the input
+#
+#   Outputs that are newer than their input are skipped, unless --force
+#   (which is also needed after changing the M10DSP.py options)
+#
+# Usage:
+#   Python wav_batch.py prompts/ -o out/
+#   Python wav_batch.py "prompts/*.wav" -o out/ --format wav --jobs 8
+#   Python wav_batch.py prompts/ -o out/ --normalize rms --target -18 --limit -3
+###############################################################################
+
+import argparse
+import glob
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from time import monotonic
+
+import M10DSP
+import M10Snapshot
+
+from M10Client import M10Client
+from M10Errors import M10Error
+from wave_file import _wave_file
+
+_MULAW_SILENCE = 0xFF
+
+_OUTPUT_EXTENSION = {
+    'snap' : ".snap",
+    'wav'  : ".mulaw.wav"
+}
+
+#============================================================================
+# convert_file
+#------------------------------------------------------------------------
+# Remarks: runs in the worker processes. Returns
+#   (input_file, ok, input_bytes, audio_seconds, message)
+#   where message is None unless there is something to report
+#============================================================================
+
+def convert_file (task):
+    input_file, output_file, output_format, dsp = task
+
+    try:
+        wave_file = _wave_file (input_file)
+        samples = wave_file._data_extract (0)
+        samples = wave_file.to_linear16 (samples, wave_file.bits_per_sample)
+        samples = wave_file.resample (samples, wave_file.sample_rate, M10Client.SAMPLE_RATE)
+
+        if (dsp.active):
+            samples = dsp.process (samples)
+
+        encoded = wave_file.mulaw_encode (samples)
+        message = None
+
+        if (output_format == 'snap'):
+            if (len(encoded) > M10Client.SRAM_SIZE):
+                message = "truncated to {0:d} samples".format(M10Client.SRAM_SIZE)
+                encoded = encoded[0 : M10Client.SRAM_SIZE]
+
+            padding = (-len(encoded)) % M10Snapshot.BLOCK_SIZE
+            M10Snapshot.write_snapshot (output_file, encoded + bytes([_MULAW_SILENCE]) * padding)
+        else:
+            _wave_file (output_file).sample_save_mulaw (encoded)
+
+        return (input_file, True, os.path.getsize(input_file),
+                len(samples) / M10Client.SAMPLE_RATE, message)
+
+    except (M10Error, OSError) as e:
+        return (input_file, False, 0, 0.0, "failed: {0}".format(e))
+
+#============================================================================
+# find_inputs : directories contribute their *.wav files (but not the
+#   .mulaw.wav files written here), anything else is taken as a glob
+#   pattern
+#============================================================================
+
+def find_inputs (patterns):
+    inputs = []
+
+    for pattern in patterns:
+        if (os.path.isdir(pattern)):
+            inputs.extend (sorted (os.path.join(pattern, i) for i in os.listdir(pattern)
+                                   if (i.lower().endswith(".wav") and
+                                       not i.lower().endswith(_OUTPUT_EXTENSION['wav']))))
+        else:
+            inputs.extend (sorted (glob.glob(pattern)))
+
+    return inputs
+
+#============================================================================
+# _up_to_date
+#============================================================================
+
+def _up_to_date (input_file, output_file):
+    try:
+        return os.path.getmtime(output_file) >= os.path.getmtime(input_file)
+    except OSError:
+        return False
+
+#============================================================================
+# plan_tasks : (input_file, output_file, output_format, dsp) for each file
+#   that needs converting, and the number of files that are up to date.
+#   M10Error if an output would overwrite its input
+#============================================================================
+
+def plan_tasks (inputs, output_dir, output_format, force = 0, dsp = None):
+    if (dsp is None):
+        dsp = M10DSP.DSP_Chain()
+
+    tasks = []
+    skipped = 0
+
+    for input_file in inputs:
+        name = os.path.splitext(os.path.basename(input_file))[0]
+        output_file = os.path.join(output_dir, name + _OUTPUT_EXTENSION[output_format])
+
+        if (os.path.realpath(output_file) == os.path.realpath(input_file)):
+            raise M10Error ("{0} would be written over itself".format(input_file))
+
+        if ((not force) and _up_to_date (input_file, output_file)):
+            skipped = skipped + 1
+        else:
+            tasks.append ((input_file, output_file, output_format, dsp))
+
+    return tasks, skipped
+
+
+#############################################################################
+# Main
+#############################################################################
+
+def main():
+
+    parser = argparse.ArgumentParser(description="convert WAV files for the M10 board")
+    parser.add_argument("inputs", nargs="+", help="directories or glob patterns of WAV files")
+    parser.add_argument("-o", "--output", default=".", help="output directory")
+    parser.add_argument("--format", choices=sorted(_OUTPUT_EXTENSION), default="snap")
+    parser.add_argument("--jobs", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--force", action="store_true", help="convert files that are up to date")
+    M10DSP.add_arguments (parser)
+    args = parser.parse_args()
+
+    try:
+        dsp = M10DSP.from_args (args)
+    except M10Error as e:
+        print (e)
+        sys.exit(1)
+
+    os.makedirs (args.output, exist_ok=True)
+
+    try:
+        tasks, skipped = plan_tasks (find_inputs (args.inputs), args.output, args.format, args.force, dsp)
+    except M10Error as e:
+        print (e)
+        sys.exit(1)
+
+    start_time = monotonic()
+    converted = 0
+    failed = 0
+    input_bytes = 0
+    audio_seconds = 0.0
+
+    if (tasks):
+        jobs = args.jobs or os.cpu_count() or 1
+        chunk_size = max(1, len(tasks) // (4 * jobs))
+
+        with ProcessPoolExecutor (max_workers = jobs) as executor:
+            for input_file, ok, in_bytes, seconds, message in executor.map (convert_file, tasks, chunksize = chunk_size):
+                if (message):
+                    print (input_file, ":", message)
+
+                if (ok):
+                    converted = converted + 1
+                    input_bytes = input_bytes + in_bytes
+                    audio_seconds = audio_seconds + seconds
+                else:
+                    failed = failed + 1
+
+    elapsed = max(monotonic() - start_time, 1e-9)
+
+    print ("{0:d} converted, {1:d} up to date, {2:d} failed".format(converted, skipped, failed))
+    print ("{0:.2f} s, {1:.1f} files/s, {2:.2f} MB/s, {3:.0f} s of audio per second".format(
+           elapsed, converted / elapsed, input_bytes / elapsed / 1e6, audio_seconds / elapsed))
+
+    if (failed):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -29,283 +29,61 @@
 #   Python wav_console.py com_port_name
 #   For example, to use COM6, type in
 #     Python wav_console.py COM6
+#
+#   --progress json prints transfer progress as JSON lines, and
+#   --progress quiet turns it off
+#
+#   --trace session.m10t records the serial traffic, to be replayed
+#   with M10Trace.py
+#
+#   --fec 8 sends and reads the SRAM in groups of 8 blocks plus a parity
+#   block, for noisy lines (see M10Client.py)
+#
+#   --resume makes load_wav and save_wav keep a journal of the transfer
+#   next to the WAV file (song.wav.m10j), removed once the transfer is
+#   done. If the transfer is cut off, the same command run again with
+#   --resume only sends / reads the blocks that are missing (see
+#   M10Journal.py)
+#
+#   save_wav capture.wav npy json also writes capture.npy and a JSON
+#   sidecar, for analysis code (see M10Export.py for the formats)
+#
+#   --profile runs every command under the profiler, and "profile
+#   load_wav song.wav" a single one. The results go to m10profile-*.pstats
+#   and .collapsed files (see M10Profile.py)
+#
+#   --normalize, --gain, --limit ... condition the samples of load_wav and
+#   load_library before they are encoded (see M10DSP.py), the same as the
+#   dsp command
 #  
 #   After script is loaded. Type in help for available commands.
 ###############################################################################
 
+import argparse
 import os
 import sys
 
-import serial
+import M10DSP
+import M10Export
+import M10Library
+import M10Registers
+import M10Snapshot
 
-from time import sleep
+from Console_Events import Console_Event_Loop
 from Console_Input import Console_Input
-from CRC16_CCITT import CRC16_CCITT
-
-class _wave_file:
-    
-    
-    _BIAS = 0x84  # Bias for linear code. 
-    _CLIP = 8159
-    
-    
-    def linear2Alaw (self, pcm_val):
-        pcm_val = pcm_val // 8
-        
-        if (pcm_val >= 0):
-            mask = 0xD5
-        else:
-            mask = 0x55
-            pcm_val = -pcm_val - 1
-        
-        #  Convert the scaled magnitude to segment number. 
-        
-        seg_aend = [0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]
-
-        for i in range(len(seg_aend)):  
-            if (pcm_val < seg_aend[i]):
-                break
-        
-        seg = i
-        
-        # Combine the sign, segment, and quantization bits. 
-        if (pcm_val > seg_aend[7]): # out of range, return maximum value. 
-            ret = 0x7F ^ mask
-        else:
-            aval = seg << 4
-            if (seg < 2):
-                aval = aval | ((pcm_val >> 1) & 0xF);
-            else:
-                aval = aval | ((pcm_val >> seg) & 0xF)
-            
-            ret = aval ^ mask
-            
-        return ret
-    
-    def Alaw2linear(self, a_val):
-        a_val = a_val ^ 0x55
-        
-        t = (a_val & 0xF) << 4
-        seg = ((a_val & 0x70) >> 4) & 0xF
-        
-        if (seg == 0):
-            t = t + 8
-        elif (seg == 1):
-            t = t + 0x108
-        else:
-            t = t + 0x108;
-            t = t << (seg - 1)
-        
-        if (a_val & 0x80):
-            ret = t
-        else:
-            ret = -t
-        return ret
-    
-    
-    def linear2Mulaw (self, pcm_val):
-        # Get the sign and the magnitude of the value. 
-        pcm_val = pcm_val // 4
-        if (pcm_val < 0):
-            pcm_val = -pcm_val
-            mask = 0x7F
-        else:
-            mask = 0xFF
-        
-        if ( pcm_val > _wave_file._CLIP ):
-            pcm_val = _wave_file._CLIP;     # clip the magnitude
-        
-        pcm_val = pcm_val + (_wave_file._BIAS // 4)
-
-        seg_uend = [0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]
-
-        # Convert the scaled magnitude to segment number.
-        for i in range(len(seg_uend)):  
-            if (pcm_val < seg_uend[i]):
-                break
-        
-        seg = i
-        
-        # Combine the sign, segment, quantization bits;
-        # and complement the code word.
-
-        if (pcm_val > seg_uend[7]): # out of range, return maximum value. 
-            ret = (0x7F ^ mask)
-            return ret
-        else:
-            uval = (seg << 4) | ((pcm_val >> (seg + 1)) & 0xF)
-            return (uval ^ mask)
-
-    
-    def Mulaw2linear(self, u_val):
-    
-   #     print ("u_val = ", u_val)
-        # Complement to obtain normal u-law value
-        u_val = ~u_val
+from M10Client import M10Client
+from M10Errors import M10Error
+from M10Journal import Transfer_Journal
+from M10Progress import Progress, make_sink
+from wave_file import _wave_file
 
-        # Extract and bias the quantization bits. Then
-        # shift up by the segment number and subtract out the bias.
-        
-        t = ((u_val & 0xF) << 3) + _wave_file._BIAS
-        t = t << ((u_val & 0x70) >> 4)
-
-        if (u_val & 0x80):
-            ret = _wave_file._BIAS - t
-        else:
-            ret = t - _wave_file._BIAS
-   #     print ("ret = ", ret)    
-        return (ret)
-
-    
-    def _bin_to_number (self, str_in):
-        accum = 0
-        for i in range (0, len(str_in)):
-            t = str_in[i]
-            accum = accum + (t << (i * 8))
-        
-        return accum
-   
-    def _data_extract(self):
-
-        try:
-            bytes = open(self.file_name, "rb").read()
-        except Exception:
-            print (self.file_name, "file open fail!")
-            return []
-            
-        chunk_ID = bytes [0:4].upper()
-        chunk_size = self._bin_to_number (bytes[4:8])
-        format = bytes [8:12].upper()
-        subchunk1_ID = bytes [12:16].lower()  
-        subchunk1_size = self._bin_to_number (bytes[16:20])
-        audio_format =  self._bin_to_number(bytes[20:22])
-        num_of_channels = self._bin_to_number(bytes[22:24])
-        sample_rate = self._bin_to_number(bytes[24:28])
-        byte_rate = self._bin_to_number(bytes[28:32])
-        block_align = self._bin_to_number(bytes[32:34])
-        bits_per_sample = self._bin_to_number(bytes[34:36])
-   
-        if (chunk_ID != b'RIFF') :
-            print ("NOT RIFF format!\n", chunk_ID)
-            os._exit(1)
-
-        if (format != b'WAVE') :
-            print ("NOT WAVE format!\n")
-            os._exit(1)
-
-
-        if (subchunk1_ID != b"fmt ") :
-            print ("unknown subchunk1 ID : " + subchunk1_ID)
-            os._exit(1)
-        else:
-            print ("subchunk_ID ", subchunk1_ID)     
-        
-        
-        print ("\nAudio Format is {0:d}, (1 = PCM)".format(audio_format))
-        print ("\nnumer of channels = {0:d}".format(num_of_channels))
-
-        if (num_of_channels > 1) :
-            print ("More than one channel!")
-            os._exit(1)
-     
-        print ("sample_rate = ", sample_rate)
-        print ("bits_per_sample = ", bits_per_sample)
-        print ("block_align = ", block_align)
-        
-        subchunk_start = 20 + subchunk1_size
-        subchunk_ID = bytes [subchunk_start: subchunk_start + 4].lower()  
-        subchunk_size = self._bin_to_number (bytes[subchunk_start + 4:subchunk_start + 8])
-        
-        print ("subchunk_ID ", subchunk_ID)
-        
-        while(subchunk_ID != b'data'):
-            subchunk_start = subchunk_start + 8 + subchunk_size
-            subchunk_ID = bytes [subchunk_start: subchunk_start + 4].lower()  
-            subchunk_size = self._bin_to_number (bytes[subchunk_start + 4:subchunk_start + 8])
-                    
-            print ("subchunk_ID ", subchunk_ID)
-        
-           
-        num_of_samples = int(subchunk_size / block_align)
-
-        print ("num_of_samples = ", num_of_samples)
-        print ("time span = ", num_of_samples / sample_rate, " seconds")
-        
-        print ("subchunk_start = ", subchunk_start)
-        
-        sample_list = []
-        for i in range (0, num_of_samples) :
-            data = self._bin_to_number(bytes[subchunk_start + 8 + i * block_align : subchunk_start + 8 + i * block_align + block_align])
-            if (bits_per_sample == 8):
-                None
-                #print("i = {0:d}\t data = {1:d}\n".format(i, data))
-            elif (bits_per_sample == 16):
-                if (data > 32767) :
-                    data = data - 65536
-                #print("i = {0:d}\t data = {1:d}\n".format(i, data))
-                
-            sample_list.append(data)
-
-        return (sample_list) 
-        
-    def sample_save_16bit(self, data_byte_list):
-        file_data_list = [ord('R'), ord('I'), ord('F'), ord('F')]
-        file_data_list = file_data_list + [0x24, 0x00, 0x2, 0]
-        file_data_list = file_data_list + [ord('W'), ord('A'), ord('V'), ord('E')]
-        file_data_list = file_data_list + [ord('f'), ord('m'), ord('t'), ord(' ')]
-        file_data_list = file_data_list + [16, 0, 0, 0]  #Subchunk1Size, 16 for PCM
-        file_data_list = file_data_list + [1, 0] # AudioFormat, PCM = 1
-        file_data_list = file_data_list + [1, 0] # NumChannels      
-        file_data_list = file_data_list + [0x40, 0x1F, 0, 0] # Sample Rate
-        file_data_list = file_data_list + [0x80, 0x3E, 0, 0] # Byte Rate
-        file_data_list = file_data_list + [2, 0] # block align
-        file_data_list = file_data_list + [16, 0] # bit per sample
-        
-        
-        # Subchunk2
-        
-        
-        file_data_list = file_data_list + [ord('d'), ord('a'), ord('t'), ord('a')]
-        file_data_list = file_data_list + [0, 0, 4, 0] # Subchunk2Size    
-        
-        file_data_list = file_data_list + data_byte_list
-        
-        if (len(data_byte_list) < (256 * 1024)):
-            file_data_list = file_data_list + [0] * (256*1024 - len(data_byte_list))
-        
-        with open(self.file_name, "wb") as f:
-            bytes_data = bytearray(file_data_list)
-            f.write(bytes_data)
-        
-        f.close()
-        
-
-        
-    def __init__ (self, file_name=""):
-        self.file_name = file_name
-
-        
+# M10Compare and M10Peaks are imported by the commands that use them, as
+# they bring in numpy (and M10Compare multiprocessing), which would
+# otherwise be most of the start up time. M10Profile likewise, only when
+# profiling
         
 class Wav_Console:
     
-#############################################################################
-# command procedures
-#############################################################################
-    
-    _CMD_SYNC = [0xBA, 0xAB, 0x11]
-    _CMD_TYPE_MEM_WRITE_WORD = 0x37
-    _CMD_TYPE_MEM_WRITE_BYTE = 0x38
-    _CMD_TYPE_MEM_WRITE_EXT  = 0x39
-    _CMD_TYPE_MEM_READ_WORD  = 0x40
-    _CMD_TYPE_MEM_READ_EXT   = 0x41
-    
-    _CMD_TYPE_CMD_PLAY       = 0x50
-    _CMD_TYPE_CMD_RECORD     = 0x52
-    _CMD_TYPE_CMD_SET_VOLUME = 0x54
-    
-    _FRAME_REPLY_LEN = 12
-    
-
     #========================================================================
     # _string_to_data
     #========================================================================
@@ -327,257 +105,15 @@ class Wav_Console:
 #############################################################################
     
     _Console_PROMPT = "\n>> "
-
-    #========================================================================
-    #  _verify_crc
-    #------------------------------------------------------------------------
-    #  Remarks: calculate and check CRC16_CCITT for frames 
-    #========================================================================
-    def _verify_crc (self, data):
-        data_list = [i for i in data]
-        crc_data = self._crc16_ccitt.get_crc (data_list [0 : Wav_Console._FRAME_REPLY_LEN - 2])
-     
-        if (crc_data == data_list [Wav_Console._FRAME_REPLY_LEN - 2 : Wav_Console._FRAME_REPLY_LEN]):
-            return True
-        else:
-            return False
-    
-    #========================================================================
-    # _frame_write_ext
-    #========================================================================
-    def _frame_write_ext (self, addr, data_list, show_crc_error = 0):
-        
-        addr_write_byte_0  = addr & 0xFF
-        addr_write_byte_1  = (addr >> 8) & 0xFF
-        addr_write_byte_2  = (addr >> 16) & 0xFF
-        addr_write_byte_3  = (addr >> 24) & 0xFF
-        
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_WRITE_EXT;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [addr_write_byte_3, addr_write_byte_2, addr_write_byte_1, addr_write_byte_0] +  data_list
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            #print ([hex(i) for i in frame])
-            
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_write_ext CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-    
-    #========================================================================
-    # _frame_write_WORD
-    #========================================================================
-    def _frame_write_16bit (self, addr, data, show_crc_error = 0):
-        
-        addr_write_byte_0  = addr & 0xFF
-        addr_write_byte_1  = (addr >> 8) & 0xFF
-        addr_write_byte_2  = (addr >> 16) & 0xFF
-        addr_write_byte_3  = (addr >> 24) & 0xFF
-        
-        data_low_byte  = data & 0xFF;
-        data_high_byte = (data >> 8) & 0xFF;
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_WRITE_WORD;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [addr_write_byte_3, addr_write_byte_2, addr_write_byte_1, addr_write_byte_0] + [data_high_byte, data_low_byte] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_write_16bit CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-      
-    
-    #========================================================================
-    # _frame_set_volume
-    #========================================================================
-    def _frame_set_volume (self, volume):
-        
-        data_low_byte  = volume & 0xFF;
-        data_high_byte = (volume >> 8) & 0xFF;
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_WRITE_WORD;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [10, 11, 12, 13] + [data_high_byte, data_low_byte] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_set_volume CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-      
     
+    _VOLUME_MAX = 32
     
-    
-    #========================================================================
-    # _frame_write_byte
-    #========================================================================
-    def _frame_write_byte (self, addr, data, show_crc_error = 0):
-        
-        addr_write_byte_0  = addr & 0xFF
-        addr_write_byte_1  = (addr >> 8) & 0xFF
-        addr_write_byte_2  = (addr >> 16) & 0xFF
-        addr_write_byte_3  = (addr >> 24) & 0xFF
-        
-        data_low_byte  = data & 0xFF
-        data_high_byte = data_low_byte
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_WRITE_BYTE;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [addr_write_byte_3, addr_write_byte_2, addr_write_byte_1, addr_write_byte_0] + [data_high_byte, data_low_byte] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_write_16bit CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-    
-    
-    #========================================================================
-    # _frame_read_16bit
-    #========================================================================
-    def _frame_read_16bit (self, addr, show_crc_error = 0):
-        
-        addr_write_byte_0  = addr & 0xFF
-        addr_write_byte_1  = (addr >> 8) & 0xFF
-        addr_write_byte_2  = (addr >> 16) & 0xFF
-        addr_write_byte_3  = (addr >> 24) & 0xFF
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_READ_WORD;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [addr_write_byte_3, addr_write_byte_2, addr_write_byte_1, addr_write_byte_0] + [0x12, 0x34] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            #print ([hex(i) for i in frame])
-            
-            for i in frame:
-                self._serial.write ([i])
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-            condition = not self._verify_crc (ret)
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_write_16bit CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-    
-        data = ret [len(Wav_Console._CMD_SYNC) + 1] * 256 + ret [len(Wav_Console._CMD_SYNC) + 2] 
-        
-        return data
-        
-    
-    #========================================================================
-    # _frame_read_ext
-    #========================================================================
-    def _frame_read_ext (self, addr, show_crc_error = 0):
-        
-        addr_write_byte_0  = addr & 0xFF
-        addr_write_byte_1  = (addr >> 8) & 0xFF
-        addr_write_byte_2  = (addr >> 16) & 0xFF
-        addr_write_byte_3  = (addr >> 24) & 0xFF
-        
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_MEM_READ_EXT;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [addr_write_byte_3, addr_write_byte_2, addr_write_byte_1, addr_write_byte_0] + [0x12, 0x34] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
-            
-            #print ([hex(i) for i in frame])
-            
-            for i in frame:
-                self._serial.write ([i])
-              
-            ret = self._serial.read (128 + 6)
-            
-            crc_data = bytearray(self._crc16_ccitt.get_crc (ret[0:128+4]))
-            
-            if (crc_data == ret[128+4 : 128+6]):
-                condition = False
-            else:
-                condition = True
-
-            if (condition):
-                if (show_crc_error):
-                    print ("addr=", addr, "_frame_write_16bit CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                self._serial.write (zero_frame)                 
-    
-        data = ret [len(Wav_Console._CMD_SYNC) + 1 : len(Wav_Console._CMD_SYNC) + 129] 
-        
-        return [i for i in data]
-        
-        
     #========================================================================
     # _do_help
     #========================================================================
     def _do_help (self):
          if (len(self._args) > 1):
-            if (self._args[1] in Mustang_Console._CONSOLE_CMD):
+            if (self._args[1] in Wav_Console._CONSOLE_CMD):
                 print ("Usage:\n      ", self._args[1], Wav_Console._CONSOLE_CMD[self._args[1]][1])
                 print ("Description:\n      ", Wav_Console._CONSOLE_CMD[self._args[1]][2])
                 
@@ -594,7 +130,7 @@ class Wav_Console:
     def _do_read16(self):
         
         addr = self._string_to_data(self._args[1])
-        ret = self._frame_read_16bit(addr)
+        ret = self._m10.read16(addr)
         
         print (hex(ret & 0xFF), " ", hex((ret >> 8) & 0xFF))
     
@@ -605,7 +141,7 @@ class Wav_Console:
         
         addr = self._string_to_data(self._args[1])
         data = self._string_to_data(self._args[2])
-        self._frame_write_byte(addr, data)
+        self._m10.write8(addr, data)
         
         print ("write ", hex(data),"to address", hex(addr))
         
@@ -616,151 +152,443 @@ class Wav_Console:
         
         addr = self._string_to_data(self._args[1])
         data = self._string_to_data(self._args[2])
-        self._frame_write_16bit(addr, data)
+        self._m10.write16(addr, data)
         
         print ("write ", hex(data),"to address", hex(addr))
         
         
+    #========================================================================
+    # _do_reg
+    #------------------------------------------------------------------------
+    # Remarks: without arguments, show all the Si3000 registers. Otherwise
+    #   show one register / field, or set pairs of them in one transaction,
+    #   such as  reg txg 20 rxg 12
+    #========================================================================
+    def _do_reg(self):
+        
+        if (len(self._args) == 1):
+            for line in self._registers.describe():
+                print (line)
+            return
+            
+        names = self._args[1::2]
+        values = [self._string_to_data (value) for value in self._args[2::2]]
+        
+        if (len(values) < len(names)):
+            if (len(names) > 1):
+                print ("a value is missing for", names[-1])
+                return
+                
+            name = names[0]
+            if (name in M10Registers.FIELDS):
+                print (name, "=", self._registers.get_field (name))
+            else:
+                print (name, "=", hex(self._registers.read (name)))
+            return
+            
+        if (min(values) < 0):
+            print ("bad value in", " ".join(self._args[2::2]))
+            return
+            
+        with self._registers.transaction():
+            for name, value in zip(names, values):
+                if (name in M10Registers.FIELDS):
+                    self._registers.set_field (name, value)
+                else:
+                    self._registers.write (name, value)
+                    
+        print ("written")
+        
     #========================================================================
     # _do_load
     #========================================================================
     def _do_load(self):
         
+        codec = M10Client.CODEC_MULAW
+        if (len(self._args) > 2):
+            if (self._args[2] not in M10Client.CODECS):
+                print ("unknown codec", self._args[2], ", use one of", " ".join(sorted(M10Client.CODECS)))
+                return
+            codec = M10Client.CODECS[self._args[2]]
+        
         wave_file = _wave_file(self._args[1])
         sample_list = wave_file._data_extract()
+        sample_list = wave_file.to_linear16 (sample_list, wave_file.bits_per_sample)
+        sample_list = wave_file.resample (sample_list, wave_file.sample_rate, M10Client.SAMPLE_RATE)
         
-        #print (sample_list)
+        if (self._dsp.active):
+            sample_list = self._dsp.process (sample_list)
+            print ("dsp:", self._dsp.report())
         
-        num_of_ext_frames = len(sample_list) // 128
-        num_of_remaining_bytes = len(sample_list) % 128
+        self._progress.start ("load")
+        self._sram_index = None
+        self._library = None
+        self._peaks = None
+        self._saved_samples = None
         
-        addr = 0
-    
-        for i in range(num_of_ext_frames):
-            data_list = []
-            for j in range (128):
-                data_byte = wave_file.linear2Mulaw(sample_list[i * 128 + j])
-                data_list = data_list + [data_byte]
-            
-            self._frame_write_ext (addr, data_list)
-            addr = addr + 128
+        journal = self._journal (self._args[1])
+        try:
+            self._m10.load (sample_list, self._progress, codec, journal)
+        finally:
+            if (journal is not None):
+                journal.close()
+        self._progress.finish()
+        
+        self._report_resumed (journal)
+        
+    #========================================================================
+    # _journal / _report_resumed : journal of a transfer to / from a WAV
+    #   file, see M10Journal.py. None without --resume
+    #========================================================================
+    def _journal (self, file_name):
+        if (not self._resume):
+            return None
             
-            print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b %d %% completed" % int(addr * 100/ (len(sample_list))), end="")
-            sys.stdout.flush()
+        return Transfer_Journal (file_name + ".m10j", self._m10.port)
         
-        for i in range (num_of_remaining_bytes):
-            data_byte = wave_file.linear2Mulaw(sample_list[num_of_ext_frames * 128 + i])
-            self._frame_write_byte (addr, data_byte)
-            addr = addr + 1
+    def _report_resumed (self, journal):
+        if ((journal is not None) and journal.resumed):
+            print ("resumed,", journal.resumed, "of", journal.num_of_blocks, "blocks were already done")
         
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b                                                  ");
-        sys.stdout.flush()
+    #========================================================================
+    # _do_profile
+    #------------------------------------------------------------------------
+    # Remarks: run one command under the profiler, such as
+    #   profile load_wav song.wav
+    #========================================================================
+    def _do_profile(self):
+        
+        if ((len(self._args) < 2) or (self._args[1] not in Wav_Console._CONSOLE_CMD)):
+            print ("profile takes a command, such as  profile load_wav song.wav")
+            return
+        
+        self._args = self._args[1:]
+        
+        if (self._profiler is not None):
+            # --profile, this is profiled already
+            Wav_Console._CONSOLE_CMD[self._args[0]][0](self)
+        else:
+            if (self._command_profiler is None):
+                import M10Profile
+                self._command_profiler = M10Profile.Command_Profiler()
+                
+            self._command_profiler.run (self._args[0], Wav_Console._CONSOLE_CMD[self._args[0]][0], self)
+        
+    #========================================================================
+    # _do_dsp
+    #------------------------------------------------------------------------
+    # Remarks: show the sample conditioning of load_wav / load_library, or
+    #   change it, such as  dsp normalize rms target -18 limit -3
+    #   "dsp off" turns all of it off
+    #========================================================================
+    def _do_dsp(self):
+        
+        if (self._args[1:] == ["off"]):
+            self._dsp = M10DSP.DSP_Chain()
+        elif (len(self._args) % 2 == 0):
+            print ("a value is missing for", self._args[-1])
+            return
+        else:
+            dsp = self._dsp
+            for name, value in zip(self._args[1::2], self._args[2::2]):
+                dsp = M10DSP.set_option (dsp, name, value)
+            self._dsp = dsp
+            
+        print ("dsp:", self._dsp.describe())
         
     #========================================================================
     # _do_save
     #========================================================================
     def _do_save(self):
     
+        formats = self._args[2:]
+        for name in formats:
+            if (name not in M10Export.FORMATS):
+                print ("unknown format", name, ", use one of", " ".join(M10Export.FORMATS))
+                return
+                
         wave_file = _wave_file(self._args[1])
   
-        data_byte_list = []
-        for i in range(1024):
-            data_ext = self._frame_read_ext(i * 128)
-            data_list_tmp = [0] * 256
+        self._progress.start ("save")
+        journal = self._journal (self._args[1])
+        try:
+            samples = self._m10.save (None, self._progress, journal)
+        finally:
+            if (journal is not None):
+                journal.close()
+        self._progress.finish()
+        
+        self._report_resumed (journal)
             
-            for j in range(128):
-                tmp = wave_file.Mulaw2linear (data_ext[j])
-                if (tmp < 0):
-                    tmp = (65536 + tmp) & 0xFFFF
-                    
-                data_list_tmp[j*2] = tmp & 0xFF
-                data_list_tmp[j*2 + 1] = (tmp >> 8) & 0xFF
-                
-            data_byte_list = data_byte_list + data_list_tmp
-    
-            print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b %d %% completed" % int(i * 128 * 100/ (128 * 1024)), end="")
-            sys.stdout.flush()
+        wave_file.sample_save_pcm (samples)
+        
+        print (len(samples), "samples,", len(samples) / M10Client.SAMPLE_RATE, "seconds saved")
+        
+        if (formats):
+            image = self._m10.saved_image
+            info = M10Export.metadata (len(samples), self._m10.port, M10Client.SAMPLE_RATE, "mulaw",
+                                       self._m10.image_crc (image))
+            files = M10Export.export (os.path.splitext(self._args[1])[0], formats, samples, image, info)
+            print (" ".join(files), "written")
         
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b                                                  ");
-        sys.stdout.flush()
+        # the peak index of preview is only built if it is asked for
+        self._peaks = None
+        self._saved_samples = samples
+        
+        
+    #========================================================================
+    # _do_dump_sram
+    #========================================================================
+    def _do_dump_sram(self):
+        
+        self._progress.start ("dump")
+        image = self._m10.read_image (M10Client.SRAM_SIZE, 0, self._progress)
+        self._progress.finish()
+        
+        self._sram_index = M10Snapshot.write_snapshot (self._args[1], image, self._m10.port)
+        
+    #========================================================================
+    # _do_restore_sram
+    #------------------------------------------------------------------------
+    # Remarks: only the blocks that differ from what is known to be in the
+    #   SRAM are written. That is either the base snapshot given as the 
+    #   second argument, or the last snapshot dumped / restored in this
+    #   session
+    #========================================================================
+    def _do_restore_sram(self):
+        
+        base_index = self._sram_index
+        
+        if (len(self._args) > 2):
+            with M10Snapshot.SRAM_Snapshot (self._args[2]) as base:
+                base_index = base.index
+                
+        with M10Snapshot.SRAM_Snapshot (self._args[1]) as snapshot:
+            blocks = M10Snapshot.changed_blocks (snapshot.index, base_index)
             
-        wave_file.sample_save_16bit (data_byte_list)
+            self._progress.start ("restore")
+            self._m10.write_blocks (snapshot.image, blocks, self._progress)
+            self._progress.finish()
+            
+            self._sram_index = snapshot.index
+            
+        self._peaks = None
+        self._saved_samples = None
+        print (len(blocks), "of", len(snapshot.index), "blocks written")
+        
+        # a clip library packed by M10Library.py comes with its manifest
+        self._library = None
+        manifest_file = M10Library.manifest_file (self._args[1])
         
+        if (os.path.exists (manifest_file)):
+            self._library = M10Library.Clip_Library.load_manifest (manifest_file)[0]
+            print (len(self._library.clips), "clips, see clips")
         
     #========================================================================
-    # _do_play
+    # _do_load_library
+    #------------------------------------------------------------------------
+    # Remarks: pack the clips into one SRAM image with a TOC, and write the
+    #   blocks that differ from what is known to be in the SRAM. The clips
+    #   are then played with play <index or name>
     #========================================================================
-    def _do_play(self):
-  
-        condition = True
+    def _do_load_library(self):
+        
+        library = M10Library.pack_files (self._args[1:], 1, self._dsp)
+        image = library.image()
+        index = M10Snapshot.block_index (image)
+        
+        blocks = M10Snapshot.changed_blocks (index, self._sram_index)
+        
+        self._progress.start ("load")
+        self._m10.write_blocks (image, blocks, self._progress)
+        self._progress.finish()
+        
+        self._sram_index = index
+        self._library = library
+        self._peaks = None
+        self._saved_samples = None
         
-        while (condition):
+        print (len(blocks), "of", len(index), "blocks written")
+        self._do_clips()
+        
+    #========================================================================
+    # _do_clips
+    #========================================================================
+    def _do_clips(self):
+        
+        if (self._library is None):
+            print ("no clip library loaded")
+        else:
+            for line in self._library.describe():
+                print (line)
         
-            frame_type_byte = Wav_Console._CMD_TYPE_CMD_PLAY;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [0xde, 0xad, 0xbe, 0xef] + [0x99, 0x88] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
+    #========================================================================
+    # _do_diff_sram
+    #========================================================================
+    def _do_diff_sram(self):
+        
+        with M10Snapshot.SRAM_Snapshot (self._args[1]) as a, M10Snapshot.SRAM_Snapshot (self._args[2]) as b:
+            ranges = M10Snapshot.diff_snapshots (a, b)
             
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                print ("addr=", addr, "_frame_write_16bit CRC fail")
+        if (ranges):
+            print (len(ranges), "changed ranges")
+            for line in M10Snapshot.format_ranges (ranges):
+                print (line)
+        else:
+            print ("identical")
+        
+    #========================================================================
+    # _do_play
+    #========================================================================
+    def _do_play(self):
+        
+        if (len(self._args) > 1):
+            if (self._library is None):
+                print ("no clip library loaded, see load_library")
+                return
                 
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-      
-        print ("playing... Press Enter to stop")
+            index = self._library.find (self._args[1])
+            self._m10.play_clip (index)
+            print ("playing", self._library.clips[index]['name'], "... Press Enter to stop")
+        else:
+            self._m10.play()
+            print ("playing... Press Enter to stop")
     
     #========================================================================
     # _do_record
     #========================================================================
     def _do_record(self):
   
-        condition = True
-        
-        while (condition):
-        
-            frame_type_byte = Wav_Console._CMD_TYPE_CMD_RECORD;
-                       
-            frame = Wav_Console._CMD_SYNC + [frame_type_byte] + [0xde, 0xad, 0xbe, 0xef] + [0x99, 0x88] 
-                       
-            frame = frame + self._crc16_ccitt.get_crc (frame)
+        def show_seconds (done, total):
+            if (done < total):
+                print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b %d seconds" % done, end="")
+                sys.stdout.flush()
+            
+        seconds = 16
+        if (len(self._args) > 1):
+            seconds = self._string_to_data (self._args[1])
+            if (seconds <= 0):
+                print ("bad number of seconds", self._args[1])
+                return
             
-            self._serial.write (frame)
-              
-            ret = self._serial.read (Wav_Console._FRAME_REPLY_LEN)
-
-            condition = not self._verify_crc (ret)
-            if (condition):
-                print ("record _frame_write_16bit CRC fail")
-                
-                zero_frame = [0] * Wav_Console._FRAME_REPLY_LEN
-                print (zero_frame)
-                self._serial.write (zero_frame)                 
-      
         print ("start recording...")
         
-        record_time = 0
-        while(record_time < 16):
-            print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b %d seconds" % record_time, end="")
-            sys.stdout.flush()
-            ret = self._serial.read(1)
-            record_time = record_time + 1
+        self._sram_index = None
+        self._library = None
+        self._peaks = None
+        self._saved_samples = None
+        self._m10.record (seconds, show_seconds)
            
         print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b==> recording finished")
-        self._serial.write([ord(' '), ord(' '), ord(' '), ord('\n')])
          
          
+    #========================================================================
+    # _do_compare
+    #------------------------------------------------------------------------
+    # Remarks: compare a capture with a reference clip, see M10Compare.py.
+    #   Without a capture file, the last recording is read back from the
+    #   board
+    #========================================================================
+    def _do_compare(self):
+        
+        import M10Compare
+        
+        reference = M10Compare.load_samples (self._args[1])
+        
+        if (len(self._args) > 2):
+            capture = M10Compare.load_samples (self._args[2])
+        else:
+            self._progress.start ("save")
+            capture = self._m10.save (None, self._progress)
+            self._progress.finish()
+            
+        print (M10Compare.format_result (M10Compare.compare (reference, capture)))
+        
+    #========================================================================
+    # _do_preview
+    #------------------------------------------------------------------------
+    # Remarks: text waveform of a WAV file / SRAM snapshot, or else of the
+    #   last recording in the SRAM, which is read back once (unless
+    #   save_wav just did) and then kept as a peak index (see M10Peaks.py)
+    #   until the SRAM changes
+    #========================================================================
+    def _do_preview(self):
+        
+        import M10Peaks
+        
+        args = self._args[1:]
+        
+        if (args and not args[0].replace (".", "", 1).isdigit()):
+            peaks = M10Peaks.peak_index_for (args[0])
+            args = args[1:]
+        else:
+            if (self._peaks is None):
+                samples = self._saved_samples
+                if (samples is None):
+                    self._progress.start ("save")
+                    samples = self._m10.save (None, self._progress)
+                    self._progress.finish()
+                
+                self._peaks = M10Peaks.Peak_Index.build (samples)
+                self._saved_samples = None
+                
+            peaks = self._peaks
+            
+        try:
+            seconds = [float(arg) for arg in args[0:2]]
+        except ValueError:
+            print ("bad number of seconds", " ".join(args))
+            return
+        
+        for line in M10Peaks.preview (peaks, *seconds):
+            print (line)
+        
+    #========================================================================
+    # _do_stats
+    #========================================================================
+    def _do_stats(self):
+        
+        stats = self._m10.link_stats()
+        
+        print ("crc errors :", stats['crc_errors'])
+        print ("timeouts   :", stats['timeouts'])
+        print ("fec repairs:", stats['fec_repaired'])
+        
+        for frame_type, rtt in stats['rtt'].items():
+            if (rtt['samples']):
+                print ("  frame {0}: srtt {1:.1f} ms, rttvar {2:.1f} ms, timeout {3:.1f} ms, max {4:.1f} ms, {5:d} samples, {6:d} timeouts".format(
+                       frame_type, rtt['srtt'] * 1000, rtt['rttvar'] * 1000, rtt['rto'] * 1000,
+                       rtt['max_rtt'] * 1000, rtt['samples'], rtt['timeouts']))
+        
+    #========================================================================
+    # _do_volume
+    #------------------------------------------------------------------------
+    # Remarks: set the output volume, 0 (mute) to 32, in one frame
+    #========================================================================
+    def _do_volume(self):
+        
+        if (len(self._args) == 1):
+            print ("volume", self.volume)
+            return
+        
+        volume = self._string_to_data (self._args[1])
+        if ((volume < 0) or (volume > Wav_Console._VOLUME_MAX)):
+            print ("volume takes 0 to", Wav_Console._VOLUME_MAX)
+            return
+            
+        self._m10.set_volume (volume)
+        self._registers.invalidate ('dac_vol_control')
+        self.volume = volume
+        
+        print ("volume", self.volume)
+        
     #========================================================================
     # _do_volume_up
     #========================================================================
     def _do_volume_up(self):
-        self._serial.write([ord('+'), ord('\n')])
+        self._m10.volume_up()
+        self._registers.invalidate ('dac_vol_control')
+        self.volume = min(self.volume + 1, Wav_Console._VOLUME_MAX)
         sys.stdout.flush()    
         print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b==> volume up")
         
@@ -768,7 +596,9 @@ class Wav_Console:
     # _do_volume_down
     #========================================================================
     def _do_volume_down(self):
-        self._serial.write([ord('-'), ord('\n')])
+        self._m10.volume_down()
+        self._registers.invalidate ('dac_vol_control')
+        self.volume = max(self.volume - 1, 0)
         sys.stdout.flush()    
         print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b==> volume down")
         
@@ -784,16 +614,31 @@ class Wav_Console:
         
     _CONSOLE_CMD = {
         'help'                  : (_do_help,              "[command_to_look_up]", "list command info"), 
-        'load_wav'              : (_do_load,              "wav_file_name", "load wave file"),
-        'save_wav'              : (_do_save,              "wav_file_name", "save wave file"),
-        #'read16'                : (_do_read16,            "address", "read memory"),
-        #'write8'                : (_do_write8,            "address data", "write byte memory"),
-        #'write16'               : (_do_write16,           "address data", "write byte memory"),          
+        'load_wav'              : (_do_load,              "wav_file_name [mulaw|adpcm]", "load wave file"),
+        'save_wav'              : (_do_save,              "wav_file_name [npy|npy_mulaw|raw|json ...]", "save wave file, as long as the last recording"),
+        'read16'                : (_do_read16,            "address", "read memory"),
+        'write8'                : (_do_write8,            "address data", "write byte memory"),
+        'write16'               : (_do_write16,           "address data", "write byte memory"),          
+        'reg'                   : (_do_reg,               "[register_or_field [value] ...]", "show or set Si3000 registers"),
+        'volume'                : (_do_volume,            "[0_to_32]", "show or set output volume"),
         'volume_up'             : (_do_volume_up,         " ", "increase output volume"),
         'volume_down'           : (_do_volume_down,       " ", "decrease output volume"),
         
-        'play'                  : (_do_play,             " ", "play wav file"),
-        'record'                : (_do_record,           " ", "record wav file"),
+        'dump_sram'             : (_do_dump_sram,         "snapshot_file_name", "save raw SRAM content"),
+        'restore_sram'          : (_do_restore_sram,      "snapshot_file_name [base_snapshot]", "write back changed SRAM blocks"),
+        'diff_sram'             : (_do_diff_sram,         "snapshot_a snapshot_b", "compare two SRAM snapshots"),
+        
+        'dsp'                   : (_do_dsp,               "[off | setting value ...]", "show or set the conditioning of loaded samples"),
+        
+        'load_library'          : (_do_load_library,      "wav_file_name[:adpcm] ...", "load several clips, to play by index"),
+        'clips'                 : (_do_clips,             " ", "list the clips of the library"),
+        
+        'play'                  : (_do_play,             "[clip_index_or_name]", "play wav file, or a clip of the library"),
+        'record'                : (_do_record,           "[seconds]", "record wav file, 16 seconds at most"),
+        'preview'               : (_do_preview,           "[wav_or_snapshot] [start_seconds [end_seconds]]", "show the waveform of a recording"),
+        'compare'               : (_do_compare,           "reference_wav [capture_wav]", "compare a recording with a reference clip"),
+        'stats'                 : (_do_stats,             " ", "show link errors and round trip times"),
+        'profile'               : (_do_profile,           "command [arguments]", "run a command under the profiler"),
         'exit'                  : (_dummy_exit,             " ", "exit console")
     }
     
@@ -807,26 +652,58 @@ class Wav_Console:
     #========================================================================
     # __init__
     #========================================================================
-    def __init__ (self, com_port, baud_rate=115200):
-        self._serial = serial.Serial(com_port, baud_rate, timeout=6)
-        if (self._serial.in_waiting):
-            r = self._serial.read (self._serial.in_waiting) # clear the uart receive buffer 
+    def __init__ (self, com_port, baud_rate=115200, progress_sink="tty", serial_port=None, trace_file=None, fec_group=0, dsp=None, resume=False, profile=None):
+        self._m10 = M10Client(com_port, baud_rate, timeout=6, serial_port=serial_port, trace_file=trace_file, fec_group=fec_group)
+        self._m10.open()
+        
+        self._progress = Progress (make_sink(progress_sink))
+        
+        # block index of the SRAM content, None if unknown
+        self._sram_index = None
+        
+        # clip library in the SRAM, None if there is none
+        self._library = None
+        
+        # M10Peaks.Peak_Index of the recording in the SRAM, None if unknown,
+        # and the samples of the last save_wav, to build it from
+        self._peaks = None
+        self._saved_samples = None
+        
+        # cached Si3000 registers
+        self._registers = M10Registers.Register_Map (self._m10)
+        
+        # M10DSP.DSP_Chain for load_wav / load_library
+        self._dsp = M10DSP.DSP_Chain() if (dsp is None) else dsp
+        
+        # journal load_wav / save_wav, and pick up the journal of one that
+        # was interrupted
+        self._resume = resume
+        
+        # M10Profile.Command_Profiler for every command, None for off,
+        # and the one of the profile command, made on first use
+        self._profiler = None
+        if (profile is not None):
+            import M10Profile
+            self._profiler = M10Profile.Command_Profiler (profile)
+        self._command_profiler = None
             
         self._stdin = Console_Input(">> ", Wav_Console._CONSOLE_CMD.keys())
         self._stdin.uart_raw_mode_enable = 0
         
-        self.volume = 32
- 
-        self._crc16_ccitt = CRC16_CCITT()
+        # what the sketch starts with
+        self.volume = 28
          
     #========================================================================
     # _execute_cmd
     #========================================================================
     def _execute_cmd (self):
-        #try:
-            Wav_Console._CONSOLE_CMD[self._args[0]][0](self)
-        #except Exception:
-         #   print ("Exception when executing", self._args[0])
+        try:
+            if (self._profiler is None):
+                Wav_Console._CONSOLE_CMD[self._args[0]][0](self)
+            else:
+                self._profiler.run (self._args[0], Wav_Console._CONSOLE_CMD[self._args[0]][0], self)
+        except (M10Error, OSError) as e:
+            print ("\n", e)
             
     #========================================================================
     # _line_handle
@@ -838,7 +715,7 @@ class Wav_Console:
         
         if (len(self._args) == 0):
             print ("empty line!");
-            self._serial.write([ord(' '), ord('\n')])
+            self._m10.stop()
         elif (self._args[0] not in Wav_Console._CONSOLE_CMD):
             print ("unknown command ", self._args[0]);
         else:
@@ -848,33 +725,84 @@ class Wav_Console:
          #   print ("eeeeeeeeeeeeeeeeeeee\n", end="");
         
         
+    @property
+    def client (self):
+        return self._m10
+        
+    #========================================================================
+    # execute : run one command line for a script (see M10Soak.py). Unlike
+    #   the console, errors are raised, and an empty line stops the board
+    #========================================================================
+    def execute (self, line):
+        
+        self._args = line.split()
+        self._m10.reset_input()
+        
+        if (len(self._args) == 0):
+            self._m10.stop()
+        elif (self._args[0] not in Wav_Console._CONSOLE_CMD):
+            raise M10Error ("unknown command " + self._args[0])
+        else:
+            Wav_Console._CONSOLE_CMD[self._args[0]][0](self)
+        
+    #========================================================================
+    # _on_line / _on_board_data : events from Console_Event_Loop
+    #========================================================================
+    def _on_line (self, line):
+        if (line == "exit"):
+            print ("\nGoodbye!!!")
+            self._events.stop()
+            return
+        
+        self._m10.trace_note (line)
+        self._m10.reset_input()
+        self._line_handle (line)
+        
+    def _on_board_data (self, data):
+        print (data.decode(errors="replace"), end="", flush=True)
+        
     #########################################################################
     # This is the main loop    
     #########################################################################
     def run (self):
-        while(1):
-            try:
-                line = self._stdin.input()
-                if (line == "exit"):
-                    print ("\nGoodbye!!!")
-                    return
-            except Exception:
-                print ("type \"exit\" to end console session \n", end="");
-
-            self._serial.reset_input_buffer()
-            self._line_handle (line)
+        self._events = Console_Event_Loop (self._stdin, self._on_line, self._m10.serial_port, self._on_board_data)
+        self._events.run()
+        self._m10.close()
         
         
 def main():
 
-    baud_rate = 115200
-    com_port = sys.argv[1]
+    parser = argparse.ArgumentParser(description="console for the wav_record_playback sketch")
+    parser.add_argument("com_port", help="serial port, such as COM6")
+    parser.add_argument("--baud_rate", type=int, default=115200)
+    parser.add_argument("--progress", choices=["tty", "quiet", "json"], default="tty",
+                        help="how to report transfer progress")
+    parser.add_argument("--trace", default=None,
+                        help="record the serial traffic to this file, see M10Trace.py")
+    parser.add_argument("--fec", type=int, default=0, metavar="GROUP",
+                        help="blocks per FEC parity block, 0 for no FEC")
+    parser.add_argument("--resume", action="store_true",
+                        help="journal load_wav / save_wav, and resume one that was cut off")
+    parser.add_argument("--profile", nargs="?", const="m10profile", default=None, metavar="PREFIX",
+                        help="profile every command, see M10Profile.py")
+    M10DSP.add_arguments (parser)
+    args = parser.parse_args()
+    
+    try:
+        dsp = M10DSP.from_args (args)
+    except M10Error as e:
+        print (e)
+        sys.exit(1)
+    
+    baud_rate = args.baud_rate
+    com_port = args.com_port
     raw_uart_switch = 0
 
     try:
-        wave = Wav_Console (com_port, baud_rate)
-    except:
+        wave = Wav_Console (com_port, baud_rate, args.progress, trace_file=args.trace, fec_group=args.fec, dsp=dsp, resume=args.resume, profile=args.profile)
+    except M10Error as e:
         print ("Failed to open COM port")
+        print (e)
         sys.exit(1)
 
     wave.run()
@@ -886,4 +814,4 @@ def main():
 if __name__ == "__main__":
     main()        
 
-        
\ No newline at end of file
+        
@@ -0,0 +1,560 @@
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC 
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License (LGPL) as 
+# published by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but 
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY 
+# or FITNESS FOR A PARTICULAR PURPOSE.  
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+###############################################################################
+
+
+
+###############################################################################
+# Remarks:
+#   WAV file parsing / writing and the G.711 (A-law, mu-law) sample codec.
+#   Shared by wav_console.py and M10Client.py
+###############################################################################
+
+from array import array
+from itertools import accumulate
+import struct
+import sys
+
+from M10Errors import M10FormatError
+
+try:
+    import M10Tables
+except ImportError:
+    M10Tables = None
+
+class _wave_file:
+    
+    
+    _BIAS = 0x84  # Bias for linear code. 
+    _CLIP = 8159
+    
+    
+    def linear2Alaw (self, pcm_val):
+        pcm_val = pcm_val // 8
+        
+        if (pcm_val >= 0):
+            mask = 0xD5
+        else:
+            mask = 0x55
+            pcm_val = -pcm_val - 1
+        
+        #  Convert the scaled magnitude to segment number. 
+        
+        seg_aend = [0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]
+
+        for i in range(len(seg_aend)):  
+            if (pcm_val < seg_aend[i]):
+                break
+        
+        seg = i
+        
+        # Combine the sign, segment, and quantization bits. 
+        if (pcm_val > seg_aend[7]): # out of range, return maximum value. 
+            ret = 0x7F ^ mask
+        else:
+            aval = seg << 4
+            if (seg < 2):
+                aval = aval | ((pcm_val >> 1) & 0xF);
+            else:
+                aval = aval | ((pcm_val >> seg) & 0xF)
+            
+            ret = aval ^ mask
+            
+        return ret
+    
+    def Alaw2linear(self, a_val):
+        a_val = a_val ^ 0x55
+        
+        t = (a_val & 0xF) << 4
+        seg = ((a_val & 0x70) >> 4) & 0xF
+        
+        if (seg == 0):
+            t = t + 8
+        elif (seg == 1):
+            t = t + 0x108
+        else:
+            t = t + 0x108;
+            t = t << (seg - 1)
+        
+        if (a_val & 0x80):
+            ret = t
+        else:
+            ret = -t
+        return ret
+    
+    
+    def linear2Mulaw (self, pcm_val):
+        # Get the sign and the magnitude of the value. 
+        pcm_val = pcm_val // 4
+        if (pcm_val < 0):
+            pcm_val = -pcm_val
+            mask = 0x7F
+        else:
+            mask = 0xFF
+        
+        if ( pcm_val > _wave_file._CLIP ):
+            pcm_val = _wave_file._CLIP;     # clip the magnitude
+        
+        pcm_val = pcm_val + (_wave_file._BIAS // 4)
+
+        seg_uend = [0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]
+
+        # Convert the scaled magnitude to segment number.
+        for i in range(len(seg_uend)):  
+            if (pcm_val < seg_uend[i]):
+                break
+        
+        seg = i
+        
+        # Combine the sign, segment, quantization bits;
+        # and complement the code word.
+
+        if (pcm_val > seg_uend[7]): # out of range, return maximum value. 
+            ret = (0x7F ^ mask)
+            return ret
+        else:
+            uval = (seg << 4) | ((pcm_val >> (seg + 1)) & 0xF)
+            return (uval ^ mask)
+
+    
+    def Mulaw2linear(self, u_val):
+    
+   #     print ("u_val = ", u_val)
+        # Complement to obtain normal u-law value
+        u_val = ~u_val
+
+        # Extract and bias the quantization bits. Then
+        # shift up by the segment number and subtract out the bias.
+        
+        t = ((u_val & 0xF) << 3) + _wave_file._BIAS
+        t = t << ((u_val & 0x70) >> 4)
+
+        if (u_val & 0x80):
+            ret = _wave_file._BIAS - t
+        else:
+            ret = t - _wave_file._BIAS
+   #     print ("ret = ", ret)    
+        return (ret)
+
+    
+    #========================================================================
+    # WAV header layout
+    #------------------------------------------------------------------------
+    # Remarks: RIFF header and fmt chunk are unpacked in one go, the other
+    #   chunk headers with _CHUNK_HEADER
+    #========================================================================
+    
+    # chunk_ID, chunk_size, format, subchunk1_ID, subchunk1_size,
+    # audio_format, num_of_channels, sample_rate, byte_rate, block_align,
+    # bits_per_sample
+    _RIFF_FMT_HEADER = struct.Struct("<4sI4s4sIHHIIHH")
+    
+    WAVE_FORMAT_PCM = 1
+    WAVE_FORMAT_MULAW = 7
+    
+    _CHUNK_HEADER = struct.Struct("<4sI")
+    
+    #========================================================================
+    # _samples_from_bytes
+    #------------------------------------------------------------------------
+    # Remarks: 16 bit samples are signed, 8 bit samples are returned as is
+    #   (unsigned), other sizes are assembled as unsigned little endian
+    #========================================================================
+    
+    def _samples_from_bytes (self, data, bits_per_sample, block_align):
+        if ((bits_per_sample == 16) and (block_align == 2)):
+            samples = array('h')
+            samples.frombytes (data[0 : len(data) & ~1])
+            if (sys.byteorder != "little"):
+                samples.byteswap()
+            return samples
+        elif ((bits_per_sample == 8) and (block_align == 1)):
+            return array('B', data)
+        else:
+            view = memoryview(data)
+            return [int.from_bytes(view[i : i + block_align], "little")
+                    for i in range (0, len(view) - block_align + 1, block_align)]
+    
+    def _data_extract(self, verbose = 1):
+
+        try:
+            bytes = open(self.file_name, "rb").read()
+        except OSError:
+            raise M10FormatError ("{0} file open fail!".format(self.file_name))
+        
+        if (len(bytes) < _wave_file._RIFF_FMT_HEADER.size):
+            raise M10FormatError ("NOT RIFF format! {0}".format(bytes[0:4]))
+        
+        (chunk_ID, chunk_size, format, subchunk1_ID, subchunk1_size,
+         audio_format, num_of_channels, sample_rate, byte_rate, block_align,
+         bits_per_sample) = _wave_file._RIFF_FMT_HEADER.unpack_from (bytes)
+        
+        chunk_ID = chunk_ID.upper()
+        format = format.upper()
+        subchunk1_ID = subchunk1_ID.lower()
+   
+        if (chunk_ID != b'RIFF') :
+            raise M10FormatError ("NOT RIFF format! {0}".format(chunk_ID))
+
+        if (format != b'WAVE') :
+            raise M10FormatError ("NOT WAVE format!")
+
+        if (subchunk1_ID != b"fmt ") :
+            raise M10FormatError ("unknown subchunk1 ID : {0}".format(subchunk1_ID))
+        
+        if (num_of_channels > 1) :
+            raise M10FormatError ("More than one channel!")
+        
+        if (block_align == 0) :
+            raise M10FormatError ("block_align is 0!")
+        
+        if (verbose):
+            print ("subchunk_ID ", subchunk1_ID)     
+            print ("\nAudio Format is {0:d}, (1 = PCM)".format(audio_format))
+            print ("\nnumer of channels = {0:d}".format(num_of_channels))
+            print ("sample_rate = ", sample_rate)
+            print ("bits_per_sample = ", bits_per_sample)
+            print ("block_align = ", block_align)
+        
+        subchunk_start = 20 + subchunk1_size
+        
+        while(1):
+            if (subchunk_start + _wave_file._CHUNK_HEADER.size > len(bytes)):
+                raise M10FormatError ("no data subchunk!")
+            
+            subchunk_ID, subchunk_size = _wave_file._CHUNK_HEADER.unpack_from (bytes, subchunk_start)
+            subchunk_ID = subchunk_ID.lower()
+            
+            if (verbose):
+                print ("subchunk_ID ", subchunk_ID)
+            
+            if (subchunk_ID == b'data'):
+                break
+                
+            subchunk_start = subchunk_start + 8 + subchunk_size
+        
+        num_of_samples = int(subchunk_size / block_align)
+
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self.bits_per_sample = bits_per_sample
+        self.block_align = block_align
+        
+        if (verbose):
+            print ("num_of_samples = ", num_of_samples)
+            print ("time span = ", num_of_samples / sample_rate, " seconds")
+            print ("subchunk_start = ", subchunk_start)
+        
+        data_start = subchunk_start + 8
+        data = memoryview(bytes)[data_start : data_start + num_of_samples * block_align]
+        
+        if ((audio_format == _wave_file.WAVE_FORMAT_MULAW) and (block_align == 1)):
+            self.bits_per_sample = 16
+            return self.mulaw_decode (data)
+            
+        return self._samples_from_bytes (data, bits_per_sample, block_align)
+    
+    #========================================================================
+    # mulaw_encode / mulaw_decode
+    #------------------------------------------------------------------------
+    # Remarks: whole buffer versions of linear2Mulaw / Mulaw2linear, through
+    #   the tables of M10Tables.py (see make_tables.py), or tables built
+    #   from linear2Mulaw / Mulaw2linear when that has not been generated.
+    #   The encoder looks each sample up, as unsigned 16 bit, in a 65536
+    #   entry table made on first use by spreading each of the 16384 codes
+    #   of M10Tables over the 4 samples it covers
+    #========================================================================
+    
+    _mulaw_table = None
+    _mulaw_encode_table = None
+    
+    def _mulaw_tables (self):
+        if (_wave_file._mulaw_table is None):
+            if (M10Tables is None):
+                codes = bytes(self.linear2Mulaw ((i - 8192) * 4) for i in range (16384))
+                decode = [self.Mulaw2linear(i) for i in range(256)]
+            else:
+                codes = M10Tables.MULAW_ENCODE
+                decode = M10Tables.MULAW_DECODE
+            
+            table = bytearray(65536)
+            for i in range (4):
+                table[i : 32768 : 4] = codes[8192 : 16384]
+                table[32768 + i : 65536 : 4] = codes[0 : 8192]
+            
+            _wave_file._mulaw_encode_table = bytes(table)
+            _wave_file._mulaw_table = decode
+        
+        return _wave_file._mulaw_encode_table, _wave_file._mulaw_table
+    
+    def mulaw_encode (self, sample_list):
+        encode_table, decode_table = self._mulaw_tables()
+        
+        if ((not isinstance(sample_list, array)) or (sample_list.typecode != 'h')):
+            sample_list = array('h', [max(-32768, min(32767, int(i))) for i in sample_list])
+        
+        return bytes(map(encode_table.__getitem__, memoryview(sample_list).cast('B').cast('H')))
+    
+    def mulaw_decode (self, data):
+        encode_table, decode_table = self._mulaw_tables()
+        
+        return array('h', map(decode_table.__getitem__, data))
+        
+    #========================================================================
+    # ima_adpcm_encode / ima_adpcm_decode
+    #------------------------------------------------------------------------
+    # Remarks: 4 bit IMA ADPCM, two samples per byte, first sample in the
+    #   low nibble. The whole buffer is one block: predictor and step index
+    #   start at 0 and are never reset.
+    #   ADPCM is sequential by nature, so instead of vectorizing, the
+    #   decoder works from an 89 x 16 table of (signed difference, next
+    #   step index), from M10Tables.py or built on first use; the encoder
+    #   uses the same table once the nibble is known, so both sides agree
+    #   bit for bit.
+    #========================================================================
+    
+    _IMA_INDEX_TABLE = [-1, -1, -1, -1, 2, 4, 6, 8,
+                        -1, -1, -1, -1, 2, 4, 6, 8]
+    
+    _IMA_STEP_TABLE = [
+        7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37,
+        41, 45, 50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173,
+        190, 209, 230, 253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658,
+        724, 796, 876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+        2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358, 5894,
+        6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899, 15289,
+        16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767]
+    
+    _ima_delta = None
+    _ima_next_index = None
+    
+    def _ima_tables (self):
+        if ((_wave_file._ima_delta is None) and (M10Tables is not None)):
+            _wave_file._ima_next_index = M10Tables.IMA_NEXT_INDEX
+            _wave_file._ima_delta = M10Tables.IMA_DELTA
+        
+        if (_wave_file._ima_delta is None):
+            delta = []
+            next_index = []
+            
+            for index, step in enumerate (_wave_file._IMA_STEP_TABLE):
+                for nibble in range (16):
+                    diff = step >> 3
+                    if (nibble & 4):
+                        diff = diff + step
+                    if (nibble & 2):
+                        diff = diff + (step >> 1)
+                    if (nibble & 1):
+                        diff = diff + (step >> 2)
+                    if (nibble & 8):
+                        diff = -diff
+                    
+                    delta.append (diff)
+                    next_index.append (max(0, min(88, index + _wave_file._IMA_INDEX_TABLE[nibble])))
+            
+            _wave_file._ima_next_index = next_index
+            _wave_file._ima_delta = delta
+        
+        return _wave_file._ima_delta, _wave_file._ima_next_index
+    
+    def ima_adpcm_encode (self, sample_list):
+        delta, next_index = self._ima_tables()
+        step_table = _wave_file._IMA_STEP_TABLE
+        
+        out = bytearray((len(sample_list) + 1) // 2)
+        predictor = 0
+        index = 0
+        
+        for i, sample in enumerate (sample_list):
+            step = step_table[index]
+            diff = sample - predictor
+            
+            if (diff < 0):
+                nibble = 8
+                diff = -diff
+            else:
+                nibble = 0
+            
+            if (diff >= step):
+                nibble = nibble | 4
+                diff = diff - step
+            step = step >> 1
+            if (diff >= step):
+                nibble = nibble | 2
+                diff = diff - step
+            step = step >> 1
+            if (diff >= step):
+                nibble = nibble | 1
+            
+            t = index * 16 + nibble
+            predictor = predictor + delta[t]
+            if (predictor > 32767):
+                predictor = 32767
+            elif (predictor < -32768):
+                predictor = -32768
+            index = next_index[t]
+            
+            if (i & 1):
+                out[i >> 1] = out[i >> 1] | (nibble << 4)
+            else:
+                out[i >> 1] = nibble
+        
+        return bytes(out)
+    
+    def ima_adpcm_decode (self, data, num_of_samples = None):
+        delta, next_index = self._ima_tables()
+        
+        if (num_of_samples is None):
+            num_of_samples = len(data) * 2
+        
+        out = array('h', bytes(2 * num_of_samples))
+        predictor = 0
+        index = 0
+        
+        for i in range (num_of_samples):
+            nibble = data[i >> 1]
+            if (i & 1):
+                nibble = nibble >> 4
+            else:
+                nibble = nibble & 0xF
+            
+            t = index * 16 + nibble
+            predictor = predictor + delta[t]
+            if (predictor > 32767):
+                predictor = 32767
+            elif (predictor < -32768):
+                predictor = -32768
+            index = next_index[t]
+            
+            out[i] = predictor
+        
+        return out
+        
+    #========================================================================
+    # sample_save_16bit
+    #------------------------------------------------------------------------
+    # Remarks: data_bytes is little endian 16 bit PCM, either a list of
+    #   byte values or any bytes-like object. The chunk sizes in the header
+    #   match the data, so nothing is padded
+    #========================================================================
+    
+    def sample_save_16bit(self, data_bytes):
+        if (not isinstance(data_bytes, (bytes, bytearray, memoryview))):
+            data_bytes = bytes(data_bytes)
+        
+        fmt = struct.pack ("<HHIIHH", _wave_file.WAVE_FORMAT_PCM, 1, 8000, 16000, 2, 16)
+        
+        chunk_size = 4 + (8 + len(fmt)) + (8 + len(data_bytes))
+        
+        with open(self.file_name, "wb") as f:
+            f.write (b"RIFF" + struct.pack ("<I", chunk_size) + b"WAVE")
+            f.write (_wave_file._CHUNK_HEADER.pack (b"fmt ", len(fmt)) + fmt)
+            f.write (_wave_file._CHUNK_HEADER.pack (b"data", len(data_bytes)))
+            f.write (data_bytes)
+        
+    #========================================================================
+    # sample_save_pcm
+    #------------------------------------------------------------------------
+    # Remarks: save an array('h') of samples, see sample_save_16bit
+    #========================================================================
+    
+    def sample_save_pcm(self, samples):
+        if (sys.byteorder != "little"):
+            samples = array('h', samples)
+            samples.byteswap()
+            
+        self.sample_save_16bit (memoryview(samples).cast('B'))
+        
+    #========================================================================
+    # sample_save_mulaw
+    #------------------------------------------------------------------------
+    # Remarks: save mu-law bytes as an 8kHz G.711 WAV file, no padding
+    #========================================================================
+    
+    def sample_save_mulaw(self, data_bytes):
+        fmt = struct.pack ("<HHIIHHH", _wave_file.WAVE_FORMAT_MULAW, 1, 8000, 8000, 1, 8, 0)
+        fact = struct.pack ("<I", len(data_bytes))
+        
+        chunk_size = 4 + (8 + len(fmt)) + (8 + len(fact)) + (8 + len(data_bytes))
+        
+        with open(self.file_name, "wb") as f:
+            f.write (b"RIFF" + struct.pack ("<I", chunk_size) + b"WAVE")
+            f.write (_wave_file._CHUNK_HEADER.pack (b"fmt ", len(fmt)) + fmt)
+            f.write (_wave_file._CHUNK_HEADER.pack (b"fact", len(fact)) + fact)
+            f.write (_wave_file._CHUNK_HEADER.pack (b"data", len(data_bytes)))
+            f.write (data_bytes)
+            
+            if (len(data_bytes) & 1):
+                f.write (b"\x00")
+    
+    #========================================================================
+    # to_linear16
+    #------------------------------------------------------------------------
+    # Remarks: 8 bit WAV samples are unsigned, scale them to signed 16 bit.
+    #   Wider samples (as returned by _data_extract) are made signed and
+    #   cut down to their top 16 bits
+    #========================================================================
+    
+    def to_linear16 (self, samples, bits_per_sample):
+        if (bits_per_sample == 8):
+            return array('h', [(i - 128) << 8 for i in samples])
+        elif (bits_per_sample > 16):
+            sign = 1 << (bits_per_sample - 1)
+            shift = bits_per_sample - 16
+            return array('h', [((i ^ sign) - sign) >> shift for i in samples])
+        
+        return samples
+    
+    #========================================================================
+    # resample
+    #------------------------------------------------------------------------
+    # Remarks: convert the sample rate. When the rate goes down, each output
+    #   sample is the average of the input samples in its period (a box
+    #   filter against aliasing, through a running sum). When it goes up,
+    #   samples are linearly interpolated.
+    #========================================================================
+    
+    def resample (self, samples, rate_in, rate_out = 8000):
+        if ((rate_in == rate_out) or (len(samples) == 0)):
+            return array('h', samples)
+        
+        ratio = rate_in / rate_out
+        num_in = len(samples)
+        num_out = int(num_in / ratio)
+        
+        if (ratio > 1):
+            running_sum = [0]
+            running_sum.extend (accumulate (samples))
+            
+            bounds = [min(int(i * ratio), num_in) for i in range (num_out + 1)]
+            out = [(running_sum[end] - running_sum[begin]) // (end - begin)
+                   for begin, end in zip (bounds, bounds[1:]) if end > begin]
+        else:
+            last = num_in - 1
+            out = []
+            for i in range (num_out):
+                pos = i * ratio
+                j = int(pos)
+                if (j >= last):
+                    out.append (samples[last])
+                else:
+                    out.append (int(round(samples[j] + (samples[j + 1] - samples[j]) * (pos - j))))
+        
+        return array('h', [max(-32768, min(32767, i)) for i in out])
+        
+    def __init__ (self, file_name=""):
+        self.file_name = file_name